@@ -0,0 +1,54 @@
+import argparse
+import time
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Measure the throughput of the Monte Carlo availability simulation, serially and across the process pool."
+    )
+    parser.add_argument("--missions", type=int, default=1_000_000)
+    parser.add_argument("--organs", type=int, default=7)
+    parser.add_argument("--years", type=float, default=1.0)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    from tableau_de_bord_de_suivi_gpta.analytics.simulation import (
+        HOURS_PER_YEAR,
+        SIMULATION_WORKERS,
+        simulate_availability,
+    )
+
+    models = [
+        {
+            "name": f"Organe {i}",
+            "shape": 1.2 + 0.1 * i,
+            "scale": 1500.0 + 250.0 * i,
+            "mttr": 8.0 + 4.0 * i,
+        }
+        for i in range(args.organs)
+    ]
+    horizon = args.years * HOURS_PER_YEAR
+    print(
+        f"missions: {args.missions}, organes: {args.organs}, processus: {SIMULATION_WORKERS}"
+    )
+    simulate_availability(models, 2, horizon, args.seed)
+    for label, parallel in (("série", False), ("parallèle", True)):
+        start = time.perf_counter()
+        result = simulate_availability(
+            models,
+            args.missions,
+            horizon,
+            args.seed,
+            parallel=parallel,
+        )
+        elapsed = time.perf_counter() - start
+        print(
+            f"{label:<10}{elapsed:8.2f} s"
+            f"{args.missions / elapsed:14.0f} missions/s"
+            f"   disponibilité {result['availability']:.5f}"
+            f" [{result['availability_low']:.5f}, {result['availability_high']:.5f}]"
+        )
+
+
+if __name__ == "__main__":
+    main()
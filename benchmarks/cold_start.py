@@ -0,0 +1,203 @@
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Dict, List
+
+REGRESSION_TOLERANCE = 0.25
+TIME_NOISE_FLOOR = 0.05
+ANALYTICS_MODULES = [
+    "tableau_de_bord_de_suivi_gpta.analytics.fleet_engine",
+    "tableau_de_bord_de_suivi_gpta.analytics.weibull",
+    "tableau_de_bord_de_suivi_gpta.analytics.maintenance",
+    "tableau_de_bord_de_suivi_gpta.analytics.rbd",
+    "tableau_de_bord_de_suivi_gpta.analytics.simulation",
+]
+
+Timings = Dict[str, float]
+
+
+def elapsed(operation) -> float:
+    start = time.perf_counter()
+    operation()
+    return time.perf_counter() - start
+
+
+def measure_analytics() -> Timings:
+    import importlib
+
+    return {
+        "import des moteurs d'analyse": elapsed(
+            lambda: [
+                importlib.import_module(name)
+                for name in ANALYTICS_MODULES
+            ]
+        ),
+        "pandas chargé": float("pandas" in sys.modules),
+    }
+
+
+def measure_app() -> Timings:
+    import importlib
+
+    timings = {
+        "import de reflex": elapsed(
+            lambda: importlib.import_module("reflex")
+        ),
+        "import de l'application": elapsed(
+            lambda: importlib.import_module(
+                "tableau_de_bord_de_suivi_gpta.tableau_de_bord_de_suivi_gpta"
+            )
+        ),
+    }
+    from tableau_de_bord_de_suivi_gpta.states.gpta_state import (
+        GptaState,
+    )
+
+    def first_event():
+        state = GptaState(_reflex_internal_init=True)
+        GptaState.event_handlers["update_all_organ_metrics"].fn(state)
+        state.get_delta()
+
+    timings["premier événement traité"] = elapsed(first_event)
+    timings["total"] = sum(timings.values())
+    return timings
+
+
+def run_worker(mode: str, database: str) -> Timings:
+    with tempfile.NamedTemporaryFile(suffix=".json") as output:
+        subprocess.run(
+            [
+                sys.executable,
+                "-m",
+                "benchmarks.cold_start",
+                "--worker",
+                mode,
+                "--output",
+                output.name,
+            ],
+            check=True,
+            env={**os.environ, "DB_URL": database},
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+        with open(output.name, encoding="utf-8") as worker_output:
+            return json.load(worker_output)
+
+
+def median_timings(runs: List[Timings]) -> Timings:
+    return {
+        label: statistics.median(run[label] for run in runs)
+        for label in runs[0]
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Measure cold-start import time of the dashboard and the time until its first event is handled."
+    )
+    parser.add_argument("--organs", type=int, default=2000)
+    parser.add_argument("--logs", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--baseline")
+    parser.add_argument("--save-baseline")
+    parser.add_argument(
+        "--tolerance", type=float, default=REGRESSION_TOLERANCE
+    )
+    parser.add_argument("--worker", choices=["analytics", "app"])
+    parser.add_argument("--output")
+    args = parser.parse_args()
+
+    if args.worker:
+        results = (
+            measure_app()
+            if args.worker == "app"
+            else measure_analytics()
+        )
+        with open(args.output, "w", encoding="utf-8") as output:
+            json.dump(results, output)
+        return
+
+    database = "sqlite:///" + os.path.join(
+        tempfile.mkdtemp(), "cold_start.db"
+    )
+    subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "from benchmarks.synthetic import populate_database; "
+            f"populate_database({args.organs}, {args.logs}, {args.seed})",
+        ],
+        check=True,
+        env={**os.environ, "DB_URL": database},
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    run_worker("app", database)
+    results = median_timings(
+        [run_worker("analytics", database) for _ in range(args.repeat)]
+    )
+    results.update(
+        median_timings(
+            [run_worker("app", database) for _ in range(args.repeat)]
+        )
+    )
+
+    baseline: Timings = {}
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as stored:
+            baseline = json.load(stored)["timings"]
+    flagged = [
+        label
+        for label, seconds in results.items()
+        if label in baseline
+        and label != "pandas chargé"
+        and seconds > baseline[label] * (1 + args.tolerance)
+        and seconds - baseline[label] > TIME_NOISE_FLOOR
+    ]
+
+    print(f"organes: {args.organs}, relevés: {args.logs}")
+    print(f"{'étape':<36}{'médiane (ms)':>14}{'référence':>12}")
+    for label, seconds in results.items():
+        if label == "pandas chargé":
+            print(
+                f"{'pandas chargé par les moteurs':<36}"
+                f"{'oui' if seconds else 'non':>14}"
+            )
+            continue
+        reference = baseline.get(label)
+        print(
+            f"{label:<36}{seconds * 1000:>14.1f}"
+            + (
+                f"{reference * 1000:>12.1f}"
+                if reference is not None
+                else f"{'':>12}"
+            )
+            + ("  RÉGRESSION" if label in flagged else "")
+        )
+
+    if args.save_baseline:
+        with open(args.save_baseline, "w", encoding="utf-8") as stored:
+            json.dump(
+                {
+                    "organs": args.organs,
+                    "logs": args.logs,
+                    "timings": results,
+                },
+                stored,
+                indent=2,
+                ensure_ascii=False,
+            )
+        print(f"\nréférence enregistrée dans {args.save_baseline}")
+    if flagged:
+        print(f"\n{len(flagged)} régression(s) détectée(s)")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
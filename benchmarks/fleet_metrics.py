@@ -0,0 +1,149 @@
+import argparse
+import math
+import time
+
+import numpy as np
+
+from tableau_de_bord_de_suivi_gpta.analytics.aggregates import (
+    build_aggregate_index,
+)
+from tableau_de_bord_de_suivi_gpta.analytics.fleet_engine import (
+    aggregate_columns,
+    compute_fleet_metrics,
+)
+
+
+def synthetic_logs(num_organs: int, num_logs: int, seed: int):
+    rng = np.random.default_rng(seed)
+    organs = rng.integers(0, num_organs, num_logs).tolist()
+    uptimes = rng.uniform(100.0, 5000.0, num_logs).tolist()
+    repairs = rng.uniform(1.0, 48.0, num_logs).tolist()
+    return [
+        {
+            "organ_name": f"Organe {organ}",
+            "uptime_since_last_failure": uptime,
+            "repair_duration": repair,
+        }
+        for organ, uptime, repair in zip(organs, uptimes, repairs)
+    ]
+
+
+def baseline_organ_metrics(logs, organ_name, t, threshold):
+    relevant_logs = [
+        log for log in logs if log["organ_name"] == organ_name
+    ]
+    mtbf = mttr = lambda_val = reliability_at_t = None
+    availability = preventive_maintenance_period = None
+    if relevant_logs:
+        num_failures = len(relevant_logs)
+        mtbf = (
+            sum(log["uptime_since_last_failure"] for log in relevant_logs)
+            / num_failures
+        )
+        mttr = (
+            sum(log["repair_duration"] for log in relevant_logs)
+            / num_failures
+        )
+        if mtbf > 0:
+            lambda_val = 1 / mtbf
+            reliability_at_t = math.exp(-lambda_val * t)
+            if threshold > 0:
+                clamped_r = max(1e-06, min(0.999999, threshold))
+                preventive_maintenance_period = (
+                    -math.log(clamped_r) / lambda_val
+                )
+        if mtbf + mttr > 0:
+            availability = mtbf / (mtbf + mttr)
+    return {
+        "name": organ_name,
+        "mtbf": mtbf,
+        "mttr": mttr,
+        "lambda_val": lambda_val,
+        "reliability_at_t": reliability_at_t,
+        "availability": availability,
+        "preventive_maintenance_period": preventive_maintenance_period,
+    }
+
+
+def baseline_pass(logs, organ_names, t, threshold):
+    return [
+        baseline_organ_metrics(logs, name, t, threshold)
+        for name in organ_names
+    ]
+
+
+def engine_pass(logs, organ_names, t, threshold):
+    return recompute_pass(
+        build_aggregate_index(logs), organ_names, t, threshold
+    )
+
+
+def recompute_pass(index, organ_names, t, threshold):
+    return compute_fleet_metrics(
+        organ_names,
+        *aggregate_columns(index, organ_names),
+        t,
+        threshold,
+    )
+
+
+def best_of(repeat, fn, *args):
+    best = float("inf")
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn(*args)
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Compare the original per-organ scan of the failure logs with the fleet engine."
+    )
+    parser.add_argument("--organs", type=int, default=500)
+    parser.add_argument("--logs", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+    organ_names = [f"Organe {i}" for i in range(args.organs)]
+    logs = synthetic_logs(args.organs, args.logs, args.seed)
+    baseline_time, baseline_result = best_of(
+        args.repeat, baseline_pass, logs, organ_names, 1000.0, 0.95
+    )
+    engine_time, engine_result = best_of(
+        args.repeat, engine_pass, logs, organ_names, 1000.0, 0.95
+    )
+    recompute_time, _ = best_of(
+        args.repeat,
+        recompute_pass,
+        build_aggregate_index(logs),
+        organ_names,
+        1000.0,
+        0.95,
+    )
+    max_diff = max(
+        (
+            abs(a[key] - b[key]) / abs(a[key])
+            for a, b in zip(baseline_result, engine_result)
+            for key in (
+                "mtbf",
+                "mttr",
+                "reliability_at_t",
+                "availability",
+                "preventive_maintenance_period",
+            )
+            if a[key]
+        ),
+        default=0.0,
+    )
+    print(f"organes: {args.organs}, relevés: {args.logs}")
+    print(f"parcours par organe:     {baseline_time * 1000:10.1f} ms")
+    print(f"moteur (depuis relevés): {engine_time * 1000:10.1f} ms")
+    print(f"moteur (index tenu):     {recompute_time * 1000:10.1f} ms")
+    print(f"accélération: x{baseline_time / engine_time:.1f}")
+    print(f"écart relatif max: {max_diff:.2e}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,333 @@
+import argparse
+import asyncio
+import inspect
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from typing import Callable, Dict, List, Tuple
+
+DEFAULT_FLEETS = ["10:1000", "1000:100000"]
+REGRESSION_TOLERANCE = 0.25
+TIME_NOISE_FLOOR = 0.002
+MEMORY_NOISE_FLOOR = 256 * 1024
+
+Measurement = Dict[str, float]
+FleetResults = Dict[str, Measurement]
+
+
+def parse_fleet(value: str) -> Tuple[int, int]:
+    try:
+        organs, logs = (int(part) for part in value.split(":"))
+    except ValueError:
+        raise argparse.ArgumentTypeError(
+            f"flotte invalide: {value!r} (attendu ORGANES:RELEVÉS)"
+        )
+    if organs < 1 or logs < 0:
+        raise argparse.ArgumentTypeError(
+            f"flotte invalide: {value!r}"
+        )
+    return organs, logs
+
+
+def fleet_key(organs: int, logs: int) -> str:
+    return f"{organs}x{logs}"
+
+
+def run_event(state, name: str, *args) -> None:
+    result = type(state).event_handlers[name].fn(state, *args)
+    if result is None:
+        return
+    follow_ups = (
+        list(result) if inspect.isgenerator(result) else [result]
+    )
+    for follow_up in follow_ups:
+        handler_name = getattr(
+            getattr(follow_up, "fn", None), "__name__", None
+        )
+        if handler_name in type(state).event_handlers:
+            run_event(state, handler_name)
+
+
+def measure(
+    setup: Callable[[], object],
+    operation: Callable[[object], object],
+    repeat: int,
+) -> Measurement:
+    timings = []
+    for _ in range(repeat):
+        context = setup()
+        start = time.perf_counter()
+        operation(context)
+        timings.append(time.perf_counter() - start)
+    context = setup()
+    tracemalloc.start()
+    operation(context)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {"seconds": min(timings), "peak_bytes": float(peak)}
+
+
+def run_fleet(
+    organs: int, logs: int, repeat: int, seed: int
+) -> FleetResults:
+    os.environ["DB_URL"] = "sqlite:///" + os.path.join(
+        tempfile.mkdtemp(), "hot_paths.db"
+    )
+    from benchmarks.synthetic import (
+        populate_database,
+        synthetic_organ_names,
+    )
+
+    populate_database(organs, logs, seed)
+    selected, *compared = synthetic_organ_names(organs)[:3]
+
+    from tableau_de_bord_de_suivi_gpta.api.exports import (
+        export_organ_csv,
+    )
+    from tableau_de_bord_de_suivi_gpta.db.fleet_store import (
+        FleetStore,
+    )
+    from tableau_de_bord_de_suivi_gpta.states import gpta_state
+    from tableau_de_bord_de_suivi_gpta.states.gpta_state import (
+        GptaState,
+    )
+
+    def cold():
+        gpta_state.metrics_cache.clear()
+        gpta_state.get_weibull_fits().clear()
+        gpta_state.fleet_store = FleetStore(
+            gpta_state.metrics_cache
+        )
+        return GptaState(_reflex_internal_init=True)
+
+    def fresh_session():
+        return GptaState(_reflex_internal_init=True)
+
+    def loaded_session():
+        state = fresh_session()
+        run_event(state, "update_all_organ_metrics")
+        run_event(state, "set_selected_organ", selected)
+        return state
+
+    def comparing_session():
+        gpta_state.get_weibull_fits().clear()
+        state = loaded_session()
+        for name in compared:
+            run_event(state, "toggle_compared_organ", name)
+        return state
+
+    target_uptimes = iter(range(1001, 10**9))
+
+    def change_target_uptime(state):
+        run_event(
+            state, "set_target_uptime_t", str(next(target_uptimes))
+        )
+
+    def computed(name: str):
+        fget = GptaState.computed_vars[name].fget
+        return lambda state: fget(state)
+
+    async def drain(response) -> int:
+        size = 0
+        async for chunk in response.body_iterator:
+            size += len(chunk)
+        return size
+
+    def export_csv(_):
+        asyncio.run(drain(export_organ_csv(name=selected)))
+
+    cases = [
+        (
+            "update_all_organ_metrics (à froid)",
+            cold,
+            lambda state: run_event(
+                state, "update_all_organ_metrics"
+            ),
+        ),
+        (
+            "update_all_organ_metrics (à chaud)",
+            fresh_session,
+            lambda state: run_event(
+                state, "update_all_organ_metrics"
+            ),
+        ),
+        (
+            "changement de t",
+            loaded_session,
+            change_target_uptime,
+        ),
+        (
+            "pareto_chart_data",
+            loaded_session,
+            computed("pareto_chart_data"),
+        ),
+        (
+            "reliability_curve_data_selected_organ",
+            comparing_session,
+            computed("reliability_curve_data_selected_organ"),
+        ),
+        (
+            "historique (première page)",
+            fresh_session,
+            lambda state: run_event(
+                state, "set_selected_organ", selected
+            ),
+        ),
+        (
+            "historique (page suivante)",
+            loaded_session,
+            lambda state: run_event(state, "next_history_page"),
+        ),
+        ("export CSV d'un organe", lambda: None, export_csv),
+    ]
+    cold()
+    return {
+        label: measure(setup, operation, repeat)
+        for label, setup, operation in cases
+    }
+
+
+def regressions(
+    results: Dict[str, FleetResults],
+    baseline: Dict[str, FleetResults],
+    tolerance: float,
+) -> Dict[Tuple[str, str], List[str]]:
+    flagged: Dict[Tuple[str, str], List[str]] = {}
+    for fleet, measurements in results.items():
+        for label, current in measurements.items():
+            reference = baseline.get(fleet, {}).get(label)
+            if reference is None:
+                continue
+            reasons = []
+            for field, floor in (
+                ("seconds", TIME_NOISE_FLOOR),
+                ("peak_bytes", MEMORY_NOISE_FLOOR),
+            ):
+                if (
+                    current[field] > reference[field] * (1 + tolerance)
+                    and current[field] - reference[field] > floor
+                ):
+                    reasons.append(field)
+            if reasons:
+                flagged[(fleet, label)] = reasons
+    return flagged
+
+
+def relative_change(current: float, reference: float) -> str:
+    if not reference:
+        return ""
+    return f"{(current / reference - 1) * 100:+.0f}%"
+
+
+def print_results(
+    results: Dict[str, FleetResults],
+    baseline: Dict[str, FleetResults],
+    flagged: Dict[Tuple[str, str], List[str]],
+) -> None:
+    for fleet, measurements in results.items():
+        organs, logs = fleet.split("x")
+        print(f"\nflotte: {organs} organes, {logs} relevés")
+        print(
+            f"{'opération':<40}{'temps (ms)':>12}{'Δ':>7}"
+            f"{'pic (Kio)':>12}{'Δ':>7}"
+        )
+        for label, current in measurements.items():
+            reference = baseline.get(fleet, {}).get(label, {})
+            print(
+                f"{label:<40}"
+                f"{current['seconds'] * 1000:>12.2f}"
+                f"{relative_change(current['seconds'], reference.get('seconds', 0)):>7}"
+                f"{current['peak_bytes'] / 1024:>12.1f}"
+                f"{relative_change(current['peak_bytes'], reference.get('peak_bytes', 0)):>7}"
+                + ("  RÉGRESSION" if (fleet, label) in flagged else "")
+            )
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Benchmark the GptaState hot paths on seeded synthetic fleets and compare them with a stored baseline."
+    )
+    parser.add_argument(
+        "--fleet",
+        type=parse_fleet,
+        action="append",
+        help="ORGANES:RELEVÉS, répétable (par défaut: "
+        + ", ".join(DEFAULT_FLEETS)
+        + ")",
+    )
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--baseline")
+    parser.add_argument("--save-baseline")
+    parser.add_argument(
+        "--tolerance", type=float, default=REGRESSION_TOLERANCE
+    )
+    parser.add_argument("--worker", type=parse_fleet)
+    parser.add_argument("--output")
+    args = parser.parse_args()
+
+    if args.worker:
+        results = run_fleet(*args.worker, args.repeat, args.seed)
+        with open(args.output, "w", encoding="utf-8") as output:
+            json.dump(results, output)
+        return
+
+    fleets = args.fleet or [
+        parse_fleet(value) for value in DEFAULT_FLEETS
+    ]
+    results: Dict[str, FleetResults] = {}
+    for organs, logs in fleets:
+        with tempfile.NamedTemporaryFile(suffix=".json") as output:
+            subprocess.run(
+                [
+                    sys.executable,
+                    "-m",
+                    "benchmarks.hot_paths",
+                    "--worker",
+                    f"{organs}:{logs}",
+                    "--repeat",
+                    str(args.repeat),
+                    "--seed",
+                    str(args.seed),
+                    "--output",
+                    output.name,
+                ],
+                check=True,
+                stdout=subprocess.DEVNULL,
+            )
+            with open(output.name, encoding="utf-8") as worker_output:
+                results[fleet_key(organs, logs)] = json.load(
+                    worker_output
+                )
+
+    baseline: Dict[str, FleetResults] = {}
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as stored:
+            baseline = json.load(stored)["fleets"]
+    flagged = regressions(results, baseline, args.tolerance)
+    print_results(results, baseline, flagged)
+
+    if args.save_baseline:
+        with open(args.save_baseline, "w", encoding="utf-8") as stored:
+            json.dump(
+                {
+                    "repeat": args.repeat,
+                    "seed": args.seed,
+                    "fleets": results,
+                },
+                stored,
+                indent=2,
+                ensure_ascii=False,
+            )
+        print(f"\nréférence enregistrée dans {args.save_baseline}")
+    if flagged:
+        print(f"\n{len(flagged)} régression(s) détectée(s)")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
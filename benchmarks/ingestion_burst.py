@@ -0,0 +1,89 @@
+import argparse
+import os
+import statistics
+import tempfile
+import threading
+import time
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Fire concurrent batches at the failure-log ingestion endpoint and report throughput, latency and 429 backpressure."
+    )
+    parser.add_argument("--organs", type=int, default=200)
+    parser.add_argument("--clients", type=int, default=32)
+    parser.add_argument("--batches", type=int, default=4)
+    parser.add_argument("--batch-size", type=int, default=500)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+    os.environ["DB_URL"] = "sqlite:///" + os.path.join(
+        tempfile.mkdtemp(), "ingestion_burst.db"
+    )
+    from benchmarks.synthetic import populate_database
+
+    organ_names = populate_database(args.organs, 0, args.seed)
+
+    from fastapi import FastAPI
+    from fastapi.testclient import TestClient
+
+    from tableau_de_bord_de_suivi_gpta.api.ingestion import (
+        fleet_store,
+        router,
+    )
+
+    app = FastAPI()
+    app.include_router(router)
+    client = TestClient(app)
+    fleet_store.ensure_loaded()
+    batch = [
+        {
+            "organ_name": organ_names[index % len(organ_names)],
+            "failure_date": "2024-01-01",
+            "uptime_since_last_failure": 100.0 + index,
+            "repair_duration": 2.0,
+            "description": "CMMS",
+        }
+        for index in range(args.batch_size)
+    ]
+    latencies = []
+    statuses = []
+    lock = threading.Lock()
+
+    def send():
+        for _ in range(args.batches):
+            start = time.perf_counter()
+            response = client.post("/ingest/failure_logs", json=batch)
+            with lock:
+                statuses.append(response.status_code)
+                if response.status_code == 200:
+                    latencies.append(time.perf_counter() - start)
+
+    clients = [
+        threading.Thread(target=send) for _ in range(args.clients)
+    ]
+    start = time.perf_counter()
+    for thread in clients:
+        thread.start()
+    for thread in clients:
+        thread.join()
+    elapsed = time.perf_counter() - start
+    accepted = statuses.count(200)
+    print(
+        f"clients: {args.clients}, lots: {len(statuses)}, relevés par lot: {args.batch_size}"
+    )
+    print(f"lots acceptés:          {accepted:10d}")
+    print(f"lots refusés (429):     {statuses.count(429):10d}")
+    print(
+        f"débit:                  {accepted * args.batch_size / elapsed:10.0f} relevés/s"
+    )
+    if latencies:
+        print(
+            f"latence médiane:        {statistics.median(latencies) * 1000:10.1f} ms"
+        )
+        print(
+            f"latence max:            {max(latencies) * 1000:10.1f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+import argparse
+import os
+import tempfile
+import time
+
+
+def best_of(repeat: int, operation) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        operation()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Compare failure-log journal replay, with and without a snapshot, against a database aggregation."
+    )
+    parser.add_argument("--organs", type=int, default=2000)
+    parser.add_argument("--logs", type=int, default=200_000)
+    parser.add_argument("--tail", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+    os.environ["DB_URL"] = "sqlite:///" + os.path.join(
+        tempfile.mkdtemp(), "journal_replay.db"
+    )
+    from benchmarks.synthetic import populate_database
+
+    organ_names = populate_database(args.organs, args.logs, args.seed)
+
+    from tableau_de_bord_de_suivi_gpta.db.journal import (
+        FailureLogJournal,
+        get_failure_log_journal,
+    )
+    from tableau_de_bord_de_suivi_gpta.db.repository import (
+        load_organ_aggregates,
+    )
+
+    path = get_failure_log_journal().path
+    replay_interval = args.logs + args.tail + 1
+
+    def replay():
+        FailureLogJournal(path, replay_interval).state()
+
+    full_replay = best_of(args.repeat, replay)
+    journal_size = os.path.getsize(path)
+    FailureLogJournal(path).snapshot()
+    get_failure_log_journal().append_failure_logs(
+        [
+            {
+                "organ_name": organ_names[index % len(organ_names)],
+                "failure_date": "2024-01-01",
+                "uptime_since_last_failure": 100.0,
+                "repair_duration": 1.0,
+                "description": "",
+            }
+            for index in range(args.tail)
+        ]
+    )
+    snapshot_replay = best_of(args.repeat, replay)
+    database = best_of(args.repeat, load_organ_aggregates)
+    print(f"organes: {args.organs}, relevés: {args.logs}")
+    print(f"journal:                      {journal_size / 1024:10.1f} Kio")
+    print(f"relecture complète:           {full_replay * 1000:10.1f} ms")
+    print(
+        f"instantané + {args.tail} relevés:     {snapshot_replay * 1000:10.1f} ms"
+    )
+    print(f"agrégation SQL:               {database * 1000:10.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
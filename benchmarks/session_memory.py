@@ -0,0 +1,60 @@
+import argparse
+import os
+import sys
+import tempfile
+import tracemalloc
+
+
+def open_session(state_class):
+    state = state_class(_reflex_internal_init=True)
+    state_class.event_handlers["update_all_organ_metrics"].fn(
+        state
+    )
+    for _ in state_class.event_handlers[
+        "set_selected_organ"
+    ].fn(state, "Moteur") or ():
+        pass
+    return state
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Measure the memory and serialized size of one dashboard session."
+    )
+    parser.add_argument("--organs", type=int, default=2000)
+    parser.add_argument("--logs", type=int, default=200_000)
+    parser.add_argument("--sessions", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+    os.environ.setdefault(
+        "DB_URL",
+        "sqlite:///"
+        + os.path.join(tempfile.mkdtemp(), "session_memory.db"),
+    )
+    from benchmarks.synthetic import populate_database
+
+    populate_database(args.organs, args.logs, args.seed)
+
+    from tableau_de_bord_de_suivi_gpta.states.gpta_state import (
+        GptaState,
+    )
+
+    sessions = [open_session(GptaState)]
+    tracemalloc.start()
+    baseline, _ = tracemalloc.get_traced_memory()
+    sessions += [
+        open_session(GptaState) for _ in range(args.sessions)
+    ]
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    serialized = len(sessions[-1]._serialize())
+    print(f"organes: {args.organs}, relevés: {args.logs}")
+    print(
+        f"mémoire par session:    {(current - baseline) / args.sessions / 1024:10.1f} Kio"
+    )
+    print(f"état sérialisé:         {serialized / 1024:10.1f} Kio")
+    sys.stdout.flush()
+
+
+if __name__ == "__main__":
+    main()
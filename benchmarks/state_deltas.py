@@ -0,0 +1,63 @@
+import argparse
+import inspect
+import json
+import os
+import tempfile
+
+os.environ.setdefault(
+    "DB_URL",
+    "sqlite:///"
+    + os.path.join(tempfile.mkdtemp(), "state_deltas.db"),
+)
+
+from tableau_de_bord_de_suivi_gpta.states.gpta_state import (
+    GptaState,
+)
+
+
+def delta_size(state: GptaState) -> int:
+    delta = state.get_delta()
+    state._clean()
+    return len(json.dumps(delta, default=str).encode("utf-8"))
+
+
+def run_event(state: GptaState, name: str, *args) -> None:
+    result = GptaState.event_handlers[name].fn(state, *args)
+    if result is None:
+        return
+    follow_ups = (
+        list(result) if inspect.isgenerator(result) else [result]
+    )
+    for follow_up in follow_ups:
+        handler_name = getattr(
+            getattr(follow_up, "fn", None), "__name__", None
+        )
+        if handler_name in GptaState.event_handlers:
+            run_event(state, handler_name)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Measure the serialized state delta sent to the client after each event."
+    )
+    parser.parse_args()
+    state = GptaState(_reflex_internal_init=True)
+    scenario = [
+        ("chargement initial", "update_all_organ_metrics", ()),
+        ("recalcul sans changement", "update_all_organ_metrics", ()),
+        ("sélection d'un organe", "set_selected_organ", ("Moteur",)),
+        ("t = 1200 h", "set_target_uptime_t", ("1200",)),
+        ("R min = 0.5", "set_min_reliability_threshold", ("0.5",)),
+        ("R min = 0.99", "set_min_reliability_threshold", ("0.99",)),
+    ]
+    print(f"{'évènement':<28}{'octets':>10}  organes modifiés")
+    for label, name, args in scenario:
+        run_event(state, name, *args)
+        size = delta_size(state)
+        print(
+            f"{label:<28}{size:>10}  {state._changed_organ_count}"
+        )
+
+
+if __name__ == "__main__":
+    main()
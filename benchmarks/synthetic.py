@@ -0,0 +1,63 @@
+from typing import List
+
+import numpy as np
+
+BATCH_SIZE = 20000
+
+
+def synthetic_organ_names(num_organs: int) -> List[str]:
+    return [f"Organe {i}" for i in range(num_organs)]
+
+
+def populate_database(
+    num_organs: int, num_logs: int, seed: int = 42
+) -> List[str]:
+    import reflex as rx
+
+    from tableau_de_bord_de_suivi_gpta.db.models import OrganRecord
+    from tableau_de_bord_de_suivi_gpta.db.repository import (
+        ensure_database,
+        insert_failure_log_batch,
+        load_organ_names,
+    )
+
+    ensure_database()
+    new_names = synthetic_organ_names(num_organs)
+    with rx.session() as session:
+        for start in range(0, num_organs, BATCH_SIZE):
+            session.connection().execute(
+                OrganRecord.__table__.insert(),
+                [
+                    {"name": name, "label": name}
+                    for name in new_names[start : start + BATCH_SIZE]
+                ],
+            )
+        session.commit()
+    organ_names = load_organ_names()
+    rng = np.random.default_rng(seed)
+    for start in range(0, num_logs, BATCH_SIZE):
+        size = min(BATCH_SIZE, num_logs - start)
+        dates = np.datetime_as_string(
+            np.datetime64("2022-01-01")
+            + rng.integers(0, 3 * 365, size).astype(
+                "timedelta64[D]"
+            )
+        ).tolist()
+        organs = rng.integers(0, len(organ_names), size).tolist()
+        uptimes = rng.uniform(100.0, 5000.0, size).tolist()
+        repairs = rng.uniform(1.0, 48.0, size).tolist()
+        insert_failure_log_batch(
+            [
+                {
+                    "organ_name": organ_names[organ],
+                    "failure_date": date,
+                    "uptime_since_last_failure": uptime,
+                    "repair_duration": repair,
+                    "description": "",
+                }
+                for organ, date, uptime, repair in zip(
+                    organs, dates, uptimes, repairs
+                )
+            ]
+        )
+    return organ_names
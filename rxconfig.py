@@ -1,3 +1,6 @@
 import reflex as rx
 
-config = rx.Config(app_name="tableau_de_bord_de_suivi_gpta")
\ No newline at end of file
+config = rx.Config(
+    app_name="tableau_de_bord_de_suivi_gpta",
+    db_url="sqlite:///reflex.db",
+)
@@ -0,0 +1,114 @@
+from typing import Dict, Iterable, Optional
+import math
+
+from tableau_de_bord_de_suivi_gpta.analytics.types import (
+    FailureLogEntry,
+    Organ,
+    OrganAggregate,
+)
+
+
+def empty_aggregate() -> OrganAggregate:
+    return {
+        "failure_count": 0,
+        "total_uptime": 0.0,
+        "total_repair_duration": 0.0,
+    }
+
+
+def add_log_to_index(
+    index: Dict[str, OrganAggregate],
+    log: FailureLogEntry,
+) -> None:
+    aggregate = index.get(log["organ_name"])
+    if aggregate is None:
+        aggregate = empty_aggregate()
+    aggregate["failure_count"] += 1
+    aggregate["total_uptime"] += log[
+        "uptime_since_last_failure"
+    ]
+    aggregate["total_repair_duration"] += log[
+        "repair_duration"
+    ]
+    index[log["organ_name"]] = aggregate
+
+
+def build_aggregate_index(
+    logs: Iterable[FailureLogEntry],
+) -> Dict[str, OrganAggregate]:
+    index: Dict[str, OrganAggregate] = {}
+    for log in logs:
+        add_log_to_index(index, log)
+    return index
+
+
+def merge_aggregate_index(
+    index: Dict[str, OrganAggregate],
+    delta: Dict[str, OrganAggregate],
+) -> None:
+    for organ_name, added in delta.items():
+        aggregate = index.get(organ_name)
+        if aggregate is None:
+            aggregate = empty_aggregate()
+        aggregate["failure_count"] += added["failure_count"]
+        aggregate["total_uptime"] += added["total_uptime"]
+        aggregate["total_repair_duration"] += added[
+            "total_repair_duration"
+        ]
+        index[organ_name] = aggregate
+
+
+def merged_aggregate_index(
+    index: Dict[str, OrganAggregate],
+    delta: Dict[str, OrganAggregate],
+) -> Dict[str, OrganAggregate]:
+    merged = dict(index)
+    for organ_name in delta:
+        if organ_name in merged:
+            merged[organ_name] = {**merged[organ_name]}
+    merge_aggregate_index(merged, delta)
+    return merged
+
+
+def metrics_from_aggregate(
+    organ_name: str,
+    aggregate: Optional[OrganAggregate],
+    target_uptime_t: float,
+    min_reliability_threshold: float,
+) -> Organ:
+    mtbf: Optional[float] = None
+    mttr: Optional[float] = None
+    lambda_val: Optional[float] = None
+    reliability_at_t: Optional[float] = None
+    availability: Optional[float] = None
+    preventive_maintenance_period: Optional[float] = None
+    if aggregate is not None and aggregate["failure_count"] > 0:
+        num_failures = aggregate["failure_count"]
+        mtbf = aggregate["total_uptime"] / num_failures
+        mttr = (
+            aggregate["total_repair_duration"] / num_failures
+        )
+        if mtbf > 0:
+            lambda_val = 1 / mtbf
+            reliability_at_t = math.exp(
+                -lambda_val * target_uptime_t
+            )
+            if min_reliability_threshold > 0:
+                clamped_r = max(
+                    1e-06,
+                    min(0.999999, min_reliability_threshold),
+                )
+                preventive_maintenance_period = (
+                    -math.log(clamped_r) / lambda_val
+                )
+        if mtbf + mttr > 0:
+            availability = mtbf / (mtbf + mttr)
+    return {
+        "name": organ_name,
+        "mtbf": mtbf,
+        "mttr": mttr,
+        "lambda_val": lambda_val,
+        "reliability_at_t": reliability_at_t,
+        "availability": availability,
+        "preventive_maintenance_period": preventive_maintenance_period,
+    }
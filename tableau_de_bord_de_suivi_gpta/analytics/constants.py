@@ -0,0 +1,14 @@
+DEFAULT_PREVENTIVE_COST = 1000.0
+DEFAULT_CORRECTIVE_COST = 5000.0
+DEFAULT_OPERATING_HOURS_PER_DAY = 20.0
+HOURS_PER_YEAR = 8760.0
+MIN_WEIBULL_SAMPLES = 5
+
+STATUS_UNKNOWN = "inconnu"
+STATUS_OK = "ok"
+STATUS_ALERT = "alerte"
+
+BLOCK_ORGAN = "organe"
+BLOCK_SERIES = "serie"
+BLOCK_PARALLEL = "parallele"
+BLOCK_K_OUT_OF_N = "k_sur_n"
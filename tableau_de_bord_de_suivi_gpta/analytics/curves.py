@@ -0,0 +1,102 @@
+from typing import Dict, List, Sequence
+
+import numpy as np
+
+CURVE_POINT_BUDGET = 32
+MIN_POINTS_PER_SERIES = 8
+
+
+def reliability_matrix(
+    t: np.ndarray, shapes: np.ndarray, scales: np.ndarray
+) -> np.ndarray:
+    return np.exp(
+        -(
+            (t[np.newaxis, :] / scales[:, np.newaxis])
+            ** shapes[:, np.newaxis]
+        )
+    )
+
+
+def adaptive_time_grid(
+    shapes: np.ndarray,
+    scales: np.ndarray,
+    horizon: float,
+    initial_points: int = 65,
+    tolerance: float = 0.002,
+    max_points: int = 4097,
+) -> np.ndarray:
+    t = np.linspace(0.0, horizon, initial_points)
+    while len(t) < max_points:
+        values = reliability_matrix(t, shapes, scales)
+        jumps = np.abs(np.diff(values, axis=1)).max(axis=0)
+        refine = jumps > tolerance
+        if not refine.any():
+            break
+        midpoints = (t[:-1][refine] + t[1:][refine]) / 2
+        t = np.sort(np.concatenate([t, midpoints]))
+    return t
+
+
+def lttb_indices(
+    x: np.ndarray, y: np.ndarray, threshold: int
+) -> np.ndarray:
+    size = len(x)
+    if threshold >= size or threshold < 3:
+        return np.arange(size)
+    edges = np.linspace(1, size - 1, threshold - 1).astype(
+        np.int64
+    )
+    selected = [0]
+    anchor = 0
+    for i in range(threshold - 2):
+        start, end = edges[i], edges[i + 1]
+        next_start = edges[i + 1]
+        next_end = edges[i + 2] if i + 2 < len(edges) else size
+        average_x = x[next_start:next_end].mean()
+        average_y = y[next_start:next_end].mean()
+        areas = np.abs(
+            (x[anchor] - average_x) * (y[start:end] - y[anchor])
+            - (x[anchor] - x[start:end]) * (average_y - y[anchor])
+        )
+        anchor = start + int(np.argmax(areas))
+        selected.append(anchor)
+    selected.append(size - 1)
+    return np.asarray(selected)
+
+
+def reliability_curve_rows(
+    keys: Sequence[str],
+    shapes: Sequence[float],
+    scales: Sequence[float],
+    horizon: float,
+    point_budget: int = CURVE_POINT_BUDGET,
+) -> List[Dict[str, float]]:
+    if not keys:
+        return []
+    shapes = np.asarray(shapes, dtype=np.float64)
+    scales = np.asarray(scales, dtype=np.float64)
+    grid = adaptive_time_grid(shapes, scales, horizon)
+    values = reliability_matrix(grid, shapes, scales)
+    per_series = max(
+        MIN_POINTS_PER_SERIES, point_budget // len(keys)
+    )
+    chosen = np.unique(
+        np.concatenate(
+            [
+                lttb_indices(grid, series, per_series)
+                for series in values
+            ]
+        )
+    )
+    times = grid[chosen].tolist()
+    columns = np.round(values[:, chosen], 4).tolist()
+    return [
+        {
+            "temps": round(t, 2),
+            **{
+                key: column[i]
+                for key, column in zip(keys, columns)
+            },
+        }
+        for i, t in enumerate(times)
+    ]
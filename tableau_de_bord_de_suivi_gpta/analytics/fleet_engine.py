@@ -0,0 +1,134 @@
+from typing import Dict, List, Optional, Sequence, Tuple
+import math
+
+import numpy as np
+
+from tableau_de_bord_de_suivi_gpta.analytics.types import (
+    Organ,
+    OrganAggregate,
+)
+
+
+def aggregate_columns(
+    index: Dict[str, OrganAggregate],
+    organ_names: Sequence[str],
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    size = len(organ_names)
+    counts = np.zeros(size, dtype=np.int64)
+    total_uptime = np.zeros(size, dtype=np.float64)
+    total_repair = np.zeros(size, dtype=np.float64)
+    for i, name in enumerate(organ_names):
+        aggregate = index.get(name)
+        if aggregate is not None:
+            counts[i] = aggregate["failure_count"]
+            total_uptime[i] = aggregate["total_uptime"]
+            total_repair[i] = aggregate[
+                "total_repair_duration"
+            ]
+    return counts, total_uptime, total_repair
+
+
+def fleet_failure_rates(
+    counts: np.ndarray, total_uptime: np.ndarray
+) -> np.ndarray:
+    counts = np.asarray(counts)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        mtbf = total_uptime / np.where(counts > 0, counts, 1)
+        return np.where(
+            (counts > 0) & (mtbf > 0),
+            1 / np.where(mtbf > 0, mtbf, 1.0),
+            np.nan,
+        )
+
+
+def reliability_from_rates(
+    lambda_val: np.ndarray, target_uptime_t: float
+) -> np.ndarray:
+    return np.exp(-lambda_val * target_uptime_t)
+
+
+def _to_optional_list(
+    values: np.ndarray, mask: np.ndarray
+) -> List[Optional[float]]:
+    return [
+        value if present else None
+        for value, present in zip(
+            values.tolist(), mask.tolist()
+        )
+    ]
+
+
+def compute_fleet_metrics(
+    organ_names: Sequence[str],
+    counts: np.ndarray,
+    total_uptime: np.ndarray,
+    total_repair: np.ndarray,
+    target_uptime_t: float,
+    min_reliability_threshold: float,
+) -> List[Organ]:
+    counts = np.asarray(counts)
+    has_logs = counts > 0
+    safe_counts = np.where(has_logs, counts, 1)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        mtbf = np.where(
+            has_logs, total_uptime / safe_counts, 0.0
+        )
+        mttr = np.where(
+            has_logs, total_repair / safe_counts, 0.0
+        )
+        has_rate = has_logs & (mtbf > 0)
+        lambda_val = np.where(
+            has_rate, 1 / np.where(has_rate, mtbf, 1.0), 0.0
+        )
+        reliability_at_t = reliability_from_rates(
+            lambda_val, target_uptime_t
+        )
+        has_period = has_rate & (
+            min_reliability_threshold > 0
+        )
+        if min_reliability_threshold > 0:
+            clamped_r = max(
+                1e-06,
+                min(0.999999, min_reliability_threshold),
+            )
+            period = -math.log(clamped_r) / np.where(
+                has_rate, lambda_val, 1.0
+            )
+        else:
+            period = np.zeros_like(mtbf)
+        uptime_and_repair = mtbf + mttr
+        has_availability = has_logs & (
+            uptime_and_repair > 0
+        )
+        availability = mtbf / np.where(
+            has_availability, uptime_and_repair, 1.0
+        )
+    columns = zip(
+        organ_names,
+        _to_optional_list(mtbf, has_logs),
+        _to_optional_list(mttr, has_logs),
+        _to_optional_list(lambda_val, has_rate),
+        _to_optional_list(reliability_at_t, has_rate),
+        _to_optional_list(availability, has_availability),
+        _to_optional_list(period, has_period),
+    )
+    return [
+        {
+            "name": name,
+            "mtbf": organ_mtbf,
+            "mttr": organ_mttr,
+            "lambda_val": organ_lambda,
+            "reliability_at_t": organ_reliability,
+            "availability": organ_availability,
+            "preventive_maintenance_period": organ_period,
+        }
+        for (
+            name,
+            organ_mtbf,
+            organ_mttr,
+            organ_lambda,
+            organ_reliability,
+            organ_availability,
+            organ_period,
+        ) in columns
+    ]
@@ -0,0 +1,233 @@
+from typing import Dict, Iterable, List, Mapping, Optional
+import math
+
+from tableau_de_bord_de_suivi_gpta.analytics.aggregates import (
+    merged_aggregate_index,
+    metrics_from_aggregate,
+)
+from tableau_de_bord_de_suivi_gpta.analytics.types import (
+    HierarchyNode,
+    HierarchyNodeSummary,
+    NodeRollup,
+    Organ,
+    OrganAggregate,
+    OrganPlacement,
+)
+
+LEVEL_FLEET = "flotte"
+LEVEL_LOCOMOTIVE = "locomotive"
+LEVEL_COMPRESSOR = "compresseur"
+LEVEL_ORGAN = "organe"
+FLEET_KEY = LEVEL_FLEET
+FLEET_LABEL = "Flotte"
+UNASSIGNED_LABEL = "Non affecté"
+
+
+def node_key(level: str, name: str) -> str:
+    return f"{level}:{name}"
+
+
+def organ_rollup(aggregate: Optional[OrganAggregate]) -> NodeRollup:
+    metrics = metrics_from_aggregate("", aggregate, 0.0, 0.0)
+    rollup: NodeRollup = {
+        "failure_count": aggregate["failure_count"] if aggregate else 0,
+        "failure_rate": 0.0,
+        "repair_rate": 0.0,
+        "log_availability": 0.0,
+    }
+    if metrics["lambda_val"] is not None:
+        rollup["failure_rate"] = metrics["lambda_val"]
+        rollup["repair_rate"] = metrics["lambda_val"] * metrics["mttr"]
+        rollup["log_availability"] = math.log(metrics["availability"])
+    return rollup
+
+
+def rollup_metrics(name: str, rollup: Optional[NodeRollup]) -> Organ:
+    empty = metrics_from_aggregate(name, None, 0.0, 0.0)
+    if rollup is None or rollup["failure_rate"] <= 0:
+        return empty
+    return {
+        **empty,
+        "mtbf": 1 / rollup["failure_rate"],
+        "mttr": rollup["repair_rate"] / rollup["failure_rate"],
+        "lambda_val": rollup["failure_rate"],
+        "availability": math.exp(rollup["log_availability"]),
+    }
+
+
+class FleetHierarchy:
+    def __init__(self):
+        self.nodes: Dict[str, HierarchyNode] = {
+            FLEET_KEY: {
+                "key": FLEET_KEY,
+                "level": LEVEL_FLEET,
+                "name": FLEET_LABEL,
+                "organ_name": None,
+            }
+        }
+        self.parents: Dict[str, str] = {}
+        self.children: Dict[str, List[str]] = {FLEET_KEY: []}
+
+    @classmethod
+    def from_placements(
+        cls, placements: Iterable[OrganPlacement]
+    ) -> "FleetHierarchy":
+        hierarchy = cls()
+        for placement in placements:
+            hierarchy.add(placement)
+        return hierarchy
+
+    def _add_node(
+        self,
+        level: str,
+        name: str,
+        parent: str,
+        label: Optional[str] = None,
+    ) -> str:
+        key = node_key(level, name)
+        if key not in self.nodes:
+            self.nodes[key] = {
+                "key": key,
+                "level": level,
+                "name": label or name or UNASSIGNED_LABEL,
+                "organ_name": name if level == LEVEL_ORGAN else None,
+            }
+            self.parents[key] = parent
+            self.children[key] = []
+            self.children[parent].append(key)
+        return key
+
+    def add(self, placement: OrganPlacement) -> str:
+        organ_name = placement["organ_name"]
+        compressor_name = placement["compressor_name"]
+        locomotive_name = placement["locomotive_name"]
+        if organ_name is not None and compressor_name is None:
+            locomotive_name = ""
+            compressor_name = ""
+        key = self._add_node(
+            LEVEL_LOCOMOTIVE, locomotive_name or "", FLEET_KEY
+        )
+        if compressor_name is not None:
+            key = self._add_node(
+                LEVEL_COMPRESSOR, compressor_name, key
+            )
+        if organ_name is not None:
+            key = self._add_node(
+                LEVEL_ORGAN,
+                organ_name,
+                key,
+                placement["organ_label"],
+            )
+        return key
+
+    def path(self, key: str) -> List[HierarchyNode]:
+        nodes = []
+        while key in self.nodes:
+            nodes.append(self.nodes[key])
+            key = self.parents.get(key, "")
+        return nodes[::-1]
+
+    def organ_names(self, key: str) -> List[str]:
+        names: List[str] = []
+        pending = [key]
+        while pending:
+            current = pending.pop()
+            node = self.nodes.get(current)
+            if node is None:
+                continue
+            if node["organ_name"] is not None:
+                names.append(node["organ_name"])
+            pending.extend(reversed(self.children.get(current, [])))
+        return names
+
+    def organ_labels(self, key: str) -> Dict[str, str]:
+        return {
+            self.nodes[child]["name"]: self.nodes[child]["organ_name"]
+            for child in self.children.get(key, [])
+            if self.nodes[child]["organ_name"] is not None
+        }
+
+    def first_compressor(self, key: str) -> Optional[str]:
+        pending = [key]
+        while pending:
+            current = pending.pop(0)
+            node = self.nodes.get(current)
+            if node is None:
+                continue
+            if node["level"] == LEVEL_COMPRESSOR:
+                return current
+            pending.extend(self.children.get(current, []))
+        return None
+
+    def ancestor_keys(self, organ_name: str) -> List[str]:
+        key = node_key(LEVEL_ORGAN, organ_name)
+        if key not in self.nodes:
+            return []
+        return [node["key"] for node in self.path(key)[:-1]]
+
+    def apply(
+        self,
+        rollups: Dict[str, NodeRollup],
+        previous: Mapping[str, OrganAggregate],
+        delta: Dict[str, OrganAggregate],
+    ) -> None:
+        merged = merged_aggregate_index(
+            {
+                name: previous[name]
+                for name in delta
+                if name in previous
+            },
+            delta,
+        )
+        for organ_name in delta:
+            keys = self.ancestor_keys(organ_name)
+            if not keys:
+                continue
+            before = organ_rollup(previous.get(organ_name))
+            after = organ_rollup(merged[organ_name])
+            change = {
+                field: after[field] - before[field] for field in after
+            }
+            for key in keys:
+                current = rollups.get(key)
+                rollups[key] = (
+                    change
+                    if current is None
+                    else {
+                        field: current[field] + change[field]
+                        for field in current
+                    }
+                )
+
+    def rollup(
+        self, aggregates: Dict[str, OrganAggregate]
+    ) -> Dict[str, NodeRollup]:
+        rollups: Dict[str, NodeRollup] = {}
+        self.apply(rollups, {}, aggregates)
+        return rollups
+
+    def summary(
+        self,
+        key: str,
+        rollups: Mapping[str, NodeRollup],
+        aggregates: Mapping[str, OrganAggregate],
+    ) -> HierarchyNodeSummary:
+        node = self.nodes[key]
+        if node["organ_name"] is not None:
+            aggregate = aggregates.get(node["organ_name"])
+            metrics = metrics_from_aggregate(
+                node["name"], aggregate, 0.0, 0.0
+            )
+            failure_count = aggregate["failure_count"] if aggregate else 0
+        else:
+            rollup = rollups.get(key)
+            metrics = rollup_metrics(node["name"], rollup)
+            failure_count = rollup["failure_count"] if rollup else 0
+        return {
+            **node,
+            "child_count": len(self.children[key]),
+            "failure_count": failure_count,
+            "mtbf": metrics["mtbf"],
+            "mttr": metrics["mttr"],
+            "availability": metrics["availability"],
+        }
@@ -0,0 +1,175 @@
+from typing import Dict, List, Optional, Sequence, Tuple
+import datetime
+import math
+
+import numpy as np
+
+from tableau_de_bord_de_suivi_gpta.analytics.constants import (
+    DEFAULT_CORRECTIVE_COST,
+    DEFAULT_OPERATING_HOURS_PER_DAY,
+    DEFAULT_PREVENTIVE_COST,
+)
+from tableau_de_bord_de_suivi_gpta.analytics.types import (
+    MaintenanceCosts,
+    MaintenanceSlot,
+    ReplacementPlan,
+    WeibullFit,
+)
+
+REPLACEMENT_GRID_POINTS = 600
+REPLACEMENT_GRID_SPAN = 4.0
+GROUPING_WINDOW_DAYS = 14
+
+
+def run_to_failure_cost_rates(
+    shape: np.ndarray, scale: np.ndarray, corrective: np.ndarray
+) -> np.ndarray:
+    mean_life = scale * np.array(
+        [math.gamma(1 + 1 / value) for value in shape.tolist()]
+    )
+    return corrective / mean_life
+
+
+def optimal_replacement_ages(
+    shape: np.ndarray,
+    scale: np.ndarray,
+    preventive: np.ndarray,
+    corrective: np.ndarray,
+) -> Tuple[np.ndarray, np.ndarray]:
+    step = REPLACEMENT_GRID_SPAN / REPLACEMENT_GRID_POINTS
+    ages = np.linspace(
+        0.0, REPLACEMENT_GRID_SPAN, REPLACEMENT_GRID_POINTS + 1
+    )
+    survival = np.exp(-(ages[None, :] ** shape[:, None]))
+    expected_uptime = np.cumsum(
+        (survival[:, 1:] + survival[:, :-1]) * (step / 2), axis=1
+    )
+    survival = survival[:, 1:]
+    cost = (
+        preventive[:, None] * survival
+        + corrective[:, None] * (1 - survival)
+    ) / (scale[:, None] * expected_uptime)
+    rows = np.arange(len(shape))
+    best = np.argmin(cost, axis=1)
+    inner = np.clip(best, 1, REPLACEMENT_GRID_POINTS - 2)
+    left = cost[rows, inner - 1]
+    middle = cost[rows, inner]
+    right = cost[rows, inner + 1]
+    curvature = left - 2 * middle + right
+    refinable = (best == inner) & (curvature > 0)
+    safe_curvature = np.where(refinable, curvature, 1.0)
+    offset = np.where(
+        refinable,
+        np.clip(0.5 * (left - right) / safe_curvature, -1.0, 1.0),
+        0.0,
+    )
+    rate = np.where(
+        refinable,
+        middle - (left - right) ** 2 / (8 * safe_curvature),
+        cost[rows, best],
+    )
+    age = (best + 1 + offset) * step
+    useful = (
+        (shape > 1)
+        & (corrective > preventive)
+        & (best < REPLACEMENT_GRID_POINTS - 1)
+        & (rate < run_to_failure_cost_rates(shape, scale, corrective))
+    )
+    return (
+        np.where(useful, scale * age, np.nan),
+        np.where(useful, rate, np.nan),
+    )
+
+
+def replacement_plans(
+    organ_names: Sequence[str],
+    fits: Dict[str, Optional[WeibullFit]],
+    costs: Dict[str, MaintenanceCosts],
+) -> Dict[str, ReplacementPlan]:
+    fitted = [name for name in organ_names if fits.get(name)]
+    if not fitted:
+        return {}
+    default_costs: MaintenanceCosts = {
+        "preventive_cost": DEFAULT_PREVENTIVE_COST,
+        "corrective_cost": DEFAULT_CORRECTIVE_COST,
+    }
+    organ_costs = [costs.get(name, default_costs) for name in fitted]
+    shape = np.array([fits[name]["shape"] for name in fitted])
+    scale = np.array([fits[name]["scale"] for name in fitted])
+    preventive = np.array(
+        [item["preventive_cost"] for item in organ_costs]
+    )
+    corrective = np.array(
+        [item["corrective_cost"] for item in organ_costs]
+    )
+    interval, rate = optimal_replacement_ages(
+        shape, scale, preventive, corrective
+    )
+    baseline = run_to_failure_cost_rates(shape, scale, corrective)
+    plans: Dict[str, ReplacementPlan] = {}
+    for i, name in enumerate(fitted):
+        has_interval = not math.isnan(interval[i])
+        plans[name] = {
+            "name": name,
+            "shape": float(shape[i]),
+            "scale": float(scale[i]),
+            "preventive_cost": float(preventive[i]),
+            "corrective_cost": float(corrective[i]),
+            "interval": float(interval[i]) if has_interval else None,
+            "cost_rate": float(rate[i]) if has_interval else None,
+            "run_to_failure_cost_rate": float(baseline[i]),
+            "savings": (
+                float(1 - rate[i] / baseline[i])
+                if has_interval
+                else None
+            ),
+        }
+    return plans
+
+
+def maintenance_calendar(
+    plans: Dict[str, ReplacementPlan],
+    last_renewals: Dict[str, datetime.date],
+    year: int,
+    operating_hours_per_day: float = DEFAULT_OPERATING_HOURS_PER_DAY,
+    grouping_days: int = GROUPING_WINDOW_DAYS,
+) -> List[MaintenanceSlot]:
+    first_day = datetime.date(year, 1, 1)
+    last_day = datetime.date(year, 12, 31)
+    interventions: List[Tuple[datetime.date, str]] = []
+    for name, plan in plans.items():
+        if plan["interval"] is None:
+            continue
+        period = plan["interval"] / operating_hours_per_day
+        anchor = last_renewals.get(name, first_day)
+        elapsed = period
+        if anchor + datetime.timedelta(days=elapsed) < first_day:
+            anchor = first_day
+            elapsed = 0.0
+        while True:
+            due = anchor + datetime.timedelta(days=elapsed)
+            if due > last_day:
+                break
+            interventions.append((due, name))
+            elapsed += period
+    interventions.sort()
+    slots: List[MaintenanceSlot] = []
+    slot_start: Optional[datetime.date] = None
+    for due, name in interventions:
+        if (
+            slot_start is None
+            or (due - slot_start).days > grouping_days
+        ):
+            slot_start = due
+            slots.append(
+                {
+                    "date": due.isoformat(),
+                    "organ_names": [],
+                    "organ_count": 0,
+                }
+            )
+        slot = slots[-1]
+        if name not in slot["organ_names"]:
+            slot["organ_names"].append(name)
+            slot["organ_count"] += 1
+    return slots
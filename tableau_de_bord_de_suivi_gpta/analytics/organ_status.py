@@ -0,0 +1,99 @@
+from typing import Dict, List, Mapping, Optional, Sequence, Tuple
+
+import numpy as np
+
+from tableau_de_bord_de_suivi_gpta.analytics.constants import (
+    STATUS_ALERT,
+    STATUS_OK,
+    STATUS_UNKNOWN,
+)
+from tableau_de_bord_de_suivi_gpta.analytics.types import (
+    Organ,
+    OrganStatus,
+)
+
+MIN_STATUS_PATCH_LIMIT = 32
+
+_shared_rows: Dict[Tuple[str, str], OrganStatus] = {}
+
+
+def shared_status_row(name: str, status: str) -> OrganStatus:
+    row = _shared_rows.get((name, status))
+    if row is None:
+        row = _shared_rows.setdefault(
+            (name, status), {"name": name, "status": status}
+        )
+    return row
+
+
+def organ_status(
+    organ: Organ, min_reliability_threshold: float
+) -> OrganStatus:
+    reliability = organ["reliability_at_t"]
+    if reliability is None:
+        status = STATUS_UNKNOWN
+    elif reliability < min_reliability_threshold:
+        status = STATUS_ALERT
+    else:
+        status = STATUS_OK
+    return shared_status_row(organ["name"], status)
+
+
+def statuses_from_reliability(
+    organ_names: Sequence[str],
+    reliability: np.ndarray,
+    min_reliability_threshold: float,
+) -> List[OrganStatus]:
+    codes = np.where(
+        np.isnan(reliability),
+        0,
+        np.where(reliability < min_reliability_threshold, 2, 1),
+    ).tolist()
+    labels = (STATUS_UNKNOWN, STATUS_OK, STATUS_ALERT)
+    return [
+        shared_status_row(name, labels[code])
+        for name, code in zip(organ_names, codes)
+    ]
+
+
+def changed_organ_names(
+    previous: Sequence[OrganStatus],
+    current: Sequence[OrganStatus],
+) -> List[str]:
+    before = {item["name"]: item["status"] for item in previous}
+    changed = [
+        item["name"]
+        for item in current
+        if before.pop(item["name"], None) != item["status"]
+    ]
+    return changed + list(before)
+
+
+def patched_statuses(
+    base: Sequence[OrganStatus], patch: Mapping[str, str]
+) -> List[OrganStatus]:
+    if not patch:
+        return list(base)
+    return [
+        shared_status_row(
+            row["name"], patch.get(row["name"], row["status"])
+        )
+        for row in base
+    ]
+
+
+def status_patch(
+    base: Sequence[OrganStatus], current: Sequence[OrganStatus]
+) -> Optional[Dict[str, str]]:
+    if len(base) != len(current):
+        return None
+    patch: Dict[str, str] = {}
+    limit = max(MIN_STATUS_PATCH_LIMIT, len(current) // 4)
+    for before, after in zip(base, current):
+        if before["name"] != after["name"]:
+            return None
+        if before["status"] != after["status"]:
+            patch[after["name"]] = after["status"]
+            if len(patch) > limit:
+                return None
+    return patch
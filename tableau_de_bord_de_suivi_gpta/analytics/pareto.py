@@ -0,0 +1,71 @@
+from typing import Dict, Iterator, List, Sequence
+import heapq
+import itertools
+
+from tableau_de_bord_de_suivi_gpta.analytics.types import (
+    OrganAggregate,
+    ParetoEntry,
+)
+
+PARETO_TOP_K = 12
+OTHERS_LABEL = "Autres"
+
+
+def _ranked_names(
+    aggregates: Dict[str, OrganAggregate],
+    organ_names: Sequence[str],
+    top_k: int,
+) -> Iterator[str]:
+    top = heapq.nlargest(
+        top_k,
+        (
+            (aggregate["failure_count"], name)
+            for name, aggregate in aggregates.items()
+            if aggregate["failure_count"] > 0
+        ),
+        key=lambda item: item[0],
+    )
+    ranked = {name for _, name in top}
+    yield from (name for _, name in top)
+    yield from (
+        name for name in organ_names if name not in ranked
+    )
+
+
+def pareto_rows(
+    aggregates: Dict[str, OrganAggregate],
+    organ_names: Sequence[str],
+    top_k: int = PARETO_TOP_K,
+) -> List[ParetoEntry]:
+    total_failures = sum(
+        aggregate["failure_count"]
+        for aggregate in aggregates.values()
+    )
+    rows: List[ParetoEntry] = []
+    cumulative = 0
+    for name in itertools.islice(
+        _ranked_names(aggregates, organ_names, top_k), top_k
+    ):
+        aggregate = aggregates.get(name)
+        count = aggregate["failure_count"] if aggregate else 0
+        cumulative += count
+        rows.append(
+            {
+                "name": name,
+                "pannes": count,
+                "cumulatif": (
+                    round(cumulative / total_failures * 100, 2)
+                    if total_failures
+                    else 0.0
+                ),
+            }
+        )
+    if len(organ_names) > top_k:
+        rows.append(
+            {
+                "name": OTHERS_LABEL,
+                "pannes": total_failures - cumulative,
+                "cumulatif": 100.0 if total_failures else 0.0,
+            }
+        )
+    return rows
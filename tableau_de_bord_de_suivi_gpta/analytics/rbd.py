@@ -0,0 +1,419 @@
+from typing import Dict, List, Optional, Sequence, Set, Tuple
+import math
+import threading
+
+import numpy as np
+
+from tableau_de_bord_de_suivi_gpta.analytics.constants import (
+    BLOCK_K_OUT_OF_N,
+    BLOCK_ORGAN,
+    BLOCK_PARALLEL,
+    BLOCK_SERIES,
+)
+from tableau_de_bord_de_suivi_gpta.analytics.fleet_engine import (
+    aggregate_columns,
+    fleet_failure_rates,
+)
+from tableau_de_bord_de_suivi_gpta.analytics.types import (
+    OrganAggregate,
+    ReliabilityBlock,
+    SystemReliability,
+)
+
+NEGLIGIBLE_COEFFICIENT = 1e-12
+
+ExpSum = Dict[float, float]
+
+
+class DiagramError(ValueError):
+    pass
+
+
+def organ_block(name: str) -> ReliabilityBlock:
+    return {"kind": BLOCK_ORGAN, "name": name, "k": 1, "blocks": []}
+
+
+def series_block(
+    name: str, *blocks: ReliabilityBlock
+) -> ReliabilityBlock:
+    return {
+        "kind": BLOCK_SERIES,
+        "name": name,
+        "k": len(blocks),
+        "blocks": list(blocks),
+    }
+
+
+def parallel_block(
+    name: str, *blocks: ReliabilityBlock
+) -> ReliabilityBlock:
+    return {
+        "kind": BLOCK_PARALLEL,
+        "name": name,
+        "k": 1,
+        "blocks": list(blocks),
+    }
+
+
+def k_out_of_n_block(
+    name: str, k: int, *blocks: ReliabilityBlock
+) -> ReliabilityBlock:
+    return {
+        "kind": BLOCK_K_OUT_OF_N,
+        "name": name,
+        "k": k,
+        "blocks": list(blocks),
+    }
+
+
+DEFAULT_GPTA_DIAGRAM = series_block(
+    "Compresseur GPTA",
+    organ_block("Moteur"),
+    organ_block("Groupe à vis"),
+    organ_block("ADCU (unité de commande)"),
+    parallel_block(
+        "Traitement de l'air",
+        series_block(
+            "Séchage",
+            organ_block("Sécheur d'air"),
+            organ_block("Électrovanne de régénération"),
+            organ_block("Capteur de point de rosée"),
+        ),
+        organ_block("Soupape by-pass"),
+    ),
+)
+
+
+def _instantiate(
+    block: ReliabilityBlock,
+    organs: Dict[str, str],
+    used: Set[str],
+) -> Optional[ReliabilityBlock]:
+    if block["kind"] == BLOCK_ORGAN:
+        if block["name"] not in organs:
+            return None
+        used.add(block["name"])
+        return organ_block(organs[block["name"]])
+    blocks = [
+        child
+        for child in (
+            _instantiate(child, organs, used)
+            for child in block["blocks"]
+        )
+        if child is not None
+    ]
+    if not blocks:
+        return None
+    return {
+        **block,
+        "k": (
+            len(blocks)
+            if block["kind"] == BLOCK_SERIES
+            else min(block["k"], len(blocks))
+        ),
+        "blocks": blocks,
+    }
+
+
+def compressor_diagram(
+    name: str,
+    organs: Dict[str, str],
+    template: ReliabilityBlock = DEFAULT_GPTA_DIAGRAM,
+) -> Optional[ReliabilityBlock]:
+    used: Set[str] = set()
+    root = _instantiate(template, organs, used)
+    blocks: List[ReliabilityBlock] = []
+    if root is not None:
+        blocks = (
+            root["blocks"] if root["kind"] == BLOCK_SERIES else [root]
+        )
+    blocks = blocks + [
+        organ_block(organ_name)
+        for label, organ_name in organs.items()
+        if label not in used
+    ]
+    if not blocks:
+        return None
+    return series_block(name, *blocks)
+
+
+def block_organ_names(block: ReliabilityBlock) -> List[str]:
+    if block["kind"] == BLOCK_ORGAN:
+        return [block["name"]]
+    return [
+        name
+        for child in block["blocks"]
+        for name in block_organ_names(child)
+    ]
+
+
+def block_up(
+    block: ReliabilityBlock, up: Dict[str, np.ndarray]
+) -> np.ndarray:
+    if block["kind"] == BLOCK_ORGAN:
+        return up[block["name"]]
+    working = np.sum(
+        [block_up(child, up) for child in block["blocks"]],
+        axis=0,
+        dtype=np.int64,
+    )
+    if block["kind"] == BLOCK_SERIES:
+        return working == len(block["blocks"])
+    if block["kind"] == BLOCK_PARALLEL:
+        return working > 0
+    return working >= block["k"]
+
+
+def failure_rates(
+    organ_names: Sequence[str],
+    aggregates: Dict[str, OrganAggregate],
+) -> Dict[str, float]:
+    counts, total_uptime, _ = aggregate_columns(
+        aggregates, organ_names
+    )
+    rates = fleet_failure_rates(counts, total_uptime)
+    return {
+        name: rate
+        for name, rate in zip(organ_names, rates.tolist())
+        if not math.isnan(rate)
+    }
+
+
+def _add_terms(target: ExpSum, terms: ExpSum, factor: float) -> None:
+    for rate, coefficient in terms.items():
+        target[rate] = target.get(rate, 0.0) + factor * coefficient
+
+
+def _prune(terms: ExpSum) -> ExpSum:
+    return {
+        rate: coefficient
+        for rate, coefficient in terms.items()
+        if abs(coefficient) > NEGLIGIBLE_COEFFICIENT
+    }
+
+
+def _multiply(left: ExpSum, right: ExpSum) -> ExpSum:
+    product: ExpSum = {}
+    for left_rate, left_coefficient in left.items():
+        for right_rate, right_coefficient in right.items():
+            rate = left_rate + right_rate
+            product[rate] = (
+                product.get(rate, 0.0)
+                + left_coefficient * right_coefficient
+            )
+    return _prune(product)
+
+
+def _complement(terms: ExpSum) -> ExpSum:
+    complement: ExpSum = {0.0: 1.0}
+    _add_terms(complement, terms, -1.0)
+    return _prune(complement)
+
+
+def _at_least(k: int, children: Sequence[ExpSum]) -> ExpSum:
+    working: List[ExpSum] = [{0.0: 1.0}]
+    for child in children:
+        failed = _complement(child)
+        shifted: List[ExpSum] = []
+        for count in range(len(working) + 1):
+            terms: ExpSum = {}
+            if count < len(working):
+                _add_terms(terms, _multiply(working[count], failed), 1.0)
+            if count > 0:
+                _add_terms(
+                    terms, _multiply(working[count - 1], child), 1.0
+                )
+            shifted.append(_prune(terms))
+        working = shifted
+    total: ExpSum = {}
+    for terms in working[k:]:
+        _add_terms(total, terms, 1.0)
+    return _prune(total)
+
+
+def _exactly(k: int, reliabilities: Sequence[float]) -> float:
+    working = [1.0]
+    for reliability in reliabilities:
+        working = [
+            (working[count] if count < len(working) else 0.0)
+            * (1 - reliability)
+            + (working[count - 1] * reliability if count else 0.0)
+            for count in range(len(working) + 1)
+        ]
+    return working[k] if 0 <= k < len(working) else 0.0
+
+
+def _evaluate(terms: ExpSum, t: float) -> float:
+    return min(
+        1.0,
+        max(
+            0.0,
+            sum(
+                coefficient * math.exp(-rate * t)
+                for rate, coefficient in terms.items()
+            ),
+        ),
+    )
+
+
+def _mean_time(terms: ExpSum) -> Optional[float]:
+    if abs(terms.get(0.0, 0.0)) > NEGLIGIBLE_COEFFICIENT:
+        return None
+    return sum(
+        coefficient / rate
+        for rate, coefficient in terms.items()
+        if rate > 0
+    )
+
+
+class ReliabilityDiagram:
+    def __init__(self, root: ReliabilityBlock):
+        self.root = root
+        self.blocks: List[ReliabilityBlock] = []
+        self.children: List[List[int]] = []
+        self.depths: List[int] = []
+        self.organs: List[Tuple[str, ...]] = []
+        self._terms: Dict[int, Tuple[Tuple[float, ...], ExpSum]] = {}
+        self._lock = threading.Lock()
+        self._flatten(root, 0)
+        names = self.organs[0]
+        if len(set(names)) != len(names):
+            raise DiagramError(
+                "Un organe ne peut apparaître qu'une fois dans le diagramme."
+            )
+
+    def _flatten(self, block: ReliabilityBlock, depth: int) -> int:
+        index = len(self.blocks)
+        self.blocks.append(block)
+        self.children.append([])
+        self.depths.append(depth)
+        self.organs.append(())
+        if block["kind"] == BLOCK_ORGAN:
+            self.organs[index] = (block["name"],)
+            return index
+        if not block["blocks"]:
+            raise DiagramError(f"Le bloc {block['name']!r} est vide.")
+        if block["kind"] == BLOCK_K_OUT_OF_N and not (
+            1 <= block["k"] <= len(block["blocks"])
+        ):
+            raise DiagramError(
+                f"Le bloc {block['name']!r} doit avoir 1 ≤ k ≤ {len(block['blocks'])}."
+            )
+        if block["kind"] not in (
+            BLOCK_SERIES,
+            BLOCK_PARALLEL,
+            BLOCK_K_OUT_OF_N,
+        ):
+            raise DiagramError(
+                f"Type de bloc inconnu: {block['kind']!r}."
+            )
+        for child in block["blocks"]:
+            child_index = self._flatten(child, depth + 1)
+            self.children[index].append(child_index)
+            self.organs[index] += self.organs[child_index]
+        return index
+
+    def organ_names(self) -> List[str]:
+        return list(self.organs[0])
+
+    def _block_terms(
+        self, index: int, rates: Dict[str, float]
+    ) -> Optional[ExpSum]:
+        if any(name not in rates for name in self.organs[index]):
+            return None
+        signature = tuple(rates[name] for name in self.organs[index])
+        cached = self._terms.get(index)
+        if cached is not None and cached[0] == signature:
+            return cached[1]
+        block = self.blocks[index]
+        children = [
+            self._block_terms(child, rates)
+            for child in self.children[index]
+        ]
+        if block["kind"] == BLOCK_ORGAN:
+            terms: ExpSum = {signature[0]: 1.0}
+        elif block["kind"] == BLOCK_SERIES:
+            terms = {0.0: 1.0}
+            for child in children:
+                terms = _multiply(terms, child)
+        elif block["kind"] == BLOCK_PARALLEL:
+            failed: ExpSum = {0.0: 1.0}
+            for child in children:
+                failed = _multiply(failed, _complement(child))
+            terms = _complement(failed)
+        else:
+            terms = _at_least(block["k"], children)
+        self._terms[index] = (signature, terms)
+        return terms
+
+    def _sensitivities(
+        self, reliabilities: List[Optional[float]]
+    ) -> List[Optional[float]]:
+        sensitivity: List[Optional[float]] = [None] * len(self.blocks)
+        sensitivity[0] = 1.0
+        for index, block in enumerate(self.blocks):
+            children = self.children[index]
+            for child in children:
+                others = [
+                    reliabilities[other]
+                    for other in children
+                    if other != child
+                ]
+                if sensitivity[index] is None or None in others:
+                    continue
+                if block["kind"] == BLOCK_SERIES:
+                    partial = math.prod(others)
+                elif block["kind"] == BLOCK_PARALLEL:
+                    partial = math.prod(1 - value for value in others)
+                else:
+                    partial = _exactly(block["k"] - 1, others)
+                sensitivity[child] = sensitivity[index] * partial
+        return sensitivity
+
+    def evaluate(
+        self, rates: Dict[str, float], t: float
+    ) -> SystemReliability:
+        with self._lock:
+            terms = [
+                self._block_terms(index, rates)
+                for index in range(len(self.blocks) - 1, -1, -1)
+            ][::-1]
+        reliabilities = [
+            None if block is None else _evaluate(block, t)
+            for block in terms
+        ]
+        sensitivity = self._sensitivities(reliabilities)
+        return {
+            "name": self.root["name"],
+            "reliability_at_t": reliabilities[0],
+            "mtbf": None if terms[0] is None else _mean_time(terms[0]),
+            "unknown_organs": [
+                name for name in self.organs[0] if name not in rates
+            ],
+            "blocks": [
+                {
+                    "name": block["name"],
+                    "kind": block["kind"],
+                    "depth": depth,
+                    "reliability_at_t": reliability,
+                }
+                for block, depth, reliability in zip(
+                    self.blocks, self.depths, reliabilities
+                )
+            ],
+            "importance": sorted(
+                (
+                    {
+                        "name": block["name"],
+                        "reliability_at_t": reliabilities[index],
+                        "birnbaum": sensitivity[index],
+                    }
+                    for index, block in enumerate(self.blocks)
+                    if block["kind"] == BLOCK_ORGAN
+                ),
+                key=lambda row: (
+                    row["birnbaum"] is None,
+                    -(row["birnbaum"] or 0.0),
+                ),
+            ),
+        }
@@ -0,0 +1,359 @@
+from concurrent.futures import Executor, Future
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+import math
+import os
+import threading
+
+import numpy as np
+
+from tableau_de_bord_de_suivi_gpta.analytics.constants import (
+    HOURS_PER_YEAR,
+)
+from tableau_de_bord_de_suivi_gpta.analytics.rbd import (
+    block_organ_names,
+    block_up,
+)
+from tableau_de_bord_de_suivi_gpta.analytics.types import (
+    AvailabilitySimulation,
+    OrganAggregate,
+    OrganFailureModel,
+    ReliabilityBlock,
+    WeibullFit,
+)
+
+SIMULATION_CHUNK = 50000
+SIMULATION_WORKERS = os.cpu_count() or 1
+DOWNTIME_HISTOGRAM_BINS = 20
+STATE_TABLE_ORGANS = 16
+CONFIDENCE_Z = 1.96
+
+_pool: Optional[Executor] = None
+_pool_lock = threading.Lock()
+
+
+class SimulationInputError(ValueError):
+    pass
+
+
+def organ_failure_models(
+    organ_names: Sequence[str],
+    fits: Dict[str, Optional[WeibullFit]],
+    aggregates: Dict[str, OrganAggregate],
+) -> List[OrganFailureModel]:
+    models: List[OrganFailureModel] = []
+    for name in organ_names:
+        aggregate = aggregates.get(name)
+        if aggregate is None or aggregate["failure_count"] <= 0:
+            continue
+        mtbf = aggregate["total_uptime"] / aggregate["failure_count"]
+        if mtbf <= 0:
+            continue
+        fit = fits.get(name)
+        models.append(
+            {
+                "name": name,
+                "shape": fit["shape"] if fit else 1.0,
+                "scale": fit["scale"] if fit else mtbf,
+                "mttr": aggregate["total_repair_duration"]
+                / aggregate["failure_count"],
+            }
+        )
+    return models
+
+
+def _down_intervals(
+    rng: np.random.Generator,
+    shape: float,
+    scale: float,
+    mttr: float,
+    missions: int,
+    horizon: float,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    mission_ids: List[np.ndarray] = []
+    starts: List[np.ndarray] = []
+    ends: List[np.ndarray] = []
+    active = np.arange(missions)
+    clock = np.zeros(missions)
+    while len(active):
+        start = clock + scale * rng.weibull(shape, len(active))
+        end = start + rng.exponential(mttr, len(active))
+        failed = start < horizon
+        mission_ids.append(active[failed])
+        starts.append(start[failed])
+        ends.append(np.minimum(end[failed], horizon))
+        running = end < horizon
+        active = active[running]
+        clock = end[running]
+    return (
+        np.concatenate(mission_ids),
+        np.concatenate(starts),
+        np.concatenate(ends),
+    )
+
+
+def series_downtime(
+    mission_ids: np.ndarray,
+    starts: np.ndarray,
+    ends: np.ndarray,
+    missions: int,
+    horizon: float,
+) -> Tuple[np.ndarray, np.ndarray]:
+    if not len(starts):
+        return np.zeros(missions), np.zeros(missions, np.int64)
+    offset = mission_ids * (2.0 * horizon)
+    starts = starts + offset
+    order = np.argsort(starts)
+    starts = starts[order]
+    ends = ends[order] + offset[order]
+    mission_ids = mission_ids[order]
+    reach = np.maximum.accumulate(ends)
+    opens = np.empty(len(starts), dtype=bool)
+    opens[0] = True
+    opens[1:] = starts[1:] > reach[:-1]
+    first = np.flatnonzero(opens)
+    durations = np.maximum.reduceat(ends, first) - starts[first]
+    episodes = mission_ids[first]
+    return (
+        np.bincount(episodes, weights=durations, minlength=missions),
+        np.bincount(episodes, minlength=missions),
+    )
+
+
+def _down_states(
+    diagram: ReliabilityBlock,
+    up: Dict[str, np.ndarray],
+    size: int,
+) -> np.ndarray:
+    for name in block_organ_names(diagram):
+        up.setdefault(name, np.ones(size, dtype=bool))
+    return ~block_up(diagram, up)
+
+
+def diagram_downtime(
+    diagram: ReliabilityBlock,
+    organ_names: Sequence[str],
+    intervals: Sequence[Tuple[np.ndarray, np.ndarray, np.ndarray]],
+    missions: int,
+    horizon: float,
+) -> Tuple[np.ndarray, np.ndarray]:
+    offset = 2.0 * horizon
+    times = np.concatenate(
+        [np.empty(0)]
+        + [
+            mission_ids * offset + bound
+            for mission_ids, starts, ends in intervals
+            for bound in (starts, ends)
+        ]
+    )
+    if not len(times):
+        return np.zeros(missions), np.zeros(missions, np.int64)
+    organs = np.concatenate(
+        [
+            np.full(2 * len(mission_ids), organ, dtype=np.int64)
+            for organ, (mission_ids, _, _) in enumerate(intervals)
+        ]
+    )
+    signs = np.concatenate(
+        [
+            np.repeat([1, -1], len(mission_ids))
+            for mission_ids, _, _ in intervals
+        ]
+    )
+    order = np.argsort(times)
+    times = times[order]
+    organs = organs[order]
+    signs = signs[order]
+    if len(organ_names) <= STATE_TABLE_ORGANS:
+        states = np.arange(1 << len(organ_names))
+        down = _down_states(
+            diagram,
+            {
+                name: (states >> organ) & 1 == 0
+                for organ, name in enumerate(organ_names)
+            },
+            len(states),
+        )[np.cumsum(signs << organs)]
+    else:
+        down = _down_states(
+            diagram,
+            {
+                name: np.cumsum(np.where(organs == organ, signs, 0))
+                == 0
+                for organ, name in enumerate(organ_names)
+            },
+            len(times),
+        )
+    episodes = down & ~np.concatenate(([False], down[:-1]))
+    mission_of = (times // offset).astype(np.int64)
+    return (
+        np.bincount(
+            mission_of,
+            weights=np.where(down, np.diff(times, append=times[-1]), 0.0),
+            minlength=missions,
+        ),
+        np.bincount(mission_of[episodes], minlength=missions),
+    )
+
+
+def simulate_chunk(
+    models: Sequence[OrganFailureModel],
+    diagram: Optional[ReliabilityBlock],
+    missions: int,
+    horizon: float,
+    seed: np.random.SeedSequence,
+) -> Tuple[np.ndarray, np.ndarray]:
+    rng = np.random.default_rng(seed)
+    intervals = [
+        _down_intervals(
+            rng,
+            model["shape"],
+            model["scale"],
+            model["mttr"],
+            missions,
+            horizon,
+        )
+        for model in models
+    ]
+    if diagram is None:
+        downtime, failures = series_downtime(
+            *(
+                np.concatenate(
+                    [interval[i] for interval in intervals]
+                )
+                for i in range(3)
+            ),
+            missions,
+            horizon,
+        )
+    else:
+        downtime, failures = diagram_downtime(
+            diagram,
+            [model["name"] for model in models],
+            intervals,
+            missions,
+            horizon,
+        )
+    return downtime.astype(np.float32), failures.astype(np.int32)
+
+
+def _process_pool() -> Executor:
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            import multiprocessing
+            from concurrent.futures import ProcessPoolExecutor
+
+            _pool = ProcessPoolExecutor(
+                max_workers=SIMULATION_WORKERS,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return _pool
+
+
+def _mean_interval(
+    values: np.ndarray,
+) -> Tuple[float, float, float]:
+    mean = float(values.mean())
+    margin = (
+        CONFIDENCE_Z
+        * float(values.std(ddof=1))
+        / math.sqrt(len(values))
+        if len(values) > 1
+        else 0.0
+    )
+    return mean, mean - margin, mean + margin
+
+
+def summarize_simulation(
+    downtime: np.ndarray,
+    failures: np.ndarray,
+    horizon: float,
+    organ_count: int,
+) -> AvailabilitySimulation:
+    downtime = downtime.astype(np.float64)
+    availability = _mean_interval(1.0 - downtime / horizon)
+    failures_per_year = _mean_interval(
+        failures * (HOURS_PER_YEAR / horizon)
+    )
+    counts, edges = np.histogram(
+        downtime, bins=DOWNTIME_HISTOGRAM_BINS
+    )
+    p50, p95 = np.percentile(downtime, [50, 95])
+    return {
+        "missions": len(downtime),
+        "mission_hours": horizon,
+        "organ_count": organ_count,
+        "availability": availability[0],
+        "availability_low": max(0.0, availability[1]),
+        "availability_high": min(1.0, availability[2]),
+        "failures_per_year": failures_per_year[0],
+        "failures_per_year_low": max(0.0, failures_per_year[1]),
+        "failures_per_year_high": failures_per_year[2],
+        "downtime_mean": float(downtime.mean()),
+        "downtime_p50": float(p50),
+        "downtime_p95": float(p95),
+        "downtime_histogram": [
+            {
+                "heures": f"{left:.0f}-{right:.0f}",
+                "missions": int(count),
+            }
+            for left, right, count in zip(
+                edges[:-1], edges[1:], counts
+            )
+        ],
+    }
+
+
+def simulate_availability(
+    models: Sequence[OrganFailureModel],
+    missions: int,
+    horizon: float = HOURS_PER_YEAR,
+    seed: int = 0,
+    progress: Optional[Callable[[float], None]] = None,
+    parallel: bool = True,
+    diagram: Optional[ReliabilityBlock] = None,
+) -> AvailabilitySimulation:
+    if not models:
+        raise SimulationInputError(
+            "Aucun organe de ce compresseur n'a d'historique de pannes."
+        )
+    if missions < 2 or horizon <= 0:
+        raise SimulationInputError(
+            "Le nombre de missions et la durée doivent être positifs."
+        )
+    sizes = [
+        min(SIMULATION_CHUNK, missions - start)
+        for start in range(0, missions, SIMULATION_CHUNK)
+    ]
+    seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+    models = list(models)
+    results: List[Tuple[np.ndarray, np.ndarray]] = []
+    if parallel and SIMULATION_WORKERS > 1 and len(sizes) > 1:
+        pool = _process_pool()
+        futures: List[Future] = [
+            pool.submit(
+                simulate_chunk, models, diagram, size, horizon, child
+            )
+            for size, child in zip(sizes, seeds)
+        ]
+        try:
+            for future in futures:
+                results.append(future.result())
+                if progress is not None:
+                    progress(len(results) / len(sizes))
+        finally:
+            for future in futures:
+                future.cancel()
+    else:
+        for size, child in zip(sizes, seeds):
+            results.append(
+                simulate_chunk(models, diagram, size, horizon, child)
+            )
+            if progress is not None:
+                progress(len(results) / len(sizes))
+    return summarize_simulation(
+        np.concatenate([downtime for downtime, _ in results]),
+        np.concatenate([failures for _, failures in results]),
+        horizon,
+        len(models),
+    )
@@ -0,0 +1,239 @@
+from array import array
+from typing import Dict, Iterable, List, Optional, Tuple
+import bisect
+import datetime
+
+from tableau_de_bord_de_suivi_gpta.analytics.types import (
+    FailureLogEntry,
+    OrganAggregate,
+)
+
+DateWindow = Tuple[datetime.date, datetime.date]
+
+
+def year_window(year: int) -> DateWindow:
+    return datetime.date(year, 1, 1), datetime.date(year, 12, 31)
+
+
+def month_window(year: int, month: int) -> DateWindow:
+    start = datetime.date(year, month, 1)
+    if month == 12:
+        end = datetime.date(year, 12, 31)
+    else:
+        end = datetime.date(
+            year, month + 1, 1
+        ) - datetime.timedelta(days=1)
+    return start, end
+
+
+def _group_rows(
+    rows: Dict[str, List[Tuple[int, float, float]]],
+    logs: Iterable[FailureLogEntry],
+) -> None:
+    for log in logs:
+        rows.setdefault(log["organ_name"], []).append(
+            (
+                datetime.date.fromisoformat(
+                    log["failure_date"]
+                ).toordinal(),
+                float(log["uptime_since_last_failure"]),
+                float(log["repair_duration"]),
+            )
+        )
+
+
+class OrganTimeline:
+    def __init__(self):
+        self.dates = array("i")
+        self.uptime_prefix = array("d", [0.0])
+        self.repair_prefix = array("d", [0.0])
+
+    @classmethod
+    def from_rows(
+        cls, rows: List[Tuple[int, float, float]]
+    ) -> "OrganTimeline":
+        timeline = cls()
+        rows.sort(key=lambda row: row[0])
+        uptime_total = 0.0
+        repair_total = 0.0
+        for day, uptime, repair in rows:
+            uptime_total += uptime
+            repair_total += repair
+            timeline.dates.append(day)
+            timeline.uptime_prefix.append(uptime_total)
+            timeline.repair_prefix.append(repair_total)
+        return timeline
+
+    def __len__(self) -> int:
+        return len(self.dates)
+
+    def add(self, log: FailureLogEntry) -> None:
+        day = datetime.date.fromisoformat(
+            log["failure_date"]
+        ).toordinal()
+        uptime = float(log["uptime_since_last_failure"])
+        repair = float(log["repair_duration"])
+        position = bisect.bisect_right(self.dates, day)
+        self.dates.insert(position, day)
+        if position == len(self.dates) - 1:
+            self.uptime_prefix.append(
+                self.uptime_prefix[-1] + uptime
+            )
+            self.repair_prefix.append(
+                self.repair_prefix[-1] + repair
+            )
+            return
+        self.uptime_prefix.insert(
+            position + 1, self.uptime_prefix[position]
+        )
+        self.repair_prefix.insert(
+            position + 1, self.repair_prefix[position]
+        )
+        for i in range(position + 1, len(self.uptime_prefix)):
+            self.uptime_prefix[i] += uptime
+            self.repair_prefix[i] += repair
+
+    def extend(self, rows: List[Tuple[int, float, float]]) -> None:
+        rows.sort(key=lambda row: row[0])
+        if self.dates and rows[0][0] < self.dates[-1]:
+            rows = sorted(
+                [
+                    (
+                        day,
+                        self.uptime_prefix[i + 1]
+                        - self.uptime_prefix[i],
+                        self.repair_prefix[i + 1]
+                        - self.repair_prefix[i],
+                    )
+                    for i, day in enumerate(self.dates)
+                ]
+                + rows,
+                key=lambda row: row[0],
+            )
+            self.dates = array("i")
+            self.uptime_prefix = array("d", [0.0])
+            self.repair_prefix = array("d", [0.0])
+        uptime_total = self.uptime_prefix[-1]
+        repair_total = self.repair_prefix[-1]
+        for day, uptime, repair in rows:
+            uptime_total += uptime
+            repair_total += repair
+            self.dates.append(day)
+            self.uptime_prefix.append(uptime_total)
+            self.repair_prefix.append(repair_total)
+
+    def window(
+        self,
+        start: Optional[datetime.date] = None,
+        end: Optional[datetime.date] = None,
+    ) -> OrganAggregate:
+        lo = (
+            0
+            if start is None
+            else bisect.bisect_left(
+                self.dates, start.toordinal()
+            )
+        )
+        hi = (
+            len(self.dates)
+            if end is None
+            else bisect.bisect_right(
+                self.dates, end.toordinal()
+            )
+        )
+        hi = max(lo, hi)
+        return {
+            "failure_count": hi - lo,
+            "total_uptime": self.uptime_prefix[hi]
+            - self.uptime_prefix[lo],
+            "total_repair_duration": self.repair_prefix[hi]
+            - self.repair_prefix[lo],
+        }
+
+    def years(self) -> List[int]:
+        if not self.dates:
+            return []
+        first = datetime.date.fromordinal(self.dates[0]).year
+        last = datetime.date.fromordinal(self.dates[-1]).year
+        return list(range(first, last + 1))
+
+
+class TimelineIndex:
+    def __init__(self):
+        self.timelines: Dict[str, OrganTimeline] = {}
+        self.loaded = False
+        self.version = 0
+        self.source_version = ""
+
+    def load(
+        self,
+        batches: Iterable[List[FailureLogEntry]],
+        source_version: str = "",
+    ) -> None:
+        rows: Dict[str, List[Tuple[int, float, float]]] = {}
+        for batch in batches:
+            _group_rows(rows, batch)
+        self.timelines = {
+            organ_name: OrganTimeline.from_rows(organ_rows)
+            for organ_name, organ_rows in rows.items()
+        }
+        self.loaded = True
+        self.version += 1
+        self.source_version = source_version
+
+    def invalidate(self) -> None:
+        self.timelines = {}
+        self.loaded = False
+        self.version += 1
+
+    def add(self, log: FailureLogEntry) -> None:
+        timeline = self.timelines.get(log["organ_name"])
+        if timeline is None:
+            timeline = self.timelines[
+                log["organ_name"]
+            ] = OrganTimeline()
+        timeline.add(log)
+        self.version += 1
+
+    def extend(self, logs: List[FailureLogEntry]) -> None:
+        rows: Dict[str, List[Tuple[int, float, float]]] = {}
+        _group_rows(rows, logs)
+        for organ_name, organ_rows in rows.items():
+            timeline = self.timelines.get(organ_name)
+            if timeline is None:
+                timeline = self.timelines[
+                    organ_name
+                ] = OrganTimeline()
+            timeline.extend(organ_rows)
+        self.version += 1
+
+    def window(
+        self,
+        organ_name: str,
+        start: Optional[datetime.date] = None,
+        end: Optional[datetime.date] = None,
+    ) -> Optional[OrganAggregate]:
+        timeline = self.timelines.get(organ_name)
+        if timeline is None:
+            return None
+        aggregate = timeline.window(start, end)
+        return aggregate if aggregate["failure_count"] else None
+
+    def window_index(
+        self,
+        start: Optional[datetime.date] = None,
+        end: Optional[datetime.date] = None,
+    ) -> Dict[str, OrganAggregate]:
+        index: Dict[str, OrganAggregate] = {}
+        for organ_name in self.timelines:
+            aggregate = self.window(organ_name, start, end)
+            if aggregate is not None:
+                index[organ_name] = aggregate
+        return index
+
+    def years(self) -> List[int]:
+        years = set()
+        for timeline in self.timelines.values():
+            if timeline.dates:
+                years.update(timeline.years())
+        return sorted(years)
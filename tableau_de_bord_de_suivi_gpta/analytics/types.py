@@ -0,0 +1,177 @@
+from typing import Any, List, Optional, Tuple, TypedDict
+
+
+class Organ(TypedDict):
+    name: str
+    mtbf: Optional[float]
+    mttr: Optional[float]
+    lambda_val: Optional[float]
+    reliability_at_t: Optional[float]
+    availability: Optional[float]
+    preventive_maintenance_period: Optional[float]
+
+
+class OrganStatus(TypedDict):
+    name: str
+    status: str
+
+
+class FailureLogEntry(TypedDict):
+    organ_name: str
+    failure_date: str
+    uptime_since_last_failure: float
+    repair_duration: float
+    description: str
+
+
+class OrganAggregate(TypedDict):
+    failure_count: int
+    total_uptime: float
+    total_repair_duration: float
+
+
+class FailureHistoryPage(TypedDict):
+    entries: List[FailureLogEntry]
+    first_cursor: Optional[Tuple[Any, int]]
+    last_cursor: Optional[Tuple[Any, int]]
+    has_more: bool
+
+
+class WeibullFit(TypedDict):
+    shape: float
+    scale: float
+    sample_count: int
+
+
+class WeibullMetrics(TypedDict):
+    shape: Optional[float]
+    scale: Optional[float]
+    sample_count: int
+    reliability_at_t: Optional[float]
+    hazard_rate_at_t: Optional[float]
+    preventive_maintenance_period: Optional[float]
+
+
+class CurveSeries(TypedDict):
+    key: str
+    name: str
+    color: str
+
+
+class ParetoEntry(TypedDict):
+    name: str
+    pannes: int
+    cumulatif: float
+
+
+class OrganPlacement(TypedDict):
+    locomotive_name: Optional[str]
+    compressor_name: Optional[str]
+    organ_name: Optional[str]
+    organ_label: Optional[str]
+
+
+class HierarchyNode(TypedDict):
+    key: str
+    level: str
+    name: str
+    organ_name: Optional[str]
+
+
+class NodeRollup(TypedDict):
+    failure_count: int
+    failure_rate: float
+    repair_rate: float
+    log_availability: float
+
+
+class HierarchyNodeSummary(TypedDict):
+    key: str
+    level: str
+    name: str
+    organ_name: Optional[str]
+    child_count: int
+    failure_count: int
+    mtbf: Optional[float]
+    mttr: Optional[float]
+    availability: Optional[float]
+
+
+class OrganFailureModel(TypedDict):
+    name: str
+    shape: float
+    scale: float
+    mttr: float
+
+
+class DowntimeBin(TypedDict):
+    heures: str
+    missions: int
+
+
+class AvailabilitySimulation(TypedDict):
+    missions: int
+    mission_hours: float
+    organ_count: int
+    availability: float
+    availability_low: float
+    availability_high: float
+    failures_per_year: float
+    failures_per_year_low: float
+    failures_per_year_high: float
+    downtime_mean: float
+    downtime_p50: float
+    downtime_p95: float
+    downtime_histogram: List[DowntimeBin]
+
+
+class ReliabilityBlock(TypedDict):
+    kind: str
+    name: str
+    k: int
+    blocks: List["ReliabilityBlock"]
+
+
+class DiagramBlockRow(TypedDict):
+    name: str
+    kind: str
+    depth: int
+    reliability_at_t: Optional[float]
+
+
+class OrganImportance(TypedDict):
+    name: str
+    reliability_at_t: Optional[float]
+    birnbaum: Optional[float]
+
+
+class SystemReliability(TypedDict):
+    name: str
+    reliability_at_t: Optional[float]
+    mtbf: Optional[float]
+    unknown_organs: List[str]
+    blocks: List[DiagramBlockRow]
+    importance: List[OrganImportance]
+
+
+class MaintenanceCosts(TypedDict):
+    preventive_cost: float
+    corrective_cost: float
+
+
+class ReplacementPlan(TypedDict):
+    name: str
+    shape: float
+    scale: float
+    preventive_cost: float
+    corrective_cost: float
+    interval: Optional[float]
+    cost_rate: Optional[float]
+    run_to_failure_cost_rate: float
+    savings: Optional[float]
+
+
+class MaintenanceSlot(TypedDict):
+    date: str
+    organ_names: List[str]
+    organ_count: int
@@ -0,0 +1,273 @@
+from typing import (
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+)
+import math
+import threading
+
+import numpy as np
+
+from tableau_de_bord_de_suivi_gpta.analytics.constants import (
+    MIN_WEIBULL_SAMPLES,
+)
+from tableau_de_bord_de_suivi_gpta.analytics.time_index import (
+    DateWindow,
+)
+from tableau_de_bord_de_suivi_gpta.analytics.types import (
+    OrganAggregate,
+    WeibullFit,
+    WeibullMetrics,
+)
+
+SampleLoader = Callable[
+    [List[str], Optional[DateWindow]],
+    Tuple[List[str], List[float]],
+]
+FitVersion = Tuple[int, float]
+
+
+def fit_weibull_groups(
+    codes: np.ndarray,
+    samples: np.ndarray,
+    group_count: int,
+    max_iterations: int = 100,
+    tolerance: float = 1e-10,
+    min_samples: int = MIN_WEIBULL_SAMPLES,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    codes = np.asarray(codes)
+    samples = np.asarray(samples, dtype=np.float64)
+    valid = (codes >= 0) & (samples > 0)
+    codes = codes[valid]
+    log_x = np.log(samples[valid])
+    counts = np.bincount(codes, minlength=group_count)
+    safe_counts = np.maximum(counts, 1)
+    mean_log = (
+        np.bincount(codes, weights=log_x, minlength=group_count)
+        / safe_counts
+    )
+    centered = log_x - mean_log[codes]
+    variance = (
+        np.bincount(
+            codes, weights=centered**2, minlength=group_count
+        )
+        / safe_counts
+    )
+    fittable = (counts >= max(2, min_samples)) & (variance > 1e-12)
+    shape = np.full(group_count, np.nan)
+    scale = np.full(group_count, np.nan)
+    if not fittable.any():
+        return shape, scale, counts
+    rows = fittable[codes]
+    codes = codes[rows]
+    log_x = log_x[rows]
+    centered = centered[rows]
+    max_log = np.full(group_count, -np.inf)
+    np.maximum.at(max_log, codes, log_x)
+    shifted = log_x - max_log[codes]
+    beta = np.where(
+        fittable,
+        math.pi / np.sqrt(6 * np.where(fittable, variance, 1.0)),
+        1.0,
+    )
+    with np.errstate(divide="ignore", invalid="ignore"):
+        for _ in range(max_iterations):
+            weights = np.exp(beta[codes] * shifted)
+            s0 = np.bincount(
+                codes, weights=weights, minlength=group_count
+            )
+            s1 = np.bincount(
+                codes,
+                weights=weights * centered,
+                minlength=group_count,
+            )
+            s2 = np.bincount(
+                codes,
+                weights=weights * centered**2,
+                minlength=group_count,
+            )
+            ratio = np.where(fittable, s1 / s0, 0.0)
+            gradient = ratio - 1 / beta
+            slope = (
+                np.where(fittable, s2 / s0, 0.0)
+                - ratio**2
+                + 1 / beta**2
+            )
+            updated = beta - np.where(
+                fittable, gradient / slope, 0.0
+            )
+            updated = np.where(updated > 0, updated, beta / 2)
+            converged = np.all(
+                np.abs(updated - beta) <= tolerance * beta
+            )
+            beta = updated
+            if converged:
+                break
+        weights = np.exp(beta[codes] * shifted)
+        s0 = np.bincount(
+            codes, weights=weights, minlength=group_count
+        )
+        eta = np.exp(max_log) * (s0 / safe_counts) ** (
+            1 / beta
+        )
+    shape = np.where(fittable, beta, np.nan)
+    scale = np.where(fittable, eta, np.nan)
+    return shape, scale, counts
+
+
+def fit_weibull(
+    samples: Sequence[float], min_samples: int = MIN_WEIBULL_SAMPLES
+) -> Optional[WeibullFit]:
+    shape, scale, counts = fit_weibull_groups(
+        np.zeros(len(samples), dtype=np.int64),
+        np.asarray(samples, dtype=np.float64),
+        1,
+        min_samples=min_samples,
+    )
+    if math.isnan(shape[0]):
+        return None
+    return {
+        "shape": float(shape[0]),
+        "scale": float(scale[0]),
+        "sample_count": int(counts[0]),
+    }
+
+
+def weibull_reliability(
+    t: float, shape: float, scale: float
+) -> float:
+    if t <= 0:
+        return 1.0
+    return math.exp(-((t / scale) ** shape))
+
+
+def weibull_hazard_rate(
+    t: float, shape: float, scale: float
+) -> Optional[float]:
+    if t <= 0:
+        if shape < 1:
+            return None
+        return 1 / scale if shape == 1 else 0.0
+    return shape / scale * (t / scale) ** (shape - 1)
+
+
+def weibull_metrics(
+    fit: Optional[WeibullFit],
+    target_uptime_t: float,
+    min_reliability_threshold: float,
+) -> WeibullMetrics:
+    if fit is None:
+        return {
+            "shape": None,
+            "scale": None,
+            "sample_count": 0,
+            "reliability_at_t": None,
+            "hazard_rate_at_t": None,
+            "preventive_maintenance_period": None,
+        }
+    shape = fit["shape"]
+    scale = fit["scale"]
+    preventive_maintenance_period: Optional[float] = None
+    if min_reliability_threshold > 0:
+        clamped_r = max(
+            1e-06, min(0.999999, min_reliability_threshold)
+        )
+        preventive_maintenance_period = scale * (
+            -math.log(clamped_r)
+        ) ** (1 / shape)
+    return {
+        "shape": shape,
+        "scale": scale,
+        "sample_count": fit["sample_count"],
+        "reliability_at_t": weibull_reliability(
+            target_uptime_t, shape, scale
+        ),
+        "hazard_rate_at_t": weibull_hazard_rate(
+            target_uptime_t, shape, scale
+        ),
+        "preventive_maintenance_period": preventive_maintenance_period,
+    }
+
+
+def fit_version(aggregate: Optional[OrganAggregate]) -> FitVersion:
+    if aggregate is None:
+        return (0, 0.0)
+    return (aggregate["failure_count"], aggregate["total_uptime"])
+
+
+class WeibullFitCache:
+    def __init__(self):
+        self._fits: Dict[
+            str,
+            Tuple[
+                FitVersion,
+                Dict[Optional[DateWindow], Optional[WeibullFit]],
+            ],
+        ] = {}
+        self._lock = threading.Lock()
+
+    def fits(
+        self,
+        organ_names: Sequence[str],
+        aggregates: Mapping[str, OrganAggregate],
+        window: Optional[DateWindow],
+        load_samples: SampleLoader,
+    ) -> Dict[str, Optional[WeibullFit]]:
+        versions = {
+            name: fit_version(aggregates.get(name))
+            for name in organ_names
+        }
+        fits: Dict[str, Optional[WeibullFit]] = {}
+        with self._lock:
+            for name in organ_names:
+                entry = self._fits.get(name)
+                if (
+                    entry is not None
+                    and entry[0] == versions[name]
+                    and window in entry[1]
+                ):
+                    fits[name] = entry[1][window]
+        missing = [name for name in organ_names if name not in fits]
+        if missing:
+            import pandas as pd
+
+            names, samples = load_samples(missing, window)
+            shape, scale, counts = fit_weibull_groups(
+                pd.Categorical(names, categories=missing).codes,
+                np.asarray(samples, dtype=np.float64),
+                len(missing),
+            )
+            with self._lock:
+                for i, name in enumerate(missing):
+                    fits[name] = (
+                        None
+                        if math.isnan(shape[i])
+                        else {
+                            "shape": float(shape[i]),
+                            "scale": float(scale[i]),
+                            "sample_count": int(counts[i]),
+                        }
+                    )
+                    entry = self._fits.get(name)
+                    if entry is None or entry[0] != versions[name]:
+                        entry = (versions[name], {})
+                        self._fits[name] = entry
+                    entry[1][window] = fits[name]
+        return {name: fits[name] for name in organ_names}
+
+    def invalidate(self, organ_names: Iterable[str]) -> None:
+        with self._lock:
+            for name in organ_names:
+                self._fits.pop(name, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._fits.clear()
+
+    def __len__(self) -> int:
+        return len(self._fits)
@@ -0,0 +1,126 @@
+from typing import Iterator, List
+import urllib.parse
+
+from fastapi import APIRouter, HTTPException
+from fastapi.responses import StreamingResponse
+
+from tableau_de_bord_de_suivi_gpta.analytics.aggregates import (
+    metrics_from_aggregate,
+)
+from tableau_de_bord_de_suivi_gpta.analytics.types import Organ
+from tableau_de_bord_de_suivi_gpta.db.repository import (
+    iter_failure_log_batches,
+    load_organ_aggregates,
+    load_organ_names,
+)
+from tableau_de_bord_de_suivi_gpta.exports.streaming import (
+    iter_failure_logs_parquet,
+    iter_fleet_report_csv,
+    iter_organ_report_csv,
+    iter_organs_parquet,
+)
+
+router = APIRouter(prefix="/export")
+
+CSV_MEDIA_TYPE = "text/csv; charset=utf-8"
+PARQUET_MEDIA_TYPE = "application/vnd.apache.parquet"
+
+
+def _clamp_parameters(t: float, r: float):
+    target_uptime_t = t if t >= 0 else 0.0
+    if r > 1:
+        r = 1.0
+    elif r <= 0:
+        r = 1e-06
+    return target_uptime_t, r
+
+
+def _attachment(
+    content: Iterator[bytes], media_type: str, filename: str
+) -> StreamingResponse:
+    return StreamingResponse(
+        content,
+        media_type=media_type,
+        headers={
+            "Content-Disposition": "attachment; filename*=UTF-8''"
+            + urllib.parse.quote(filename)
+        },
+    )
+
+
+def _fleet_metrics(t: float, r: float) -> List[Organ]:
+    from tableau_de_bord_de_suivi_gpta.analytics.fleet_engine import (
+        aggregate_columns,
+        compute_fleet_metrics,
+    )
+
+    target_uptime_t, threshold = _clamp_parameters(t, r)
+    organ_names = load_organ_names()
+    return compute_fleet_metrics(
+        organ_names,
+        *aggregate_columns(
+            load_organ_aggregates(), organ_names
+        ),
+        target_uptime_t,
+        threshold,
+    )
+
+
+@router.get("/organ.csv")
+def export_organ_csv(
+    name: str,
+    t: float = 1000.0,
+    r: float = 0.95,
+    filename: str = "rapport.csv",
+) -> StreamingResponse:
+    if name not in load_organ_names():
+        raise HTTPException(
+            status_code=404, detail="Organe inconnu."
+        )
+    target_uptime_t, threshold = _clamp_parameters(t, r)
+    details = metrics_from_aggregate(
+        name,
+        load_organ_aggregates(name).get(name),
+        target_uptime_t,
+        threshold,
+    )
+    return _attachment(
+        iter_organ_report_csv(
+            details, iter_failure_log_batches(name)
+        ),
+        CSV_MEDIA_TYPE,
+        filename,
+    )
+
+
+@router.get("/fleet.csv")
+def export_fleet_csv(
+    t: float = 1000.0, r: float = 0.95
+) -> StreamingResponse:
+    return _attachment(
+        iter_fleet_report_csv(
+            _fleet_metrics(t, r), iter_failure_log_batches()
+        ),
+        CSV_MEDIA_TYPE,
+        "flotte_rapport.csv",
+    )
+
+
+@router.get("/fleet_metrics.parquet")
+def export_fleet_metrics_parquet(
+    t: float = 1000.0, r: float = 0.95
+) -> StreamingResponse:
+    return _attachment(
+        iter_organs_parquet(_fleet_metrics(t, r)),
+        PARQUET_MEDIA_TYPE,
+        "flotte_metriques.parquet",
+    )
+
+
+@router.get("/failure_logs.parquet")
+def export_failure_logs_parquet() -> StreamingResponse:
+    return _attachment(
+        iter_failure_logs_parquet(iter_failure_log_batches()),
+        PARQUET_MEDIA_TYPE,
+        "historique_pannes.parquet",
+    )
@@ -0,0 +1,142 @@
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, List, Optional
+import asyncio
+import logging
+import queue
+import threading
+
+from fastapi import APIRouter, HTTPException, Request
+from starlette.concurrency import run_in_threadpool
+
+from tableau_de_bord_de_suivi_gpta.analytics.aggregates import (
+    build_aggregate_index,
+)
+from tableau_de_bord_de_suivi_gpta.analytics.types import (
+    FailureLogEntry,
+)
+from tableau_de_bord_de_suivi_gpta.db.repository import (
+    insert_failure_log_batch,
+)
+from tableau_de_bord_de_suivi_gpta.ingestion.batches import (
+    RECORD_ACCEPTED,
+    BatchPayloadError,
+    BatchTooLargeError,
+    UnsupportedMediaTypeError,
+    decode_batch,
+    validate_batch,
+)
+from tableau_de_bord_de_suivi_gpta.states.gpta_state import (
+    fleet_store,
+    get_weibull_fits,
+)
+
+router = APIRouter(prefix="/ingest")
+logger = logging.getLogger(__name__)
+
+INGESTION_QUEUE_SIZE = 8
+INGESTION_RETRY_AFTER = 2
+
+BatchApplier = Callable[[List[FailureLogEntry]], str]
+
+
+class IngestionQueue:
+    def __init__(self, apply: BatchApplier, size: int):
+        self._apply = apply
+        self._queue: queue.Queue = queue.Queue(maxsize=size)
+        self._worker: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    def _run(self) -> None:
+        while True:
+            entries, future = self._queue.get()
+            try:
+                if future.set_running_or_notify_cancel():
+                    try:
+                        future.set_result(self._apply(entries))
+                    except Exception as e:
+                        future.set_exception(e)
+            finally:
+                self._queue.task_done()
+
+    def submit(self, entries: List[FailureLogEntry]) -> Future:
+        with self._lock:
+            if self._worker is None:
+                self._worker = threading.Thread(
+                    target=self._run,
+                    name="gpta-ingestion",
+                    daemon=True,
+                )
+                self._worker.start()
+        future: Future = Future()
+        self._queue.put_nowait((entries, future))
+        return future
+
+
+def apply_failure_log_batch(entries: List[FailureLogEntry]) -> str:
+    fleet_store.ensure_loaded()
+    insert_failure_log_batch(entries)
+    delta = build_aggregate_index(entries)
+    version = fleet_store.record_import(delta, entries)
+    get_weibull_fits().invalidate(delta)
+    return version
+
+
+_ingestion_queue: Optional[IngestionQueue] = None
+_ingestion_queue_lock = threading.Lock()
+
+
+def get_ingestion_queue() -> IngestionQueue:
+    global _ingestion_queue
+    with _ingestion_queue_lock:
+        if _ingestion_queue is None:
+            _ingestion_queue = IngestionQueue(
+                apply_failure_log_batch, INGESTION_QUEUE_SIZE
+            )
+        return _ingestion_queue
+
+
+@router.post("/failure_logs")
+async def ingest_failure_logs(request: Request) -> Dict[str, Any]:
+    try:
+        records = decode_batch(
+            await request.body(),
+            request.headers.get("content-type", ""),
+        )
+    except UnsupportedMediaTypeError as e:
+        raise HTTPException(status_code=415, detail=str(e))
+    except BatchTooLargeError as e:
+        raise HTTPException(status_code=413, detail=str(e))
+    except BatchPayloadError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    known_organs = await run_in_threadpool(fleet_store.organ_name_lookup)
+    entries, results = await run_in_threadpool(
+        validate_batch, records, known_organs
+    )
+    version = fleet_store.version
+    if entries:
+        try:
+            future = get_ingestion_queue().submit(entries)
+        except queue.Full:
+            raise HTTPException(
+                status_code=429,
+                detail="File d'ingestion saturée, réessayez plus tard.",
+                headers={"Retry-After": str(INGESTION_RETRY_AFTER)},
+            )
+        try:
+            version = await asyncio.wrap_future(future)
+        except Exception:
+            logger.exception("Échec de l'enregistrement d'un lot")
+            raise HTTPException(
+                status_code=500,
+                detail="Erreur lors de l'enregistrement du lot.",
+            )
+    return {
+        "accepted": sum(
+            result["status"] == RECORD_ACCEPTED for result in results
+        ),
+        "rejected": sum(
+            result["status"] != RECORD_ACCEPTED for result in results
+        ),
+        "version": version,
+        "results": results,
+    }
@@ -0,0 +1,17 @@
+from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+
+from tableau_de_bord_de_suivi_gpta.monitoring.metrics import (
+    registry,
+)
+
+router = APIRouter()
+
+PROMETHEUS_MEDIA_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+@router.get("/metrics")
+def metrics() -> PlainTextResponse:
+    return PlainTextResponse(
+        registry.render(), media_type=PROMETHEUS_MEDIA_TYPE
+    )
@@ -0,0 +1,204 @@
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Optional, Tuple
+import contextlib
+import hashlib
+import pickle
+import threading
+import time
+
+METRICS_CACHE_TTL = 600
+METRICS_CACHE_SIZE = 4096
+METRICS_CACHE_PREFIX = "gpta:metrics:"
+LOCK_STRIPES = 64
+
+
+class MetricsCache(ABC):
+    def __init__(self):
+        self._compute_locks = [
+            threading.Lock() for _ in range(LOCK_STRIPES)
+        ]
+
+    @abstractmethod
+    def get(self, key: Hashable) -> Optional[Any]:
+        ...
+
+    @abstractmethod
+    def set(self, key: Hashable, value: Any) -> None:
+        ...
+
+    @abstractmethod
+    def clear(self) -> None:
+        ...
+
+    def _compute_lock(self, key: Hashable):
+        return self._compute_locks[hash(key) % LOCK_STRIPES]
+
+    def get_or_compute(
+        self, key: Hashable, compute: Callable[[], Any]
+    ) -> Any:
+        value = self.get(key)
+        if value is not None:
+            return value
+        with self._compute_lock(key):
+            value = self.get(key)
+            if value is None:
+                value = compute()
+                self.set(key, value)
+        return value
+
+
+class InProcessMetricsCache(MetricsCache):
+    def __init__(
+        self,
+        maxsize: int = METRICS_CACHE_SIZE,
+        ttl: float = METRICS_CACHE_TTL,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        super().__init__()
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._clock = clock
+        self._entries: "OrderedDict[Hashable, Tuple[float, bytes]]" = (
+            OrderedDict()
+        )
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, payload = entry
+            if expires_at <= self._clock():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+        return pickle.loads(payload)
+
+    def set(self, key: Hashable, value: Any) -> None:
+        payload = pickle.dumps(
+            value, protocol=pickle.HIGHEST_PROTOCOL
+        )
+        with self._lock:
+            self._entries[key] = (
+                self._clock() + self.ttl,
+                payload,
+            )
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class RedisMetricsCache(MetricsCache):
+    def __init__(
+        self,
+        client,
+        ttl: float = METRICS_CACHE_TTL,
+        prefix: str = METRICS_CACHE_PREFIX,
+    ):
+        super().__init__()
+        self._client = client
+        self.ttl = ttl
+        self.prefix = prefix
+
+    def _redis_key(self, key: Hashable) -> str:
+        return (
+            self.prefix
+            + hashlib.sha1(repr(key).encode("utf-8")).hexdigest()
+        )
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        from redis.exceptions import RedisError
+
+        try:
+            payload = self._client.get(self._redis_key(key))
+        except RedisError:
+            return None
+        if payload is None:
+            return None
+        return pickle.loads(payload)
+
+    def set(self, key: Hashable, value: Any) -> None:
+        from redis.exceptions import RedisError
+
+        try:
+            self._client.set(
+                self._redis_key(key),
+                pickle.dumps(
+                    value, protocol=pickle.HIGHEST_PROTOCOL
+                ),
+                ex=int(self.ttl),
+            )
+        except RedisError:
+            pass
+
+    def clear(self) -> None:
+        from redis.exceptions import RedisError
+
+        try:
+            for redis_key in self._client.scan_iter(
+                match=self.prefix + "*"
+            ):
+                self._client.delete(redis_key)
+        except RedisError:
+            pass
+
+    @contextlib.contextmanager
+    def _shared_lock(self, key: Hashable):
+        from redis.exceptions import LockError, RedisError
+
+        lock = self._client.lock(
+            self._redis_key(key) + ":lock",
+            timeout=60,
+            blocking_timeout=60,
+        )
+        try:
+            acquired = lock.acquire()
+        except RedisError:
+            acquired = False
+        try:
+            yield
+        finally:
+            if acquired:
+                with contextlib.suppress(LockError, RedisError):
+                    lock.release()
+
+    def get_or_compute(
+        self, key: Hashable, compute: Callable[[], Any]
+    ) -> Any:
+        value = self.get(key)
+        if value is not None:
+            return value
+        with self._compute_lock(key), self._shared_lock(key):
+            value = self.get(key)
+            if value is None:
+                value = compute()
+                self.set(key, value)
+        return value
+
+
+_metrics_cache: Optional[MetricsCache] = None
+_metrics_cache_lock = threading.Lock()
+
+
+def get_metrics_cache() -> MetricsCache:
+    global _metrics_cache
+    with _metrics_cache_lock:
+        if _metrics_cache is None:
+            from reflex.utils.prerequisites import get_redis_sync
+
+            client = get_redis_sync()
+            _metrics_cache = (
+                InProcessMetricsCache()
+                if client is None
+                else RedisMetricsCache(client)
+            )
+        return _metrics_cache
@@ -1,5 +1,8 @@
 import reflex as rx
-from tableau_de_bord_de_suivi_gpta.states.gpta_state import GptaState
+from tableau_de_bord_de_suivi_gpta.states.gpta_state import (
+    CurveSeries,
+    GptaState,
+)
 from typing import List, Dict, Any
 
 
@@ -74,12 +77,60 @@ def pareto_chart_component() -> rx.Component:
     )
 
 
+def reliability_curve_line(
+    series: rx.Var[CurveSeries],
+) -> rx.Component:
+    return rx.recharts.line(
+        type="monotone",
+        data_key=series["key"],
+        name=series["name"],
+        stroke=series["color"],
+        stroke_width=2,
+        dot=False,
+        is_animation_active=False,
+    )
+
+
+def compared_organ_chip(organ_name: rx.Var[str]) -> rx.Component:
+    return rx.el.button(
+        organ_name,
+        " ×",
+        on_click=lambda: GptaState.toggle_compared_organ(
+            organ_name
+        ),
+        class_name="px-2 py-0.5 text-xs text-gray-700 bg-gray-100 rounded-full hover:bg-gray-200",
+    )
+
+
+def reliability_comparison_picker() -> rx.Component:
+    return rx.el.div(
+        rx.el.select(
+            rx.el.option("Comparer avec...", value=""),
+            rx.foreach(
+                GptaState.organs,
+                lambda organ: rx.el.option(
+                    organ["name"], value=organ["name"]
+                ),
+            ),
+            value="",
+            on_change=GptaState.toggle_compared_organ,
+            class_name="p-1 border border-gray-300 rounded-md text-sm",
+        ),
+        rx.foreach(
+            GptaState.compared_organ_names,
+            compared_organ_chip,
+        ),
+        class_name="flex flex-wrap items-center gap-2 mb-3",
+    )
+
+
 def reliability_curve_chart() -> rx.Component:
     return rx.el.div(
         rx.el.h3(
             f"Courbe de Fiabilité R(t) pour {GptaState.selected_organ_name}",
             class_name="text-lg font-medium text-gray-700 mb-3",
         ),
+        reliability_comparison_picker(),
         rx.recharts.line_chart(
             rx.recharts.cartesian_grid(
                 stroke_dasharray="3 3"
@@ -108,13 +159,9 @@ def reliability_curve_chart() -> rx.Component:
                 formatter="(value, name) => [value.toFixed(4), name]"
             ),
             rx.recharts.legend(),
-            rx.recharts.line(
-                type="monotone",
-                data_key="fiabilite",
-                name="Fiabilité",
-                stroke="#F68B1E",
-                stroke_width=2,
-                dot=False,
+            rx.foreach(
+                GptaState.reliability_curve_series,
+                reliability_curve_line,
             ),
             data=GptaState.reliability_curve_data_selected_organ,
             height=300,
@@ -165,4 +212,48 @@ def mtbf_mttr_bar_chart() -> rx.Component:
             },
         ),
         class_name="p-4 bg-white rounded-lg shadow border border-gray-200 mt-6",
-    )
\ No newline at end of file
+    )
+
+def downtime_histogram_chart() -> rx.Component:
+    return rx.el.div(
+        rx.el.h4(
+            "Distribution de l'indisponibilité par mission",
+            class_name="text-sm font-medium text-gray-700 mb-3",
+        ),
+        rx.recharts.bar_chart(
+            rx.recharts.cartesian_grid(
+                stroke_dasharray="3 3"
+            ),
+            rx.recharts.x_axis(
+                data_key="heures",
+                angle=-30,
+                text_anchor="end",
+                height=60,
+            ),
+            rx.recharts.y_axis(
+                label={
+                    "value": "Missions",
+                    "angle": -90,
+                    "position": "insideLeft",
+                    "fill": "#6B7280",
+                }
+            ),
+            rx.recharts.tooltip(),
+            rx.recharts.bar(
+                data_key="missions",
+                name="Missions",
+                fill="#F68B1E",
+            ),
+            data=GptaState.availability_simulation[
+                "downtime_histogram"
+            ],
+            height=260,
+            margin={
+                "top": 5,
+                "right": 20,
+                "bottom": 5,
+                "left": 20,
+            },
+        ),
+        class_name="p-4 bg-white rounded-lg shadow border border-gray-200 mt-4",
+    )
@@ -1,27 +1,45 @@
 import reflex as rx
 from tableau_de_bord_de_suivi_gpta.states.gpta_state import (
+    AvailabilitySimulation,
+    DiagramBlockRow,
     GptaState,
     FailureLogEntry,
+    HierarchyNodeSummary,
+    MaintenanceSlot,
+    OrganImportance,
     Organ,
+    ReplacementPlan,
+    SystemReliability,
+    WeibullMetrics,
 )
 from tableau_de_bord_de_suivi_gpta.components.charts import (
+    downtime_histogram_chart,
     reliability_curve_chart,
     mtbf_mttr_bar_chart,
     pareto_chart_component,
 )
-from typing import Optional
+from tableau_de_bord_de_suivi_gpta.analytics.hierarchy import (
+    LEVEL_COMPRESSOR,
+)
+from tableau_de_bord_de_suivi_gpta.analytics.constants import (
+    BLOCK_K_OUT_OF_N,
+    BLOCK_PARALLEL,
+    BLOCK_SERIES,
+    MIN_WEIBULL_SAMPLES,
+)
+from tableau_de_bord_de_suivi_gpta.components.sidebar import (
+    hierarchy_breadcrumb,
+)
+from typing import Callable, Optional, Tuple
 
 
-def metric_card(
-    title: str,
+def format_metric(
     value: rx.Var[float | None],
     unit: str = "",
     is_percentage: bool = False,
     precision: int = 2,
-    alert_style: Optional[rx.Var[str]] = None,
-) -> rx.Component:
-    value_p_class = alert_style if alert_style is not None else "text-indigo-600 text-2xl font-semibold mt-1"
-    display_value = rx.cond(
+) -> rx.Var[str]:
+    return rx.cond(
         value.is_none(),
         "N/A",
         rx.cond(
@@ -30,6 +48,20 @@ def metric_card(
             f"{{:.{precision}f}}".format(value.to(float)) + (f" {unit}" if unit else ""),
         ),
     )
+
+
+def metric_card(
+    title: str,
+    value: rx.Var[float | None],
+    unit: str = "",
+    is_percentage: bool = False,
+    precision: int = 2,
+    alert_style: Optional[rx.Var[str]] = None,
+) -> rx.Component:
+    value_p_class = alert_style if alert_style is not None else "text-indigo-600 text-2xl font-semibold mt-1"
+    display_value = format_metric(
+        value, unit, is_percentage, precision
+    )
     return rx.el.div(
         rx.el.h4(
             title,
@@ -68,6 +100,269 @@ def failure_log_table_row(
     )
 
 
+def failure_history_pagination() -> rx.Component:
+    return rx.el.div(
+        rx.el.div(
+            rx.el.label(
+                "Trier par:",
+                class_name="text-sm text-gray-600",
+            ),
+            rx.el.select(
+                rx.el.option("Date", value="date"),
+                rx.el.option(
+                    "Durée de réparation", value="duration"
+                ),
+                value=GptaState.history_sort_by,
+                on_change=GptaState.set_history_sort_by,
+                class_name="p-1 border border-gray-300 rounded-md text-sm",
+            ),
+            rx.el.button(
+                rx.cond(
+                    GptaState.history_sort_descending,
+                    "Décroissant",
+                    "Croissant",
+                ),
+                on_click=GptaState.toggle_history_sort_direction,
+                class_name="px-2 py-1 text-sm text-gray-700 bg-gray-100 rounded-md hover:bg-gray-200",
+            ),
+            rx.el.label(
+                "Par page:",
+                class_name="ml-4 text-sm text-gray-600",
+            ),
+            rx.el.select(
+                *[
+                    rx.el.option(str(size), value=str(size))
+                    for size in (10, 20, 50, 100)
+                ],
+                value=GptaState.history_page_size.to_string(),
+                on_change=GptaState.set_history_page_size,
+                class_name="p-1 border border-gray-300 rounded-md text-sm",
+            ),
+            class_name="flex items-center gap-2",
+        ),
+        rx.el.div(
+            rx.el.button(
+                "Précédent",
+                on_click=GptaState.previous_history_page,
+                disabled=GptaState.history_page_number <= 1,
+                class_name="px-3 py-1 text-sm text-gray-700 bg-gray-100 rounded-md hover:bg-gray-200 disabled:opacity-50",
+            ),
+            rx.el.span(
+                f"Page {GptaState.history_page_number} sur {GptaState.history_page_count} ({GptaState.selected_organ_failure_count} pannes)",
+                class_name="text-sm text-gray-600",
+            ),
+            rx.el.button(
+                "Suivant",
+                on_click=GptaState.next_history_page,
+                disabled=~GptaState.history_has_next_page,
+                class_name="px-3 py-1 text-sm text-gray-700 bg-gray-100 rounded-md hover:bg-gray-200 disabled:opacity-50",
+            ),
+            class_name="flex items-center gap-2",
+        ),
+        class_name="flex justify-between items-center px-4 py-3 border-t border-gray-200",
+    )
+
+
+def weibull_model_section() -> rx.Component:
+    weibull: rx.Var[WeibullMetrics | None] = (
+        GptaState.selected_organ_weibull
+    )
+    return rx.el.div(
+        rx.el.h4(
+            "Modèle de Weibull",
+            class_name="text-md font-medium text-gray-700 mb-2",
+        ),
+        rx.cond(
+            weibull["shape"].is_none(),
+            rx.el.p(
+                f"Au moins {MIN_WEIBULL_SAMPLES} pannes de durées différentes sont nécessaires pour ajuster le modèle de Weibull.",
+                class_name="text-sm text-gray-500",
+            ),
+            rx.el.div(
+                metric_card(
+                    "Paramètre de forme (β)",
+                    weibull["shape"],
+                    precision=3,
+                ),
+                metric_card(
+                    "Paramètre d'échelle (η)",
+                    weibull["scale"],
+                    "heures",
+                ),
+                metric_card(
+                    f"Fiabilité Weibull R(t={GptaState.target_uptime_t.to(float):.0f}h)",
+                    weibull["reliability_at_t"],
+                    is_percentage=True,
+                ),
+                metric_card(
+                    "Taux de Défaillance h(t)",
+                    weibull["hazard_rate_at_t"],
+                    precision=6,
+                ),
+                metric_card(
+                    "Période Maintenance Préventive (Weibull)",
+                    weibull["preventive_maintenance_period"],
+                    "heures",
+                ),
+                class_name="grid grid-cols-1 md:grid-cols-2 lg:grid-cols-3 gap-4",
+            ),
+        ),
+        class_name="mb-6",
+    )
+
+
+def maintenance_cost_input(
+    label: str,
+    value: rx.Var[float],
+    on_change,
+) -> rx.Component:
+    return rx.el.div(
+        rx.el.label(label, class_name="text-sm text-gray-600 mr-2"),
+        rx.el.input(
+            type="number",
+            min="0",
+            step="100",
+            key=GptaState.selected_organ_name,
+            default_value=value.to_string(),
+            on_blur=on_change,
+            class_name="w-32 p-2 border border-gray-300 rounded-md text-sm",
+        ),
+        class_name="flex items-center",
+    )
+
+
+def replacement_plan_section() -> rx.Component:
+    costs = GptaState.selected_organ_maintenance_costs
+    plan: rx.Var[ReplacementPlan | None] = (
+        GptaState.selected_organ_replacement_plan
+    )
+    return rx.el.div(
+        rx.el.h4(
+            "Remplacement préventif optimal",
+            class_name="text-md font-medium text-gray-700 mb-2",
+        ),
+        rx.el.div(
+            maintenance_cost_input(
+                "Coût préventif",
+                costs["preventive_cost"],
+                GptaState.set_preventive_cost,
+            ),
+            maintenance_cost_input(
+                "Coût correctif",
+                costs["corrective_cost"],
+                GptaState.set_corrective_cost,
+            ),
+            class_name="flex flex-wrap gap-4 mb-4",
+        ),
+        rx.cond(
+            plan.is_none(),
+            rx.el.p(
+                "Le modèle de Weibull de cet organe n'est pas encore ajusté.",
+                class_name="text-sm text-gray-500",
+            ),
+            rx.cond(
+                plan["interval"].is_none(),
+                rx.el.p(
+                    "Aucun remplacement préventif n'est rentable: le taux de défaillance ne croît pas (β ≤ 1) ou le coût correctif ne dépasse pas suffisamment le coût préventif. Coût en fonctionnement jusqu'à la panne: ",
+                    format_metric(
+                        plan["run_to_failure_cost_rate"],
+                        "par heure",
+                        precision=4,
+                    ),
+                    class_name="text-sm text-gray-500",
+                ),
+                rx.el.div(
+                    metric_card(
+                        "Intervalle de remplacement optimal",
+                        plan["interval"],
+                        "heures",
+                        precision=0,
+                    ),
+                    metric_card(
+                        "Coût par heure (préventif)",
+                        plan["cost_rate"],
+                        precision=4,
+                    ),
+                    metric_card(
+                        "Économie vs. panne",
+                        plan["savings"],
+                        is_percentage=True,
+                        precision=1,
+                    ),
+                    class_name="grid grid-cols-1 md:grid-cols-3 gap-4",
+                ),
+            ),
+        ),
+        class_name="mb-6",
+    )
+
+
+def maintenance_slot_row(
+    slot: rx.Var[MaintenanceSlot],
+) -> rx.Component:
+    return rx.el.tr(
+        rx.el.td(
+            slot["date"],
+            class_name="px-4 py-2 whitespace-nowrap text-sm text-gray-700",
+        ),
+        rx.el.td(
+            slot["organ_names"].join(", "),
+            class_name="px-4 py-2 text-sm text-gray-600",
+        ),
+        rx.el.td(
+            slot["organ_count"],
+            class_name="px-4 py-2 text-sm text-gray-700 text-right",
+        ),
+    )
+
+
+def maintenance_calendar_panel() -> rx.Component:
+    return rx.el.div(
+        rx.el.div(
+            rx.el.h3(
+                "Calendrier de maintenance préventive "
+                + GptaState.maintenance_calendar_year.to_string(),
+                class_name="text-lg font-medium text-gray-700",
+            ),
+            rx.el.div(
+                rx.el.label(
+                    "Heures de service par jour",
+                    class_name="text-sm text-gray-600 mr-2",
+                ),
+                rx.el.input(
+                    type="number",
+                    min="1",
+                    max="24",
+                    default_value=GptaState.operating_hours_per_day.to_string(),
+                    on_change=GptaState.set_operating_hours_per_day.debounce(
+                        500
+                    ),
+                    class_name="w-20 p-2 border border-gray-300 rounded-md text-sm",
+                ),
+                class_name="flex items-center",
+            ),
+            class_name="flex flex-wrap justify-between items-center gap-3 mb-3",
+        ),
+        rx.cond(
+            GptaState.maintenance_calendar.length() > 0,
+            reliability_table(
+                (
+                    ("Date", "left"),
+                    ("Organes", "left"),
+                    ("Interventions", "right"),
+                ),
+                GptaState.maintenance_calendar,
+                maintenance_slot_row,
+            ),
+            rx.el.p(
+                "Aucune intervention préventive rentable pour cette année.",
+                class_name="text-sm text-gray-500",
+            ),
+        ),
+        class_name="w-full max-w-4xl mx-auto text-left",
+    )
+
+
 def organ_detail_view() -> rx.Component:
     details: rx.Var[Organ | None] = (
         GptaState.selected_organ_details
@@ -82,6 +377,7 @@ def organ_detail_view() -> rx.Component:
         "text-red-600 animate-pulse text-2xl font-semibold mt-1",
     )
     return rx.el.div(
+        rx.el.div(hierarchy_breadcrumb(), class_name="mb-2"),
         rx.el.div(
             rx.el.h3(
                 "Détails pour: ",
@@ -170,6 +466,8 @@ def organ_detail_view() -> rx.Component:
             ),
             class_name="grid grid-cols-1 md:grid-cols-2 lg:grid-cols-3 gap-4 mb-6",
         ),
+        weibull_model_section(),
+        replacement_plan_section(),
         rx.el.div(
             reliability_curve_chart(),
             mtbf_mttr_bar_chart(),
@@ -214,11 +512,11 @@ def organ_detail_view() -> rx.Component:
                     ),
                     rx.el.tbody(
                         rx.foreach(
-                            GptaState.selected_organ_failure_history,
+                            GptaState.failure_history_page,
                             failure_log_table_row,
                         ),
                         rx.cond(
-                            GptaState.selected_organ_failure_history.length()
+                            GptaState.selected_organ_failure_count
                             == 0,
                             rx.el.tr(
                                 rx.el.td(
@@ -232,6 +530,7 @@ def organ_detail_view() -> rx.Component:
                     ),
                     class_name="min-w-full divide-y divide-gray-200",
                 ),
+                failure_history_pagination(),
                 class_name="overflow-x-auto bg-white rounded-lg shadow border border-gray-200",
             ),
         ),
@@ -239,6 +538,421 @@ def organ_detail_view() -> rx.Component:
     )
 
 
+def fleet_export_buttons() -> rx.Component:
+    return rx.el.div(
+        rx.el.button(
+            "Exporter la flotte (CSV)",
+            on_click=GptaState.export_fleet_csv,
+            class_name="px-4 py-2 text-sm font-medium text-white bg-green-600 rounded-md hover:bg-green-700",
+        ),
+        rx.el.button(
+            "Métriques (Parquet)",
+            on_click=GptaState.export_fleet_parquet("metrics"),
+            class_name="px-4 py-2 text-sm font-medium text-green-700 bg-white border border-green-600 rounded-md hover:bg-green-50",
+        ),
+        rx.el.button(
+            "Historique (Parquet)",
+            on_click=GptaState.export_fleet_parquet(
+                "failure_logs"
+            ),
+            class_name="px-4 py-2 text-sm font-medium text-green-700 bg-white border border-green-600 rounded-md hover:bg-green-50",
+        ),
+        class_name="flex flex-wrap justify-center gap-2 mt-6",
+    )
+
+
+def hierarchy_child_row(
+    node: HierarchyNodeSummary, index: int
+) -> rx.Component:
+    return rx.el.tr(
+        rx.el.td(
+            rx.el.button(
+                node["name"],
+                on_click=GptaState.select_hierarchy_node(
+                    node["key"]
+                ),
+                class_name="text-[#F68B1E] hover:underline",
+            ),
+            class_name="px-4 py-3 whitespace-nowrap text-sm",
+        ),
+        rx.el.td(
+            node["failure_count"],
+            class_name="px-4 py-3 whitespace-nowrap text-sm text-gray-600 text-right",
+        ),
+        rx.el.td(
+            format_metric(node["mtbf"], "h", precision=1),
+            class_name="px-4 py-3 whitespace-nowrap text-sm text-gray-600 text-right",
+        ),
+        rx.el.td(
+            format_metric(node["mttr"], "h", precision=1),
+            class_name="px-4 py-3 whitespace-nowrap text-sm text-gray-600 text-right",
+        ),
+        rx.el.td(
+            format_metric(
+                node["availability"], is_percentage=True
+            ),
+            class_name="px-4 py-3 whitespace-nowrap text-sm text-gray-600 text-right",
+        ),
+        class_name=rx.cond(
+            index % 2 == 0, "bg-gray-50", "bg-white"
+        ),
+        key=node["key"],
+    )
+
+
+def hierarchy_child_form() -> rx.Component:
+    return rx.cond(
+        GptaState.hierarchy_child_label != "",
+        rx.el.div(
+            rx.el.input(
+                placeholder=GptaState.hierarchy_child_label,
+                value=GptaState.new_hierarchy_child_name,
+                on_change=GptaState.set_new_hierarchy_child_name,
+                class_name="flex-1 p-2 border border-gray-300 rounded-md text-sm",
+            ),
+            rx.el.button(
+                "Ajouter",
+                on_click=GptaState.add_hierarchy_child,
+                class_name="px-4 py-2 text-sm font-medium text-white bg-[#F68B1E] rounded-md hover:bg-[#D67A1A]",
+            ),
+            class_name="flex gap-2 mt-4",
+        ),
+        rx.fragment(),
+    )
+
+
+def availability_simulation_results() -> rx.Component:
+    result: rx.Var[AvailabilitySimulation | None] = (
+        GptaState.availability_simulation
+    )
+    return rx.el.div(
+        rx.el.p(
+            result["missions"].to_string()
+            + " missions de "
+            + result["mission_hours"].to_string()
+            + " heures, "
+            + result["organ_count"].to_string()
+            + " organe(s) modélisé(s) dans le diagramme de fiabilité",
+            class_name="text-xs text-gray-500 mb-3",
+        ),
+        rx.el.div(
+            metric_card(
+                "Disponibilité système",
+                result["availability"],
+                is_percentage=True,
+                precision=3,
+            ),
+            metric_card(
+                "Pannes par an",
+                result["failures_per_year"],
+            ),
+            metric_card(
+                "Indisponibilité médiane",
+                result["downtime_p50"],
+                "heures",
+            ),
+            metric_card(
+                "Indisponibilité P95",
+                result["downtime_p95"],
+                "heures",
+            ),
+            class_name="grid grid-cols-2 lg:grid-cols-4 gap-4",
+        ),
+        rx.el.p(
+            "IC 95 %: disponibilité ",
+            format_metric(
+                result["availability_low"],
+                is_percentage=True,
+                precision=3,
+            ),
+            " – ",
+            format_metric(
+                result["availability_high"],
+                is_percentage=True,
+                precision=3,
+            ),
+            ", pannes par an ",
+            format_metric(result["failures_per_year_low"]),
+            " – ",
+            format_metric(result["failures_per_year_high"]),
+            class_name="text-xs text-gray-500 mt-2",
+        ),
+        downtime_histogram_chart(),
+    )
+
+
+def availability_simulation_panel() -> rx.Component:
+    return rx.el.div(
+        rx.el.h4(
+            "Simulation Monte Carlo de disponibilité",
+            class_name="text-lg font-medium text-gray-700 mb-3",
+        ),
+        rx.el.div(
+            rx.el.label(
+                "Missions",
+                class_name="text-sm text-gray-600",
+            ),
+            rx.el.input(
+                type="number",
+                min="1000",
+                step="10000",
+                default_value=GptaState.simulation_missions.to_string(),
+                on_change=GptaState.set_simulation_missions.debounce(
+                    500
+                ),
+                class_name="w-32 p-2 border border-gray-300 rounded-md text-sm",
+            ),
+            rx.el.label(
+                "Durée (années)",
+                class_name="text-sm text-gray-600",
+            ),
+            rx.el.input(
+                type="number",
+                min="0.1",
+                step="0.5",
+                default_value=GptaState.simulation_years.to_string(),
+                on_change=GptaState.set_simulation_years.debounce(
+                    500
+                ),
+                class_name="w-24 p-2 border border-gray-300 rounded-md text-sm",
+            ),
+            rx.el.button(
+                "Lancer la simulation",
+                on_click=GptaState.run_availability_simulation,
+                disabled=GptaState.task_running,
+                class_name="px-4 py-2 text-sm font-medium text-white bg-[#F68B1E] rounded-md hover:bg-[#D67A1A] disabled:opacity-50",
+            ),
+            class_name="flex flex-wrap items-center gap-3 mb-4",
+        ),
+        rx.cond(
+            GptaState.availability_simulation.is_not_none(),
+            availability_simulation_results(),
+            rx.fragment(),
+        ),
+        class_name="mt-6 p-4 bg-white rounded-lg shadow border border-gray-200",
+    )
+
+
+def hierarchy_node_view() -> rx.Component:
+    summary: rx.Var[HierarchyNodeSummary | None] = (
+        GptaState.selected_node_summary
+    )
+    return rx.el.div(
+        hierarchy_breadcrumb(),
+        rx.el.h3(
+            summary["name"],
+            class_name="text-2xl font-semibold text-gray-800 mt-2 mb-4",
+        ),
+        rx.el.div(
+            metric_card(
+                "Nombre de Pannes",
+                summary["failure_count"],
+                precision=0,
+            ),
+            metric_card("MTBF", summary["mtbf"], "heures"),
+            metric_card("MTTR", summary["mttr"], "heures"),
+            metric_card(
+                "Disponibilité (D)",
+                summary["availability"],
+                is_percentage=True,
+            ),
+            class_name="grid grid-cols-2 lg:grid-cols-4 gap-4 mb-6",
+        ),
+        rx.el.div(
+            rx.el.table(
+                rx.el.thead(
+                    rx.el.tr(
+                        *[
+                            rx.el.th(
+                                title,
+                                class_name=f"px-4 py-2 text-{align} text-xs font-medium text-gray-500 uppercase tracking-wider",
+                            )
+                            for title, align in (
+                                ("Élément", "left"),
+                                ("Pannes", "right"),
+                                ("MTBF", "right"),
+                                ("MTTR", "right"),
+                                ("Disponibilité", "right"),
+                            )
+                        ]
+                    )
+                ),
+                rx.el.tbody(
+                    rx.foreach(
+                        GptaState.hierarchy_children,
+                        hierarchy_child_row,
+                    ),
+                ),
+                class_name="min-w-full divide-y divide-gray-200",
+            ),
+            class_name="overflow-x-auto bg-white rounded-lg shadow border border-gray-200",
+        ),
+        hierarchy_child_form(),
+        rx.cond(
+            summary["level"] == LEVEL_COMPRESSOR,
+            availability_simulation_panel(),
+            rx.fragment(),
+        ),
+        class_name="w-full max-w-4xl mx-auto text-left",
+    )
+
+
+def diagram_block_row(row: rx.Var[DiagramBlockRow]) -> rx.Component:
+    return rx.el.tr(
+        rx.el.td(
+            row["name"],
+            class_name="py-2 text-sm text-gray-700",
+            style={
+                "padding_left": (row["depth"] * 20 + 16).to_string()
+                + "px"
+            },
+        ),
+        rx.el.td(
+            rx.match(
+                row["kind"],
+                (BLOCK_SERIES, "Série"),
+                (BLOCK_PARALLEL, "Parallèle"),
+                (BLOCK_K_OUT_OF_N, "k sur n"),
+                "Organe",
+            ),
+            class_name="px-4 py-2 text-sm text-gray-500",
+        ),
+        rx.el.td(
+            format_metric(
+                row["reliability_at_t"], is_percentage=True
+            ),
+            class_name="px-4 py-2 text-sm text-gray-700 text-right",
+        ),
+    )
+
+
+def organ_importance_row(
+    row: rx.Var[OrganImportance],
+) -> rx.Component:
+    return rx.el.tr(
+        rx.el.td(
+            row["name"],
+            class_name="px-4 py-2 text-sm text-gray-700",
+        ),
+        rx.el.td(
+            rx.cond(
+                row["reliability_at_t"].is_none(),
+                rx.el.span(
+                    "Sans données",
+                    class_name="text-amber-600",
+                ),
+                format_metric(
+                    row["reliability_at_t"], is_percentage=True
+                ),
+            ),
+            class_name="px-4 py-2 text-sm text-gray-700 text-right",
+        ),
+        rx.el.td(
+            format_metric(row["birnbaum"], precision=4),
+            class_name="px-4 py-2 text-sm font-medium text-indigo-600 text-right",
+        ),
+    )
+
+
+def reliability_table(
+    titles: Tuple[Tuple[str, str], ...],
+    rows: rx.Var[list],
+    render: Callable[[rx.Var], rx.Component],
+) -> rx.Component:
+    return rx.el.div(
+        rx.el.table(
+            rx.el.thead(
+                rx.el.tr(
+                    *[
+                        rx.el.th(
+                            title,
+                            class_name=f"px-4 py-2 text-{align} text-xs font-medium text-gray-500 uppercase tracking-wider",
+                        )
+                        for title, align in titles
+                    ]
+                )
+            ),
+            rx.el.tbody(rx.foreach(rows, render)),
+            class_name="min-w-full divide-y divide-gray-200",
+        ),
+        class_name="overflow-x-auto bg-white rounded-lg shadow border border-gray-200",
+    )
+
+
+def system_reliability_panel() -> rx.Component:
+    result: rx.Var[SystemReliability | None] = (
+        GptaState.system_reliability
+    )
+    return rx.el.div(
+        rx.el.h3(
+            "Fiabilité système: ",
+            result["name"],
+            class_name="text-lg font-medium text-gray-700 mb-3",
+        ),
+        rx.el.div(
+            metric_card(
+                "R système (t = "
+                + GptaState.target_uptime_t.to_string()
+                + " h)",
+                result["reliability_at_t"],
+                is_percentage=True,
+            ),
+            rx.el.div(
+                rx.el.h4(
+                    "MTBF système",
+                    class_name="text-sm font-medium text-gray-500 truncate",
+                ),
+                rx.el.p(
+                    rx.cond(
+                        result["reliability_at_t"].is_none(),
+                        "N/A",
+                        rx.cond(
+                            result["mtbf"].is_none(),
+                            "∞",
+                            format_metric(result["mtbf"], "heures"),
+                        ),
+                    ),
+                    class_name="text-indigo-600 text-2xl font-semibold mt-1",
+                ),
+                class_name="bg-white p-4 rounded-lg shadow border border-gray-200 flex flex-col justify-between",
+            ),
+            class_name="grid grid-cols-2 gap-4 mb-4",
+        ),
+        rx.cond(
+            result["unknown_organs"].length() > 0,
+            rx.el.p(
+                "Organes sans historique de pannes: ",
+                result["unknown_organs"].join(", "),
+                ". Leur fiabilité est inconnue, celle des blocs qui les contiennent est indéterminée.",
+                class_name="text-sm text-amber-700 bg-amber-50 border border-amber-200 rounded-md p-3 mb-4",
+            ),
+            rx.fragment(),
+        ),
+        rx.el.div(
+            reliability_table(
+                (
+                    ("Bloc", "left"),
+                    ("Structure", "left"),
+                    ("R(t)", "right"),
+                ),
+                result["blocks"],
+                diagram_block_row,
+            ),
+            reliability_table(
+                (
+                    ("Organe", "left"),
+                    ("R(t)", "right"),
+                    ("Birnbaum", "right"),
+                ),
+                result["importance"],
+                organ_importance_row,
+            ),
+            class_name="grid grid-cols-1 lg:grid-cols-2 gap-4",
+        ),
+        class_name="w-full max-w-4xl mx-auto text-left",
+    )
+
+
 def placeholder_view() -> rx.Component:
     return rx.el.div(
         rx.el.h3(
@@ -249,6 +963,20 @@ def placeholder_view() -> rx.Component:
             "Sélectionnez un organe dans la barre latérale pour afficher ses détails de performance et de maintenance.",
             class_name="text-gray-600",
         ),
+        fleet_export_buttons(),
+        rx.el.div(
+            hierarchy_node_view(), class_name="mt-8 w-full"
+        ),
+        rx.cond(
+            GptaState.system_reliability.is_not_none(),
+            rx.el.div(
+                system_reliability_panel(), class_name="mt-8 w-full"
+            ),
+            rx.fragment(),
+        ),
+        rx.el.div(
+            maintenance_calendar_panel(), class_name="mt-8 w-full"
+        ),
         rx.el.div(
             pareto_chart_component(), class_name="mt-8"
         ),
@@ -1,5 +1,9 @@
 import reflex as rx
 from tableau_de_bord_de_suivi_gpta.states.gpta_state import GptaState, Organ
+from tableau_de_bord_de_suivi_gpta.ingestion.bulk_import import RejectedRow
+from tableau_de_bord_de_suivi_gpta.components.task_progress import (
+    task_progress_bar,
+)
 
 
 def add_organ_modal() -> rx.Component:
@@ -143,4 +147,102 @@ def add_failure_log_modal() -> rx.Component:
         ),
         open=GptaState.show_add_failure_modal,
         class_name="fixed inset-0 z-50 open:flex items-center justify-center p-4",
-    )
\ No newline at end of file
+    )
+
+def import_rejection_row(rejection: RejectedRow) -> rx.Component:
+    return rx.el.li(
+        f"Ligne {rejection['line']}: {rejection['reason']}",
+        class_name="text-xs text-red-600",
+    )
+
+
+def import_report_summary() -> rx.Component:
+    report = GptaState.import_report
+    return rx.cond(
+        report.is_not_none(),
+        rx.el.div(
+            rx.el.p(
+                f"{report['accepted']} relevé(s) importé(s), {report['rejected']} rejeté(s).",
+                class_name="text-sm font-medium text-gray-700 mb-2",
+            ),
+            rx.el.ul(
+                rx.foreach(
+                    report["rejections"].to(list[RejectedRow]),
+                    import_rejection_row,
+                ),
+                class_name="max-h-40 overflow-y-auto space-y-1",
+            ),
+            class_name="mt-4 p-3 bg-gray-50 rounded-md border border-gray-200",
+        ),
+        rx.fragment(),
+    )
+
+
+def import_failure_logs_modal() -> rx.Component:
+    return rx.el.dialog(
+        rx.el.div(
+            rx.el.h3(
+                "Importer des Relevés de Panne",
+                class_name="text-lg font-medium leading-6 text-gray-900 mb-2",
+            ),
+            rx.el.p(
+                "Fichier CSV ou Excel avec les colonnes organ_name, failure_date, uptime_since_last_failure, repair_duration, description.",
+                class_name="text-sm text-gray-500 mb-4",
+            ),
+            rx.upload.root(
+                rx.el.div(
+                    rx.el.p(
+                        "Glissez un fichier ici ou cliquez pour choisir.",
+                        class_name="text-sm text-gray-600",
+                    ),
+                    rx.foreach(
+                        rx.selected_files("failure_import"),
+                        lambda name: rx.el.p(
+                            name,
+                            class_name="text-sm font-medium text-[#F68B1E]",
+                        ),
+                    ),
+                    class_name="p-6 border-2 border-dashed border-gray-300 rounded-md text-center cursor-pointer",
+                ),
+                id="failure_import",
+                accept={
+                    "text/csv": [".csv"],
+                    "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet": [
+                        ".xlsx"
+                    ],
+                },
+                max_files=1,
+                multiple=False,
+            ),
+            rx.cond(
+                GptaState.task_running,
+                rx.el.div(task_progress_bar(), class_name="mt-4"),
+                rx.fragment(),
+            ),
+            import_report_summary(),
+            rx.el.div(
+                rx.el.button(
+                    "Fermer",
+                    on_click=[
+                        rx.clear_selected_files("failure_import"),
+                        GptaState.toggle_import_modal,
+                    ],
+                    class_name="mr-2 px-4 py-2 text-sm font-medium text-gray-700 bg-gray-100 border border-transparent rounded-md hover:bg-gray-200 focus:outline-none focus:ring-2 focus:ring-offset-2 focus:ring-[#F68B1E]",
+                ),
+                rx.el.button(
+                    "Importer",
+                    on_click=GptaState.handle_failure_log_upload(
+                        rx.upload_files(
+                            upload_id="failure_import"
+                        )
+                    ),
+                    disabled=GptaState.task_running,
+                    class_name="px-4 py-2 text-sm font-medium text-white bg-[#F68B1E] border border-transparent rounded-md shadow-sm hover:bg-[#D67A1A] focus:outline-none focus:ring-2 focus:ring-offset-2 focus:ring-[#F68B1E] disabled:opacity-50",
+                ),
+                class_name="flex justify-end mt-4",
+            ),
+            class_name="bg-white p-6 rounded-lg shadow-xl w-full max-w-lg",
+        ),
+        open=GptaState.show_import_modal,
+        class_name="fixed inset-0 z-50 open:flex items-center justify-center p-4",
+    )
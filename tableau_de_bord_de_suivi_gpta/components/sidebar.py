@@ -1,46 +1,167 @@
 import reflex as rx
-from tableau_de_bord_de_suivi_gpta.states.gpta_state import GptaState, Organ
+from tableau_de_bord_de_suivi_gpta.states.gpta_state import (
+    GptaState,
+    HierarchyNode,
+    HierarchyNodeSummary,
+    OrganStatus,
+)
+from tableau_de_bord_de_suivi_gpta.analytics.constants import (
+    STATUS_ALERT,
+    STATUS_UNKNOWN,
+)
 from typing import cast
 
+MONTH_NAMES = [
+    "Janvier",
+    "Février",
+    "Mars",
+    "Avril",
+    "Mai",
+    "Juin",
+    "Juillet",
+    "Août",
+    "Septembre",
+    "Octobre",
+    "Novembre",
+    "Décembre",
+]
 
+
+@rx.memo
 def organ_sidebar_item(
-    organ: Organ, index: int
+    name: rx.Var[str],
+    status: rx.Var[str],
+    is_selected: rx.Var[bool],
 ) -> rx.Component:
-    is_selected = (
-        GptaState.selected_organ_name == organ["name"]
-    )
-    reliability_value = organ["reliability_at_t"]
-    is_reliability_alert_condition = (
-        reliability_value != None
-    ) & (
-        reliability_value
-        < GptaState.min_reliability_threshold
-    )
     dot_span_class_name = rx.cond(
-        is_reliability_alert_condition,
+        status == STATUS_ALERT,
         "bg-red-500 animate-pulse w-3 h-3 rounded-full ml-2",
         "bg-green-500 w-3 h-3 rounded-full ml-2",
     )
     return rx.el.li(
         rx.el.button(
-            rx.el.span(
-                organ["name"], class_name="flex-1 truncate"
-            ),
+            rx.el.span(name, class_name="flex-1 truncate"),
             rx.cond(
-                reliability_value == None,
+                status == STATUS_UNKNOWN,
                 rx.fragment(),
                 rx.el.span(class_name=dot_span_class_name),
             ),
-            on_click=lambda: GptaState.set_selected_organ(
-                organ["name"]
-            ),
+            on_click=GptaState.set_selected_organ(name),
             class_name=rx.cond(
                 is_selected,
                 "w-full flex items-center text-left px-3 py-3 text-sm font-medium rounded-md bg-[#F68B1E] text-white transition-colors duration-150",
                 "w-full flex items-center text-left px-3 py-3 text-sm font-medium rounded-md text-gray-700 hover:bg-gray-100 hover:text-[#F68B1E] transition-colors duration-150",
             ),
         ),
-        key=f"organ-item-{index}",
+    )
+
+
+def organ_sidebar_entry(organ: OrganStatus) -> rx.Component:
+    return organ_sidebar_item(
+        name=organ["name"],
+        status=GptaState.organ_status_patch.get(
+            organ["name"], organ["status"]
+        ),
+        is_selected=GptaState.selected_organ_name
+        == organ["name"],
+        key=organ["name"],
+    )
+
+
+def hierarchy_breadcrumb_entry(
+    node: HierarchyNode, index: rx.Var[int]
+) -> rx.Component:
+    return rx.fragment(
+        rx.cond(
+            index > 0,
+            rx.el.span("›", class_name="text-gray-400"),
+            rx.fragment(),
+        ),
+        rx.el.button(
+            node["name"],
+            on_click=GptaState.select_hierarchy_node(node["key"]),
+            class_name="text-sm text-[#F68B1E] hover:underline truncate",
+        ),
+    )
+
+
+def hierarchy_breadcrumb() -> rx.Component:
+    return rx.el.div(
+        rx.foreach(
+            GptaState.hierarchy_breadcrumb,
+            hierarchy_breadcrumb_entry,
+        ),
+        class_name="flex flex-wrap items-center gap-1",
+    )
+
+
+def hierarchy_child_entry(
+    node: HierarchyNodeSummary,
+) -> rx.Component:
+    return rx.el.li(
+        rx.el.button(
+            rx.el.span(node["name"], class_name="flex-1 truncate"),
+            rx.el.span(
+                node["failure_count"],
+                class_name="ml-2 text-xs text-gray-500",
+            ),
+            on_click=GptaState.select_hierarchy_node(node["key"]),
+            class_name="w-full flex items-center text-left px-3 py-2 text-sm rounded-md text-gray-700 hover:bg-gray-100 hover:text-[#F68B1E] transition-colors duration-150",
+        ),
+        key=node["key"],
+    )
+
+
+def fleet_navigator() -> rx.Component:
+    return rx.el.div(
+        rx.el.label(
+            "Parc",
+            class_name="block text-sm font-medium text-gray-700 mb-1",
+        ),
+        hierarchy_breadcrumb(),
+        rx.el.ul(
+            rx.foreach(
+                GptaState.hierarchy_children,
+                hierarchy_child_entry,
+            ),
+            class_name="mt-2 space-y-1",
+        ),
+        class_name="px-4 pb-4 mb-2 border-b border-gray-200",
+    )
+
+
+def analysis_period_selector() -> rx.Component:
+    return rx.el.div(
+        rx.el.label(
+            "Période d'analyse",
+            class_name="block text-sm font-medium text-gray-700 mb-1",
+        ),
+        rx.el.select(
+            rx.el.option("Toutes les années", value="0"),
+            rx.foreach(
+                GptaState.available_years,
+                lambda year: rx.el.option(
+                    year, value=year.to_string()
+                ),
+            ),
+            value=GptaState.selected_year.to_string(),
+            on_change=GptaState.set_selected_year,
+            class_name="w-full p-2 border border-gray-300 rounded-md text-sm",
+        ),
+        rx.el.select(
+            rx.el.option("Toute l'année", value="0"),
+            *[
+                rx.el.option(month_name, value=str(month))
+                for month, month_name in enumerate(
+                    MONTH_NAMES, start=1
+                )
+            ],
+            value=GptaState.selected_month.to_string(),
+            on_change=GptaState.set_selected_month,
+            disabled=GptaState.selected_year == 0,
+            class_name="w-full mt-2 p-2 border border-gray-300 rounded-md text-sm disabled:opacity-50",
+        ),
+        class_name="px-4 pb-4",
     )
 
 
@@ -57,13 +178,20 @@ def sidebar_component() -> rx.Component:
                     on_click=GptaState.toggle_add_organ_modal,
                     class_name="w-full px-4 py-2 text-sm font-medium text-white bg-[#F68B1E] rounded-md hover:bg-[#D67A1A] transition-colors duration-150",
                 ),
+                rx.el.button(
+                    "Importer des Relevés",
+                    on_click=GptaState.toggle_import_modal,
+                    class_name="w-full mt-2 px-4 py-2 text-sm font-medium text-[#F68B1E] bg-white border border-[#F68B1E] rounded-md hover:bg-orange-50 transition-colors duration-150",
+                ),
                 class_name="p-4",
             ),
+            analysis_period_selector(),
+            fleet_navigator(),
             rx.el.nav(
                 rx.el.ul(
                     rx.foreach(
                         GptaState.organs,
-                        organ_sidebar_item,
+                        organ_sidebar_entry,
                     ),
                     class_name="space-y-1",
                 ),
@@ -0,0 +1,54 @@
+import reflex as rx
+from tableau_de_bord_de_suivi_gpta.states.gpta_state import (
+    GptaState,
+)
+
+
+def task_progress_bar() -> rx.Component:
+    return rx.el.div(
+        rx.el.div(
+            rx.el.span(
+                GptaState.task_label,
+                class_name="text-sm font-medium text-gray-700 truncate",
+            ),
+            rx.el.span(
+                GptaState.task_progress.to_string() + " %",
+                class_name="ml-2 text-sm text-gray-500",
+            ),
+            class_name="flex justify-between mb-1",
+        ),
+        rx.el.div(
+            rx.el.div(
+                class_name="h-2 bg-[#F68B1E] rounded-full transition-all duration-300",
+                style={
+                    "width": GptaState.task_progress.to_string()
+                    + "%"
+                },
+            ),
+            class_name="w-full h-2 bg-gray-200 rounded-full overflow-hidden",
+        ),
+        rx.el.div(
+            rx.el.span(
+                GptaState.task_detail,
+                class_name="text-xs text-gray-500 truncate",
+            ),
+            rx.el.button(
+                "Annuler",
+                on_click=GptaState.cancel_background_task,
+                class_name="ml-2 text-xs font-medium text-red-600 hover:underline",
+            ),
+            class_name="flex justify-between items-center mt-1",
+        ),
+        class_name="w-full text-left",
+    )
+
+
+def background_task_panel() -> rx.Component:
+    return rx.cond(
+        GptaState.task_running,
+        rx.el.div(
+            task_progress_bar(),
+            class_name="fixed bottom-4 right-4 z-40 w-80 p-4 bg-white rounded-lg shadow-lg border border-gray-200",
+        ),
+        rx.fragment(),
+    )
@@ -0,0 +1,264 @@
+from typing import Dict, List, Optional, Tuple
+import hashlib
+import threading
+
+from tableau_de_bord_de_suivi_gpta.analytics.aggregates import (
+    build_aggregate_index,
+    merged_aggregate_index,
+)
+from tableau_de_bord_de_suivi_gpta.analytics.hierarchy import (
+    FleetHierarchy,
+)
+from tableau_de_bord_de_suivi_gpta.analytics.time_index import (
+    DateWindow,
+    TimelineIndex,
+)
+from tableau_de_bord_de_suivi_gpta.analytics.types import (
+    FailureLogEntry,
+    MaintenanceCosts,
+    NodeRollup,
+    OrganAggregate,
+    OrganPlacement,
+)
+from tableau_de_bord_de_suivi_gpta.cache.metrics_cache import (
+    MetricsCache,
+)
+from tableau_de_bord_de_suivi_gpta.db.models import (
+    CompressorRecord,
+    FailureLogRecord,
+    LocomotiveRecord,
+    MaintenanceCostChangeRecord,
+    OrganRecord,
+)
+from tableau_de_bord_de_suivi_gpta.db.repository import (
+    advanced_data_version,
+    data_version_order,
+    iter_failure_log_batches,
+    load_data_version,
+    load_fleet_aggregates,
+    load_fleet_placements,
+    load_maintenance_costs,
+    load_organ_names,
+)
+
+
+class OrganNameLookup:
+    def __init__(self, store: "FleetStore"):
+        self._store = store
+        self._names = set(store.organ_names)
+        self._refreshed = False
+
+    def __contains__(self, organ_name: object) -> bool:
+        if organ_name not in self._names and not self._refreshed:
+            self._refreshed = True
+            self._store.refresh()
+            self._names = set(self._store.organ_names)
+        return organ_name in self._names
+
+
+class FleetStore:
+    def __init__(self, cache: MetricsCache):
+        self._cache = cache
+        self._lock = threading.RLock()
+        self.version = ""
+        self.organ_names: List[str] = []
+        self.aggregates: Dict[str, OrganAggregate] = {}
+        self.hierarchy = FleetHierarchy()
+        self.rollups: Dict[str, NodeRollup] = {}
+        self.timelines = TimelineIndex()
+        self.maintenance_costs: Dict[str, MaintenanceCosts] = {}
+        self.costs_digest = ""
+
+    def _set_maintenance_costs(
+        self, costs: Dict[str, MaintenanceCosts]
+    ) -> None:
+        self.maintenance_costs = costs
+        self.costs_digest = hashlib.sha1(
+            repr(sorted(costs.items())).encode("utf-8")
+        ).hexdigest()
+
+    def _load(self, version: str) -> None:
+        self.organ_names = self._cache.get_or_compute(
+            ("organ_names", version), load_organ_names
+        )
+        self.aggregates = self._cache.get_or_compute(
+            ("aggregates", version), load_fleet_aggregates
+        )
+        self.hierarchy = FleetHierarchy.from_placements(
+            self._cache.get_or_compute(
+                ("placements", version), load_fleet_placements
+            )
+        )
+        self.rollups = self.hierarchy.rollup(self.aggregates)
+        self._set_maintenance_costs(
+            self._cache.get_or_compute(
+                ("maintenance_costs", version),
+                load_maintenance_costs,
+            )
+        )
+        self.timelines.invalidate()
+        self.version = version
+
+    def _advance(self, table: type, inserted: int) -> bool:
+        version = load_data_version()
+        if version == advanced_data_version(
+            self.version, table, inserted
+        ):
+            self.version = version
+            return True
+        self._load(version)
+        return False
+
+    def refresh(self) -> str:
+        version = load_data_version()
+        with self._lock:
+            if not self.version or data_version_order(
+                version
+            ) > data_version_order(self.version):
+                self._load(version)
+            return self.version
+
+    def ensure_loaded(self) -> str:
+        with self._lock:
+            if self.version:
+                return self.version
+        return self.refresh()
+
+    def organ_name_lookup(self) -> OrganNameLookup:
+        self.ensure_loaded()
+        with self._lock:
+            return OrganNameLookup(self)
+
+    def versioned_aggregates(
+        self,
+    ) -> Tuple[str, Dict[str, OrganAggregate]]:
+        self.ensure_loaded()
+        with self._lock:
+            return self.version, self.aggregates
+
+    def aggregate(
+        self,
+        organ_name: str,
+        window: Optional[DateWindow] = None,
+    ) -> Optional[OrganAggregate]:
+        self.ensure_loaded()
+        if window is None:
+            return self.aggregates.get(organ_name)
+        with self._lock:
+            return self.timeline_index().window(organ_name, *window)
+
+    def window_aggregates(
+        self, window: Optional[DateWindow] = None
+    ) -> Dict[str, OrganAggregate]:
+        self.ensure_loaded()
+        if window is None:
+            return self.aggregates
+        with self._lock:
+            return self.timeline_index().window_index(*window)
+
+    def window_rollups(
+        self, window: Optional[DateWindow] = None
+    ) -> Dict[str, NodeRollup]:
+        self.ensure_loaded()
+        if window is None:
+            return self.rollups
+        return self.hierarchy.rollup(
+            self.window_aggregates(window)
+        )
+
+    def timeline_index(self) -> TimelineIndex:
+        with self._lock:
+            if (
+                not self.timelines.loaded
+                or self.timelines.source_version != self.version
+            ):
+                self.timelines.load(
+                    iter_failure_log_batches(), self.version
+                )
+            return self.timelines
+
+    def years(self) -> List[int]:
+        with self._lock:
+            return self.timeline_index().years()
+
+    def _apply_delta(self, delta: Dict[str, OrganAggregate]) -> None:
+        rollups = dict(self.rollups)
+        self.hierarchy.apply(rollups, self.aggregates, delta)
+        self.rollups = rollups
+        self.aggregates = merged_aggregate_index(
+            self.aggregates, delta
+        )
+
+    def record_placement(self, placement: OrganPlacement) -> str:
+        with self._lock:
+            self.ensure_loaded()
+            organ_name = placement["organ_name"]
+            if organ_name is not None:
+                table = OrganRecord
+            elif placement["compressor_name"] is not None:
+                table = CompressorRecord
+            else:
+                table = LocomotiveRecord
+            if self._advance(table, 1):
+                if (
+                    organ_name is not None
+                    and organ_name not in self.organ_names
+                ):
+                    self.organ_names = self.organ_names + [
+                        organ_name
+                    ]
+                placed = bool(self.hierarchy.ancestor_keys(organ_name))
+                self.hierarchy.add(placement)
+                aggregate = self.aggregates.get(organ_name)
+                if aggregate is not None and not placed:
+                    rollups = dict(self.rollups)
+                    self.hierarchy.apply(
+                        rollups, {}, {organ_name: aggregate}
+                    )
+                    self.rollups = rollups
+            return self.version
+
+    def record_failure_log(self, log: FailureLogEntry) -> str:
+        with self._lock:
+            self.ensure_loaded()
+            if self._advance(FailureLogRecord, 1):
+                self._apply_delta(build_aggregate_index([log]))
+                if self.timelines.loaded:
+                    self.timelines.add(log)
+                    self.timelines.source_version = self.version
+            return self.version
+
+    def record_import(
+        self,
+        delta: Dict[str, OrganAggregate],
+        entries: Optional[List[FailureLogEntry]] = None,
+    ) -> str:
+        with self._lock:
+            self.ensure_loaded()
+            inserted = sum(
+                aggregate["failure_count"]
+                for aggregate in delta.values()
+            )
+            if self._advance(FailureLogRecord, inserted):
+                self._apply_delta(delta)
+                if entries is None:
+                    self.timelines.invalidate()
+                elif self.timelines.loaded:
+                    self.timelines.extend(entries)
+                    self.timelines.source_version = self.version
+            return self.version
+
+    def record_maintenance_costs(
+        self, organ_name: str, costs: MaintenanceCosts
+    ) -> str:
+        with self._lock:
+            self.ensure_loaded()
+            if self._advance(MaintenanceCostChangeRecord, 1):
+                self._set_maintenance_costs(
+                    {**self.maintenance_costs, organ_name: costs}
+                )
+                self._cache.set(
+                    ("maintenance_costs", self.version),
+                    self.maintenance_costs,
+                )
+            return self.costs_digest
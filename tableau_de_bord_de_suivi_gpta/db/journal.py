@@ -0,0 +1,306 @@
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+import contextlib
+import copy
+import fcntl
+import json
+import mmap
+import os
+import secrets
+import struct
+import threading
+import zlib
+
+from tableau_de_bord_de_suivi_gpta.analytics.aggregates import (
+    build_aggregate_index,
+    merge_aggregate_index,
+)
+from tableau_de_bord_de_suivi_gpta.analytics.types import (
+    FailureLogEntry,
+    OrganAggregate,
+)
+
+JOURNAL_PATH_ENV = "GPTA_JOURNAL_PATH"
+DEFAULT_JOURNAL_PATH = "gpta_failure_logs.journal"
+SNAPSHOT_SUFFIX = ".snapshot"
+SNAPSHOT_INTERVAL = 1000
+ORPHANED_TRANSACTION_RECORDS = 10_000
+RECORD_HEADER = struct.Struct("<II")
+
+OP_ADD_FAILURE_LOGS = "failure_log.add"
+OP_COMMIT = "txn.commit"
+OP_ABORT = "txn.abort"
+OP_SNAPSHOT = "state.snapshot"
+
+PendingTransaction = Tuple[Dict[str, OrganAggregate], int, int]
+
+
+def _encode(record: Dict[str, Any]) -> bytes:
+    payload = json.dumps(
+        record, ensure_ascii=False, separators=(",", ":")
+    ).encode("utf-8")
+    return RECORD_HEADER.pack(len(payload), zlib.crc32(payload)) + payload
+
+
+def _decode(
+    buffer: Any, offset: int
+) -> Optional[Tuple[Dict[str, Any], int]]:
+    end = offset + RECORD_HEADER.size
+    if end > len(buffer):
+        return None
+    length, checksum = RECORD_HEADER.unpack_from(buffer, offset)
+    if end + length > len(buffer):
+        return None
+    payload = bytes(buffer[end : end + length])
+    if zlib.crc32(payload) != checksum:
+        return None
+    try:
+        return json.loads(payload.decode("utf-8")), end + length
+    except ValueError:
+        return None
+
+
+class FailureLogJournal:
+    def __init__(
+        self,
+        path: str,
+        snapshot_interval: int = SNAPSHOT_INTERVAL,
+        orphaned_transaction_records: int = ORPHANED_TRANSACTION_RECORDS,
+    ):
+        self.path = path
+        self.snapshot_path = path + SNAPSHOT_SUFFIX
+        self.snapshot_interval = snapshot_interval
+        self.orphaned_transaction_records = orphaned_transaction_records
+        self._lock = threading.RLock()
+        self._loaded = False
+        self._offset = 0
+        self._aggregates: Dict[str, OrganAggregate] = {}
+        self._log_count = 0
+        self._records_since_snapshot = 0
+        self._appends_since_catch_up = 0
+        self._sequence = 0
+        self._pending: Dict[str, PendingTransaction] = {}
+        self._snapshot_signature: Optional[Tuple[int, int]] = None
+
+    @contextlib.contextmanager
+    def _file_lock(self) -> Iterator[None]:
+        with open(self.path, "ab") as journal:
+            fcntl.flock(journal, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(journal, fcntl.LOCK_UN)
+
+    def _current_snapshot_signature(self) -> Optional[Tuple[int, int]]:
+        try:
+            stat = os.stat(self.snapshot_path)
+        except OSError:
+            return None
+        return stat.st_ino, stat.st_mtime_ns
+
+    def _load_snapshot(self) -> None:
+        self._offset = 0
+        self._aggregates = {}
+        self._log_count = 0
+        self._pending = {}
+        self._sequence = 0
+        self._records_since_snapshot = 0
+        self._snapshot_signature = self._current_snapshot_signature()
+        try:
+            with open(self.snapshot_path, "rb") as snapshot:
+                decoded = _decode(snapshot.read(), 0)
+        except OSError:
+            decoded = None
+        if decoded is None:
+            return
+        state = decoded[0]
+        if state["offset"] > os.path.getsize(self.path):
+            return
+        self._offset = state["offset"]
+        self._aggregates = state["aggregates"]
+        self._log_count = state["log_count"]
+        self._sequence = state.get("sequence", 0)
+        self._pending = {
+            txn: (
+                pending["aggregates"],
+                pending["log_count"],
+                pending["last_seen"],
+            )
+            for txn, pending in state.get("pending", {}).items()
+        }
+
+    def _apply(self, record: Dict[str, Any]) -> None:
+        self._sequence += 1
+        txn = record.get("txn")
+        if record["op"] == OP_ADD_FAILURE_LOGS:
+            delta = build_aggregate_index(record["entries"])
+            count = len(record["entries"])
+            if txn is None:
+                merge_aggregate_index(self._aggregates, delta)
+                self._log_count += count
+                return
+            pending, pending_count, _ = self._pending.get(
+                txn, ({}, 0, 0)
+            )
+            merge_aggregate_index(pending, delta)
+            self._pending[txn] = (
+                pending,
+                pending_count + count,
+                self._sequence,
+            )
+        elif record["op"] == OP_COMMIT:
+            pending, count, _ = self._pending.pop(txn, ({}, 0, 0))
+            merge_aggregate_index(self._aggregates, pending)
+            self._log_count += count
+        elif record["op"] == OP_ABORT:
+            self._pending.pop(txn, None)
+        elif record["op"] == OP_SNAPSHOT:
+            self._aggregates = record["aggregates"]
+            self._log_count = record["log_count"]
+            self._pending = {}
+
+    def _catch_up(self) -> None:
+        if (
+            not self._loaded
+            or self._current_snapshot_signature()
+            != self._snapshot_signature
+        ):
+            self._load_snapshot()
+            self._loaded = True
+        size = os.path.getsize(self.path)
+        if size <= self._offset:
+            return
+        with open(self.path, "rb") as journal, mmap.mmap(
+            journal.fileno(), 0, access=mmap.ACCESS_READ
+        ) as buffer:
+            while True:
+                decoded = _decode(buffer, self._offset)
+                if decoded is None:
+                    break
+                record, self._offset = decoded
+                self._apply(record)
+                self._records_since_snapshot += 1
+        if self._offset < size:
+            os.truncate(self.path, self._offset)
+        self._appends_since_catch_up = 0
+        if self._records_since_snapshot >= self.snapshot_interval:
+            self._write_snapshot()
+
+    def _drop_orphaned_transactions(self) -> None:
+        horizon = self._sequence - self.orphaned_transaction_records
+        self._pending = {
+            txn: pending
+            for txn, pending in self._pending.items()
+            if pending[2] > horizon
+        }
+
+    def _write_snapshot(self) -> None:
+        self._drop_orphaned_transactions()
+        temporary = f"{self.snapshot_path}.{os.getpid()}.tmp"
+        with open(temporary, "wb") as snapshot:
+            snapshot.write(
+                _encode(
+                    {
+                        "offset": self._offset,
+                        "log_count": self._log_count,
+                        "aggregates": self._aggregates,
+                        "sequence": self._sequence,
+                        "pending": {
+                            txn: {
+                                "aggregates": aggregates,
+                                "log_count": count,
+                                "last_seen": last_seen,
+                            }
+                            for txn, (
+                                aggregates,
+                                count,
+                                last_seen,
+                            ) in self._pending.items()
+                        },
+                    }
+                )
+            )
+            snapshot.flush()
+            os.fsync(snapshot.fileno())
+        os.replace(temporary, self.snapshot_path)
+        self._records_since_snapshot = 0
+        self._snapshot_signature = self._current_snapshot_signature()
+
+    def _write(self, record: Dict[str, Any]) -> None:
+        with open(self.path, "ab") as journal:
+            journal.write(_encode(record))
+            journal.flush()
+            os.fsync(journal.fileno())
+
+    def _append(self, record: Dict[str, Any]) -> None:
+        with self._lock, self._file_lock():
+            self._write(record)
+            self._appends_since_catch_up += 1
+            if self._appends_since_catch_up >= self.snapshot_interval:
+                self._catch_up()
+
+    def state(self) -> Tuple[Dict[str, OrganAggregate], int]:
+        with self._lock, self._file_lock():
+            self._catch_up()
+            return copy.deepcopy(self._aggregates), self._log_count
+
+    def append_failure_logs(
+        self,
+        entries: List[FailureLogEntry],
+        txn: Optional[str] = None,
+    ) -> None:
+        self._append(
+            {"op": OP_ADD_FAILURE_LOGS, "txn": txn, "entries": entries}
+        )
+
+    def begin(self) -> str:
+        return secrets.token_hex(8)
+
+    def commit(self, txn: str) -> None:
+        self._append({"op": OP_COMMIT, "txn": txn})
+
+    def abort(self, txn: str) -> None:
+        self._append({"op": OP_ABORT, "txn": txn})
+
+    def snapshot(self) -> None:
+        with self._lock, self._file_lock():
+            self._catch_up()
+            self._write_snapshot()
+
+    def correct(
+        self, aggregates: Dict[str, OrganAggregate], log_count: int
+    ) -> None:
+        with self._lock, self._file_lock():
+            self._catch_up()
+            self._write(
+                {
+                    "op": OP_SNAPSHOT,
+                    "txn": None,
+                    "aggregates": aggregates,
+                    "log_count": log_count,
+                }
+            )
+            self._catch_up()
+
+
+_journal: Optional[FailureLogJournal] = None
+_journal_lock = threading.Lock()
+
+
+def _default_journal_path() -> str:
+    path = os.environ.get(JOURNAL_PATH_ENV)
+    if path:
+        return path
+    from reflex.config import get_config
+
+    db_url = get_config().db_url or ""
+    if db_url.startswith("sqlite:///"):
+        return db_url[len("sqlite:///") :] + ".journal"
+    return DEFAULT_JOURNAL_PATH
+
+
+def get_failure_log_journal() -> FailureLogJournal:
+    global _journal
+    with _journal_lock:
+        if _journal is None:
+            _journal = FailureLogJournal(_default_journal_path())
+        return _journal
@@ -0,0 +1,106 @@
+from typing import Optional
+import datetime
+
+import reflex as rx
+import sqlalchemy
+import sqlmodel
+
+from tableau_de_bord_de_suivi_gpta.analytics.constants import (
+    DEFAULT_CORRECTIVE_COST,
+    DEFAULT_PREVENTIVE_COST,
+)
+
+
+class LocomotiveRecord(rx.Model, table=True):
+    __tablename__ = "locomotive"
+
+    name: str = sqlmodel.Field(
+        sa_column=sqlalchemy.Column(
+            sqlalchemy.String, nullable=False, unique=True
+        )
+    )
+
+
+class CompressorRecord(rx.Model, table=True):
+    __tablename__ = "compressor"
+
+    name: str = sqlmodel.Field(
+        sa_column=sqlalchemy.Column(
+            sqlalchemy.String, nullable=False, unique=True
+        )
+    )
+    locomotive_name: str = sqlmodel.Field(
+        foreign_key="locomotive.name", nullable=False, index=True
+    )
+
+
+class OrganRecord(rx.Model, table=True):
+    __tablename__ = "organ"
+    __table_args__ = (
+        sqlalchemy.UniqueConstraint(
+            "compressor_name",
+            "label",
+            name="uq_organ_compressor_name_label",
+        ),
+    )
+
+    name: str = sqlmodel.Field(
+        sa_column=sqlalchemy.Column(
+            sqlalchemy.String, nullable=False, unique=True
+        )
+    )
+    label: str = sqlmodel.Field(
+        default="", sa_column_kwargs={"server_default": ""}
+    )
+    compressor_name: Optional[str] = sqlmodel.Field(
+        default=None,
+        foreign_key="compressor.name",
+        nullable=True,
+        index=True,
+    )
+    preventive_cost: float = sqlmodel.Field(
+        default=DEFAULT_PREVENTIVE_COST,
+        sa_column_kwargs={
+            "server_default": str(DEFAULT_PREVENTIVE_COST)
+        },
+    )
+    corrective_cost: float = sqlmodel.Field(
+        default=DEFAULT_CORRECTIVE_COST,
+        sa_column_kwargs={
+            "server_default": str(DEFAULT_CORRECTIVE_COST)
+        },
+    )
+
+
+class MaintenanceCostChangeRecord(rx.Model, table=True):
+    __tablename__ = "maintenance_cost_change"
+
+    organ_name: str = sqlmodel.Field(
+        foreign_key="organ.name", nullable=False
+    )
+    preventive_cost: float
+    corrective_cost: float
+
+
+class FailureLogRecord(rx.Model, table=True):
+    __tablename__ = "failure_log"
+    __table_args__ = (
+        sqlalchemy.Index(
+            "ix_failure_log_organ_name_failure_date",
+            "organ_name",
+            "failure_date",
+        ),
+        sqlalchemy.Index(
+            "ix_failure_log_organ_name_repair_duration",
+            "organ_name",
+            "repair_duration",
+        ),
+    )
+
+    organ_name: str = sqlmodel.Field(
+        foreign_key="organ.name", nullable=False
+    )
+    failure_date: datetime.date
+    uptime_since_last_failure: float
+    repair_duration: float
+    description: str = ""
@@ -0,0 +1,636 @@
+from typing import (
+    Any,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+)
+import datetime
+import threading
+
+import reflex as rx
+import sqlalchemy
+import sqlmodel
+
+from tableau_de_bord_de_suivi_gpta.analytics.types import (
+    FailureHistoryPage,
+    FailureLogEntry,
+    MaintenanceCosts,
+    OrganAggregate,
+    OrganPlacement,
+)
+from tableau_de_bord_de_suivi_gpta.db.journal import (
+    get_failure_log_journal,
+)
+from tableau_de_bord_de_suivi_gpta.db.models import (
+    CompressorRecord,
+    FailureLogRecord,
+    LocomotiveRecord,
+    MaintenanceCostChangeRecord,
+    OrganRecord,
+)
+
+DEFAULT_LOCOMOTIVE_NAME = "Locomotive 1"
+DEFAULT_COMPRESSOR_NAME = "Locomotive 1 - GPTA"
+
+DEFAULT_ORGAN_NAMES: List[str] = [
+    "Groupe à vis",
+    "Moteur",
+    "Sécheur d'air",
+    "Électrovanne de régénération",
+    "ADCU (unité de commande)",
+    "Capteur de point de rosée",
+    "Soupape by-pass",
+]
+DEFAULT_FAILURE_LOGS: List[FailureLogEntry] = [
+    {
+        "organ_name": "Groupe à vis",
+        "failure_date": "2023-01-15",
+        "uptime_since_last_failure": 2000,
+        "repair_duration": 10,
+        "description": "Défaillance roulement",
+    },
+    {
+        "organ_name": "Groupe à vis",
+        "failure_date": "2023-05-20",
+        "uptime_since_last_failure": 2800,
+        "repair_duration": 12,
+        "description": "Fuite joint",
+    },
+    {
+        "organ_name": "Moteur",
+        "failure_date": "2023-03-10",
+        "uptime_since_last_failure": 3500,
+        "repair_duration": 24,
+        "description": "Surchauffe",
+    },
+    {
+        "organ_name": "Sécheur d'air",
+        "failure_date": "2023-06-01",
+        "uptime_since_last_failure": 4000,
+        "repair_duration": 8,
+        "description": "Colmatage filtre",
+    },
+    {
+        "organ_name": "Groupe à vis",
+        "failure_date": "2023-09-10",
+        "uptime_since_last_failure": 2500,
+        "repair_duration": 15,
+        "description": "Vibration excessive",
+    },
+]
+
+DATA_VERSION_TABLES = (
+    OrganRecord,
+    FailureLogRecord,
+    LocomotiveRecord,
+    CompressorRecord,
+    MaintenanceCostChangeRecord,
+)
+
+HISTORY_SORT_COLUMNS = {
+    "date": FailureLogRecord.failure_date,
+    "duration": FailureLogRecord.repair_duration,
+}
+
+_init_lock = threading.Lock()
+_initialized = False
+
+
+def ensure_database() -> None:
+    global _initialized
+    if _initialized:
+        return
+    with _init_lock:
+        if _initialized:
+            return
+        if rx.Model.migrate() is None:
+            rx.Model.create_all()
+        with rx.session() as session:
+            has_organs = session.exec(
+                sqlmodel.select(OrganRecord.id).limit(1)
+            ).first()
+            if has_organs is None:
+                session.add(
+                    LocomotiveRecord(name=DEFAULT_LOCOMOTIVE_NAME)
+                )
+                session.add(
+                    CompressorRecord(
+                        name=DEFAULT_COMPRESSOR_NAME,
+                        locomotive_name=DEFAULT_LOCOMOTIVE_NAME,
+                    )
+                )
+                session.add_all(
+                    [
+                        OrganRecord(
+                            name=name,
+                            label=name,
+                            compressor_name=DEFAULT_COMPRESSOR_NAME,
+                        )
+                        for name in DEFAULT_ORGAN_NAMES
+                    ]
+                )
+                session.add_all(
+                    [
+                        _to_record(log)
+                        for log in DEFAULT_FAILURE_LOGS
+                    ]
+                )
+                session.commit()
+        _initialized = True
+
+
+def _to_record(log: FailureLogEntry) -> FailureLogRecord:
+    return FailureLogRecord(
+        organ_name=log["organ_name"],
+        failure_date=datetime.date.fromisoformat(
+            log["failure_date"]
+        ),
+        uptime_since_last_failure=log[
+            "uptime_since_last_failure"
+        ],
+        repair_duration=log["repair_duration"],
+        description=log["description"],
+    )
+
+
+def _to_entry(record: FailureLogRecord) -> FailureLogEntry:
+    return {
+        "organ_name": record.organ_name,
+        "failure_date": record.failure_date.isoformat(),
+        "uptime_since_last_failure": record.uptime_since_last_failure,
+        "repair_duration": record.repair_duration,
+        "description": record.description,
+    }
+
+
+def load_organ_names() -> List[str]:
+    ensure_database()
+    with rx.session() as session:
+        return list(
+            session.exec(
+                sqlmodel.select(OrganRecord.name).order_by(
+                    OrganRecord.id
+                )
+            ).all()
+        )
+
+
+def load_fleet_placements() -> List[OrganPlacement]:
+    ensure_database()
+    with rx.session() as session:
+        locomotives = session.exec(
+            sqlmodel.select(LocomotiveRecord.name).order_by(
+                LocomotiveRecord.id
+            )
+        ).all()
+        compressors = session.exec(
+            sqlmodel.select(
+                CompressorRecord.locomotive_name,
+                CompressorRecord.name,
+            ).order_by(CompressorRecord.id)
+        ).all()
+        organs = session.exec(
+            sqlmodel.select(
+                CompressorRecord.locomotive_name,
+                OrganRecord.compressor_name,
+                OrganRecord.name,
+                OrganRecord.label,
+            )
+            .outerjoin(
+                CompressorRecord,
+                OrganRecord.compressor_name
+                == CompressorRecord.name,
+            )
+            .order_by(OrganRecord.id)
+        ).all()
+    return (
+        [
+            {
+                "locomotive_name": name,
+                "compressor_name": None,
+                "organ_name": None,
+                "organ_label": None,
+            }
+            for name in locomotives
+        ]
+        + [
+            {
+                "locomotive_name": locomotive_name,
+                "compressor_name": name,
+                "organ_name": None,
+                "organ_label": None,
+            }
+            for locomotive_name, name in compressors
+        ]
+        + [
+            {
+                "locomotive_name": locomotive_name,
+                "compressor_name": compressor_name,
+                "organ_name": name,
+                "organ_label": label or name,
+            }
+            for locomotive_name, compressor_name, name, label in organs
+        ]
+    )
+
+
+def load_data_version() -> str:
+    ensure_database()
+    with rx.session() as session:
+        ids = [
+            session.exec(
+                sqlmodel.select(sqlalchemy.func.max(record.id))
+            ).one()
+            for record in DATA_VERSION_TABLES
+        ]
+    return "-".join(str(record_id or 0) for record_id in ids)
+
+
+def data_version_order(version: str) -> Tuple[int, ...]:
+    return tuple(
+        int(part) if part.isdigit() else 0
+        for part in version.split("-")
+    )
+
+
+def advanced_data_version(
+    version: str, table: type, inserted: int
+) -> str:
+    parts = list(data_version_order(version))
+    parts[DATA_VERSION_TABLES.index(table)] += inserted
+    return "-".join(str(part) for part in parts)
+
+
+def load_organ_aggregates(
+    organ_name: Optional[str] = None,
+) -> Dict[str, OrganAggregate]:
+    ensure_database()
+    query = sqlmodel.select(
+        FailureLogRecord.organ_name,
+        sqlalchemy.func.count(),
+        sqlalchemy.func.sum(
+            FailureLogRecord.uptime_since_last_failure
+        ),
+        sqlalchemy.func.sum(FailureLogRecord.repair_duration),
+    ).group_by(FailureLogRecord.organ_name)
+    if organ_name is not None:
+        query = query.where(
+            FailureLogRecord.organ_name == organ_name
+        )
+    with rx.session() as session:
+        return {
+            name: {
+                "failure_count": count,
+                "total_uptime": total_uptime,
+                "total_repair_duration": total_repair,
+            }
+            for name, count, total_uptime, total_repair in session.exec(
+                query
+            ).all()
+        }
+
+
+def load_failure_log_count() -> int:
+    ensure_database()
+    with rx.session() as session:
+        return session.exec(
+            sqlmodel.select(sqlalchemy.func.count(FailureLogRecord.id))
+        ).one()
+
+
+def load_fleet_aggregates() -> Dict[str, OrganAggregate]:
+    journal = get_failure_log_journal()
+    aggregates, journal_count = journal.state()
+    log_count = load_failure_log_count()
+    if journal_count == log_count:
+        return aggregates
+    aggregates = load_organ_aggregates()
+    journal.correct(
+        aggregates,
+        sum(
+            aggregate["failure_count"]
+            for aggregate in aggregates.values()
+        ),
+    )
+    return aggregates
+
+
+def load_maintenance_costs() -> Dict[str, MaintenanceCosts]:
+    ensure_database()
+    with rx.session() as session:
+        return {
+            name: {
+                "preventive_cost": preventive_cost,
+                "corrective_cost": corrective_cost,
+            }
+            for name, preventive_cost, corrective_cost in session.exec(
+                sqlmodel.select(
+                    OrganRecord.name,
+                    OrganRecord.preventive_cost,
+                    OrganRecord.corrective_cost,
+                )
+            ).all()
+        }
+
+
+def load_last_failure_dates() -> Dict[str, datetime.date]:
+    ensure_database()
+    with rx.session() as session:
+        return dict(
+            session.exec(
+                sqlmodel.select(
+                    FailureLogRecord.organ_name,
+                    sqlalchemy.func.max(FailureLogRecord.failure_date),
+                ).group_by(FailureLogRecord.organ_name)
+            ).all()
+        )
+
+
+def load_uptime_samples(
+    organ_names: List[str],
+    start: Optional[datetime.date] = None,
+    end: Optional[datetime.date] = None,
+    chunk_size: int = 500,
+) -> Tuple[List[str], List[float]]:
+    ensure_database()
+    names: List[str] = []
+    samples: List[float] = []
+    with rx.session() as session:
+        for offset in range(0, len(organ_names), chunk_size):
+            query = sqlmodel.select(
+                FailureLogRecord.organ_name,
+                FailureLogRecord.uptime_since_last_failure,
+            ).where(
+                FailureLogRecord.organ_name.in_(
+                    organ_names[offset : offset + chunk_size]
+                )
+            )
+            if start is not None:
+                query = query.where(
+                    FailureLogRecord.failure_date >= start
+                )
+            if end is not None:
+                query = query.where(
+                    FailureLogRecord.failure_date <= end
+                )
+            for name, uptime in session.exec(query):
+                names.append(name)
+                samples.append(uptime)
+    return names, samples
+
+
+def load_failure_history(
+    organ_name: str,
+) -> List[FailureLogEntry]:
+    ensure_database()
+    with rx.session() as session:
+        records = session.exec(
+            sqlmodel.select(FailureLogRecord)
+            .where(FailureLogRecord.organ_name == organ_name)
+            .order_by(
+                FailureLogRecord.failure_date,
+                FailureLogRecord.id,
+            )
+        ).all()
+        return [_to_entry(record) for record in records]
+
+
+def load_failure_history_page(
+    organ_name: str,
+    sort_by: str = "date",
+    descending: bool = False,
+    page_size: int = 20,
+    after: Optional[Tuple[Any, int]] = None,
+    before: Optional[Tuple[Any, int]] = None,
+    start: Optional[datetime.date] = None,
+    end: Optional[datetime.date] = None,
+) -> FailureHistoryPage:
+    ensure_database()
+    column = HISTORY_SORT_COLUMNS[sort_by]
+    backwards = before is not None
+    scan_descending = descending != backwards
+    cursor = before if backwards else after
+    query = sqlmodel.select(FailureLogRecord).where(
+        FailureLogRecord.organ_name == organ_name
+    )
+    if start is not None:
+        query = query.where(
+            FailureLogRecord.failure_date >= start
+        )
+    if end is not None:
+        query = query.where(FailureLogRecord.failure_date <= end)
+    if cursor is not None:
+        key = sqlalchemy.tuple_(column, FailureLogRecord.id)
+        bound = sqlalchemy.tuple_(
+            sqlalchemy.literal(cursor[0]),
+            sqlalchemy.literal(cursor[1]),
+        )
+        query = query.where(
+            key < bound if scan_descending else key > bound
+        )
+    if scan_descending:
+        query = query.order_by(
+            column.desc(), FailureLogRecord.id.desc()
+        )
+    else:
+        query = query.order_by(column, FailureLogRecord.id)
+    with rx.session() as session:
+        records = list(
+            session.exec(query.limit(page_size + 1)).all()
+        )
+    has_more = len(records) > page_size
+    records = records[:page_size]
+    if backwards:
+        records.reverse()
+    sort_attribute = column.key
+    return {
+        "entries": [_to_entry(record) for record in records],
+        "first_cursor": (
+            (getattr(records[0], sort_attribute), records[0].id)
+            if records
+            else None
+        ),
+        "last_cursor": (
+            (
+                getattr(records[-1], sort_attribute),
+                records[-1].id,
+            )
+            if records
+            else None
+        ),
+        "has_more": has_more,
+    }
+
+
+def iter_failure_log_batches(
+    organ_name: Optional[str] = None,
+    batch_size: int = 5000,
+) -> Iterator[List[FailureLogEntry]]:
+    if organ_name is not None:
+        page = load_failure_history_page(
+            organ_name, page_size=batch_size
+        )
+        while page["entries"]:
+            yield page["entries"]
+            if not page["has_more"]:
+                return
+            page = load_failure_history_page(
+                organ_name,
+                page_size=batch_size,
+                after=page["last_cursor"],
+            )
+        return
+    ensure_database()
+    last_id = 0
+    while True:
+        with rx.session() as session:
+            records = session.exec(
+                sqlmodel.select(FailureLogRecord)
+                .where(FailureLogRecord.id > last_id)
+                .order_by(FailureLogRecord.id)
+                .limit(batch_size)
+            ).all()
+            if not records:
+                return
+            last_id = records[-1].id
+            batch = [_to_entry(record) for record in records]
+        yield batch
+
+
+def _organ_exists(session: sqlmodel.Session, name: str) -> bool:
+    return (
+        session.exec(
+            sqlmodel.select(OrganRecord.id).where(
+                OrganRecord.name == name
+            )
+        ).first()
+        is not None
+    )
+
+
+def insert_organ(
+    label: str, compressor_name: Optional[str] = None
+) -> Optional[str]:
+    ensure_database()
+    with rx.session() as session:
+        duplicate = session.exec(
+            sqlmodel.select(OrganRecord.id).where(
+                OrganRecord.compressor_name == compressor_name,
+                OrganRecord.label == label,
+            )
+        ).first()
+        if duplicate is not None:
+            return None
+        name = label
+        if _organ_exists(session, name):
+            if compressor_name is None:
+                return None
+            name = f"{label} ({compressor_name})"
+            if _organ_exists(session, name):
+                return None
+        session.add(
+            OrganRecord(
+                name=name,
+                label=label,
+                compressor_name=compressor_name,
+            )
+        )
+        session.commit()
+        return name
+
+
+def insert_locomotive(name: str) -> bool:
+    ensure_database()
+    with rx.session() as session:
+        exists = session.exec(
+            sqlmodel.select(LocomotiveRecord.id).where(
+                LocomotiveRecord.name == name
+            )
+        ).first()
+        if exists is not None:
+            return False
+        session.add(LocomotiveRecord(name=name))
+        session.commit()
+        return True
+
+
+def insert_compressor(name: str, locomotive_name: str) -> bool:
+    ensure_database()
+    with rx.session() as session:
+        exists = session.exec(
+            sqlmodel.select(CompressorRecord.id).where(
+                CompressorRecord.name == name
+            )
+        ).first()
+        if exists is not None:
+            return False
+        session.add(
+            CompressorRecord(
+                name=name, locomotive_name=locomotive_name
+            )
+        )
+        session.commit()
+        return True
+
+
+def update_maintenance_costs(
+    name: str, costs: MaintenanceCosts
+) -> bool:
+    ensure_database()
+    with rx.session() as session:
+        record = session.exec(
+            sqlmodel.select(OrganRecord).where(
+                OrganRecord.name == name
+            )
+        ).first()
+        if record is None:
+            return False
+        record.preventive_cost = costs["preventive_cost"]
+        record.corrective_cost = costs["corrective_cost"]
+        session.add(record)
+        session.add(
+            MaintenanceCostChangeRecord(
+                organ_name=name,
+                preventive_cost=costs["preventive_cost"],
+                corrective_cost=costs["corrective_cost"],
+            )
+        )
+        session.commit()
+        return True
+
+
+def insert_failure_log(log: FailureLogEntry) -> None:
+    insert_failure_log_batch([log])
+
+
+def insert_failure_log_batch(batch: List[FailureLogEntry]) -> None:
+    ensure_database()
+    journal = get_failure_log_journal()
+    txn = journal.begin()
+    try:
+        journal.append_failure_logs(batch, txn)
+        with rx.session() as session:
+            session.connection().execute(
+                FailureLogRecord.__table__.insert(),
+                [
+                    {
+                        "organ_name": log["organ_name"],
+                        "failure_date": datetime.date.fromisoformat(
+                            log["failure_date"]
+                        ),
+                        "uptime_since_last_failure": log[
+                            "uptime_since_last_failure"
+                        ],
+                        "repair_duration": log["repair_duration"],
+                        "description": log["description"],
+                    }
+                    for log in batch
+                ],
+            )
+            session.commit()
+    except BaseException:
+        journal.abort(txn)
+        raise
+    journal.commit(txn)
@@ -0,0 +1,154 @@
+from typing import Any, Iterable, Iterator, List, Sequence
+import csv
+import datetime
+import io
+import tempfile
+
+from tableau_de_bord_de_suivi_gpta.analytics.types import (
+    FailureLogEntry,
+    Organ,
+)
+
+ORGAN_COLUMNS: List[str] = list(Organ.__annotations__)
+FAILURE_LOG_COLUMNS: List[str] = list(
+    FailureLogEntry.__annotations__
+)
+PARQUET_SPOOL_SIZE = 8 * 1024 * 1024
+PARQUET_READ_SIZE = 64 * 1024
+
+
+def _csv_chunk(rows: Iterable[Sequence[Any]]) -> str:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator="\n")
+    writer.writerows(rows)
+    return buffer.getvalue()
+
+
+def _iter_history_csv(
+    history_batches: Iterable[List[FailureLogEntry]],
+) -> Iterator[str]:
+    yield "\n\nHistorique des Pannes:\n"
+    empty = True
+    for batch in history_batches:
+        if empty:
+            yield _csv_chunk([FAILURE_LOG_COLUMNS])
+            empty = False
+        yield _csv_chunk(
+            [log[column] for column in FAILURE_LOG_COLUMNS]
+            for log in batch
+        )
+    if empty:
+        yield "Aucune panne enregistrée."
+
+
+def iter_organ_report_csv(
+    details: Organ,
+    history_batches: Iterable[List[FailureLogEntry]],
+) -> Iterator[bytes]:
+    yield "Details de l'Organe:\n".encode("utf-8")
+    yield _csv_chunk(
+        [
+            ORGAN_COLUMNS,
+            [details[column] for column in ORGAN_COLUMNS],
+        ]
+    ).encode("utf-8")
+    for chunk in _iter_history_csv(history_batches):
+        yield chunk.encode("utf-8")
+
+
+def iter_fleet_report_csv(
+    organs: Sequence[Organ],
+    history_batches: Iterable[List[FailureLogEntry]],
+    organs_per_chunk: int = 1000,
+) -> Iterator[bytes]:
+    yield "Métriques de la Flotte:\n".encode("utf-8")
+    yield _csv_chunk([ORGAN_COLUMNS]).encode("utf-8")
+    for start in range(0, len(organs), organs_per_chunk):
+        yield _csv_chunk(
+            [organ[column] for column in ORGAN_COLUMNS]
+            for organ in organs[
+                start : start + organs_per_chunk
+            ]
+        ).encode("utf-8")
+    for chunk in _iter_history_csv(history_batches):
+        yield chunk.encode("utf-8")
+
+
+def _organ_schema():
+    import pyarrow as pa
+
+    return pa.schema(
+        [("name", pa.string())]
+        + [
+            (column, pa.float64())
+            for column in ORGAN_COLUMNS
+            if column != "name"
+        ]
+    )
+
+
+def _failure_log_schema():
+    import pyarrow as pa
+
+    return pa.schema(
+        [
+            ("organ_name", pa.string()),
+            ("failure_date", pa.date32()),
+            ("uptime_since_last_failure", pa.float64()),
+            ("repair_duration", pa.float64()),
+            ("description", pa.string()),
+        ]
+    )
+
+
+def _iter_parquet(
+    batches: Iterable[List[dict]], schema
+) -> Iterator[bytes]:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    with tempfile.SpooledTemporaryFile(
+        max_size=PARQUET_SPOOL_SIZE
+    ) as sink:
+        with pq.ParquetWriter(sink, schema) as writer:
+            for batch in batches:
+                writer.write_table(
+                    pa.Table.from_pylist(batch, schema=schema)
+                )
+        sink.seek(0)
+        while chunk := sink.read(PARQUET_READ_SIZE):
+            yield chunk
+
+
+def iter_organs_parquet(
+    organs: Sequence[Organ], organs_per_chunk: int = 10000
+) -> Iterator[bytes]:
+    return _iter_parquet(
+        (
+            list(organs[start : start + organs_per_chunk])
+            for start in range(
+                0, len(organs), organs_per_chunk
+            )
+        ),
+        _organ_schema(),
+    )
+
+
+def iter_failure_logs_parquet(
+    history_batches: Iterable[List[FailureLogEntry]],
+) -> Iterator[bytes]:
+    return _iter_parquet(
+        (
+            [
+                {
+                    **log,
+                    "failure_date": datetime.date.fromisoformat(
+                        log["failure_date"]
+                    ),
+                }
+                for log in batch
+            ]
+            for batch in history_batches
+        ),
+        _failure_log_schema(),
+    )
@@ -0,0 +1,123 @@
+from typing import (
+    Any,
+    Container,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+    TypedDict,
+)
+import json
+
+from tableau_de_bord_de_suivi_gpta.analytics.types import (
+    FailureLogEntry,
+)
+from tableau_de_bord_de_suivi_gpta.ingestion.validation import (
+    FailureRecordError,
+    parse_failure_record,
+)
+
+JSON_MEDIA_TYPE = "application/json"
+NDJSON_MEDIA_TYPES = ("application/x-ndjson", "application/ndjson")
+MAX_BATCH_RECORDS = 5000
+
+RECORD_ACCEPTED = "accepted"
+RECORD_REJECTED = "rejected"
+
+
+class RecordResult(TypedDict):
+    index: int
+    status: str
+    reason: Optional[str]
+
+
+class BatchPayloadError(ValueError):
+    pass
+
+
+class BatchTooLargeError(BatchPayloadError):
+    pass
+
+
+class UnsupportedMediaTypeError(BatchPayloadError):
+    pass
+
+
+_INVALID_LINE = object()
+
+
+def _decode_ndjson(text: str) -> List[Any]:
+    records: List[Any] = []
+    for line in text.splitlines():
+        if not line.strip():
+            continue
+        try:
+            records.append(json.loads(line))
+        except ValueError:
+            records.append(_INVALID_LINE)
+    return records
+
+
+def decode_batch(body: bytes, content_type: str) -> List[Any]:
+    media_type = content_type.split(";")[0].strip().lower()
+    try:
+        text = body.decode("utf-8-sig")
+    except UnicodeDecodeError:
+        raise BatchPayloadError("Le corps doit être encodé en UTF-8.")
+    if media_type in NDJSON_MEDIA_TYPES:
+        records = _decode_ndjson(text)
+    elif media_type in ("", JSON_MEDIA_TYPE):
+        try:
+            payload = json.loads(text)
+        except ValueError:
+            raise BatchPayloadError("JSON invalide.")
+        if isinstance(payload, Mapping):
+            payload = payload.get("records")
+        if not isinstance(payload, list):
+            raise BatchPayloadError(
+                "Une liste de relevés (ou un objet 'records') est attendue."
+            )
+        records = payload
+    else:
+        raise UnsupportedMediaTypeError(
+            f"Type de contenu non pris en charge: '{media_type}'."
+        )
+    if not records:
+        raise BatchPayloadError("Le lot est vide.")
+    if len(records) > MAX_BATCH_RECORDS:
+        raise BatchTooLargeError(
+            f"Le lot dépasse {MAX_BATCH_RECORDS} relevés."
+        )
+    return records
+
+
+def validate_batch(
+    records: List[Any], known_organs: Container[str]
+) -> Tuple[List[FailureLogEntry], List[RecordResult]]:
+    entries: List[FailureLogEntry] = []
+    results: List[RecordResult] = []
+    for index, record in enumerate(records):
+        if record is _INVALID_LINE:
+            reason = "Ligne JSON invalide."
+        elif not isinstance(record, Mapping):
+            reason = "Chaque relevé doit être un objet JSON."
+        else:
+            try:
+                entries.append(
+                    parse_failure_record(record, known_organs)
+                )
+            except FailureRecordError as e:
+                reason = str(e)
+            else:
+                results.append(
+                    {
+                        "index": index,
+                        "status": RECORD_ACCEPTED,
+                        "reason": None,
+                    }
+                )
+                continue
+        results.append(
+            {"index": index, "status": RECORD_REJECTED, "reason": reason}
+        )
+    return entries, results
@@ -0,0 +1,187 @@
+from typing import (
+    Any,
+    BinaryIO,
+    Callable,
+    Container,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    TypedDict,
+)
+import csv
+import datetime
+import io
+
+from tableau_de_bord_de_suivi_gpta.analytics.types import (
+    FailureLogEntry,
+)
+from tableau_de_bord_de_suivi_gpta.ingestion.validation import (
+    FAILURE_RECORD_FIELDS,
+    FailureRecordError,
+    parse_failure_record,
+)
+
+IMPORT_BATCH_SIZE = 5000
+MAX_REPORTED_REJECTIONS = 200
+
+
+class RejectedRow(TypedDict):
+    line: int
+    reason: str
+
+
+class ImportReport(TypedDict):
+    filename: str
+    accepted: int
+    rejected: int
+    rejections: List[RejectedRow]
+
+
+class ImportFormatError(ValueError):
+    pass
+
+
+def new_import_report(filename: str) -> ImportReport:
+    return {
+        "filename": filename,
+        "accepted": 0,
+        "rejected": 0,
+        "rejections": [],
+    }
+
+
+def _reject(report: ImportReport, line: int, reason: str):
+    report["rejected"] += 1
+    if len(report["rejections"]) < MAX_REPORTED_REJECTIONS:
+        report["rejections"].append(
+            {"line": line, "reason": reason}
+        )
+
+
+def _normalize_header(header: List[Any]) -> List[str]:
+    names = [
+        "" if name is None else str(name).strip().lower()
+        for name in header
+    ]
+    missing = [
+        field
+        for field in FAILURE_RECORD_FIELDS
+        if field not in names
+    ]
+    if missing:
+        raise ImportFormatError(
+            "Colonnes manquantes: " + ", ".join(missing)
+        )
+    return names
+
+
+def _cell_to_str(value: Any) -> str:
+    if value is None:
+        return ""
+    if isinstance(value, datetime.datetime):
+        return value.date().isoformat()
+    if isinstance(value, datetime.date):
+        return value.isoformat()
+    return str(value)
+
+
+def iter_csv_rows(
+    stream: BinaryIO,
+) -> Iterator[Tuple[int, Dict[str, str]]]:
+    text = io.TextIOWrapper(
+        stream, encoding="utf-8-sig", newline=""
+    )
+    sample = text.read(4096)
+    text.seek(0)
+    try:
+        dialect = csv.Sniffer().sniff(sample, delimiters=",;\t")
+    except csv.Error:
+        dialect = csv.excel
+    reader = csv.reader(text, dialect)
+    header = next(reader, None)
+    if header is None:
+        raise ImportFormatError("Le fichier est vide.")
+    names = _normalize_header(header)
+    for row in reader:
+        if not any(cell.strip() for cell in row):
+            continue
+        yield reader.line_num, dict(zip(names, row))
+
+
+def iter_excel_rows(
+    stream: BinaryIO,
+) -> Iterator[Tuple[int, Dict[str, str]]]:
+    try:
+        import openpyxl
+    except ImportError:
+        raise ImportFormatError(
+            "L'import Excel nécessite le paquet openpyxl."
+        )
+    workbook = openpyxl.load_workbook(
+        stream, read_only=True, data_only=True
+    )
+    try:
+        rows = workbook.worksheets[0].iter_rows(
+            values_only=True
+        )
+        header = next(rows, None)
+        if header is None:
+            raise ImportFormatError("Le fichier est vide.")
+        names = _normalize_header(list(header))
+        for line, row in enumerate(rows, start=2):
+            cells = [_cell_to_str(value) for value in row]
+            if not any(cell.strip() for cell in cells):
+                continue
+            yield line, dict(zip(names, cells))
+    finally:
+        workbook.close()
+
+
+def iter_failure_rows(
+    stream: BinaryIO, filename: str
+) -> Iterator[Tuple[int, Dict[str, str]]]:
+    if filename.lower().endswith((".xlsx", ".xlsm")):
+        return iter_excel_rows(stream)
+    return iter_csv_rows(stream)
+
+
+def iter_valid_entries(
+    rows: Iterator[Tuple[int, Dict[str, str]]],
+    known_organs: Container[str],
+    report: ImportReport,
+) -> Iterator[FailureLogEntry]:
+    for line, row in rows:
+        try:
+            entry = parse_failure_record(row, known_organs)
+        except FailureRecordError as e:
+            _reject(report, line, str(e))
+            continue
+        report["accepted"] += 1
+        yield entry
+
+
+def import_failure_logs(
+    stream: BinaryIO,
+    filename: str,
+    known_organs: Container[str],
+    store_batch: Callable[[List[FailureLogEntry]], None],
+    batch_size: int = IMPORT_BATCH_SIZE,
+    report: Optional[ImportReport] = None,
+) -> ImportReport:
+    if report is None:
+        report = new_import_report(filename)
+    batch: List[FailureLogEntry] = []
+    for entry in iter_valid_entries(
+        iter_failure_rows(stream, filename),
+        known_organs,
+        report,
+    ):
+        batch.append(entry)
+        if len(batch) >= batch_size:
+            store_batch(batch)
+            batch = []
+    if batch:
+        store_batch(batch)
+    return report
@@ -0,0 +1,78 @@
+from typing import Any, Container, Mapping
+import datetime
+import math
+
+from tableau_de_bord_de_suivi_gpta.analytics.types import (
+    FailureLogEntry,
+)
+
+FAILURE_RECORD_FIELDS = (
+    "organ_name",
+    "failure_date",
+    "uptime_since_last_failure",
+    "repair_duration",
+    "description",
+)
+
+
+class FailureRecordError(ValueError):
+    pass
+
+
+def _field(record: Mapping[str, Any], name: str) -> str:
+    value = record.get(name)
+    return "" if value is None else str(value).strip()
+
+
+def parse_failure_record(
+    record: Mapping[str, Any],
+    known_organs: Container[str],
+) -> FailureLogEntry:
+    organ_name = _field(record, "organ_name")
+    failure_date_str = _field(record, "failure_date")
+    uptime_str = _field(record, "uptime_since_last_failure")
+    repair_duration_str = _field(record, "repair_duration")
+    description = _field(record, "description")
+    if not all(
+        [
+            organ_name,
+            failure_date_str,
+            uptime_str,
+            repair_duration_str,
+            description,
+        ]
+    ):
+        raise FailureRecordError(
+            "Tous les champs sont obligatoires."
+        )
+    try:
+        uptime = float(uptime_str.replace(",", "."))
+        repair_duration = float(
+            repair_duration_str.replace(",", ".")
+        )
+        if not (
+            math.isfinite(uptime) and math.isfinite(repair_duration)
+        ):
+            raise ValueError(uptime_str)
+        if uptime <= 0 or repair_duration <= 0:
+            raise FailureRecordError(
+                "Temps de fonctionnement et durée de réparation doivent être positifs."
+            )
+        failure_date = datetime.date.fromisoformat(failure_date_str)
+    except FailureRecordError:
+        raise
+    except ValueError:
+        raise FailureRecordError(
+            "Veuillez entrer des nombres valides pour les durées et une date valide."
+        )
+    if organ_name not in known_organs:
+        raise FailureRecordError(
+            f"Organe inconnu: '{organ_name}'."
+        )
+    return {
+        "organ_name": organ_name,
+        "failure_date": failure_date.isoformat(),
+        "uptime_since_last_failure": uptime,
+        "repair_duration": repair_duration,
+        "description": description,
+    }
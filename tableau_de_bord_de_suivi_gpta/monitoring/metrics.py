@@ -0,0 +1,207 @@
+from typing import Any, Callable, Dict, List, Sequence, Tuple
+import bisect
+import functools
+import inspect
+import os
+import threading
+import time
+
+METRICS_ENABLED_ENV = "GPTA_METRICS_ENABLED"
+LATENCY_BUCKETS: Tuple[float, ...] = (
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+EVENT_METRIC = "gpta_state_event_duration_seconds"
+VAR_METRIC = "gpta_state_var_duration_seconds"
+METRIC_HELP = {
+    EVENT_METRIC: "Execution time of GptaState event handlers.",
+    VAR_METRIC: "Computation time of GptaState computed vars.",
+}
+METRIC_LABELS = {EVENT_METRIC: "handler", VAR_METRIC: "var"}
+
+
+def metrics_enabled() -> bool:
+    return os.environ.get(METRICS_ENABLED_ENV, "").lower() in (
+        "1",
+        "true",
+        "yes",
+    )
+
+
+class LatencyHistogram:
+    def __init__(self, buckets: Sequence[float] = LATENCY_BUCKETS):
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.total = 0.0
+        self._lock = threading.Lock()
+
+    def observe(self, seconds: float) -> None:
+        index = bisect.bisect_left(self.buckets, seconds)
+        with self._lock:
+            self.counts[index] += 1
+            self.total += seconds
+
+    def snapshot(self) -> Tuple[List[int], float]:
+        with self._lock:
+            return list(self.counts), self.total
+
+
+class MetricsRegistry:
+    def __init__(self):
+        self._histograms: Dict[Tuple[str, str], LatencyHistogram] = {}
+        self._lock = threading.Lock()
+
+    def histogram(self, metric: str, name: str) -> LatencyHistogram:
+        with self._lock:
+            histogram = self._histograms.get((metric, name))
+            if histogram is None:
+                histogram = self._histograms[(metric, name)] = (
+                    LatencyHistogram()
+                )
+            return histogram
+
+    def clear(self) -> None:
+        with self._lock:
+            self._histograms.clear()
+
+    def render(self) -> str:
+        with self._lock:
+            histograms = sorted(self._histograms.items())
+        lines: List[str] = []
+        for metric in (EVENT_METRIC, VAR_METRIC):
+            lines.append(f"# HELP {metric} {METRIC_HELP[metric]}")
+            lines.append(f"# TYPE {metric} histogram")
+            label = METRIC_LABELS[metric]
+            for (family, name), histogram in histograms:
+                if family != metric:
+                    continue
+                counts, total = histogram.snapshot()
+                escaped = (
+                    name.replace("\\", "\\\\")
+                    .replace('"', '\\"')
+                    .replace("\n", "\\n")
+                )
+                cumulative = 0
+                for bound, count in zip(
+                    (*histogram.buckets, "+Inf"), counts
+                ):
+                    cumulative += count
+                    lines.append(
+                        f'{metric}_bucket{{{label}="{escaped}",le="{bound}"}} {cumulative}'
+                    )
+                lines.append(
+                    f'{metric}_sum{{{label}="{escaped}"}} {total}'
+                )
+                lines.append(
+                    f'{metric}_count{{{label}="{escaped}"}} {cumulative}'
+                )
+        return "\n".join(lines) + "\n"
+
+
+registry = MetricsRegistry()
+
+
+def timed(
+    fn: Callable[..., Any], histogram: LatencyHistogram
+) -> Callable[..., Any]:
+    clock = time.perf_counter
+    if inspect.isasyncgenfunction(fn):
+
+        @functools.wraps(fn)
+        async def timed_async_generator(*args, **kwargs):
+            events = fn(*args, **kwargs)
+            elapsed = 0.0
+            try:
+                while True:
+                    start = clock()
+                    try:
+                        event = await events.__anext__()
+                    except StopAsyncIteration:
+                        elapsed += clock() - start
+                        return
+                    elapsed += clock() - start
+                    yield event
+            finally:
+                histogram.observe(elapsed)
+
+        return timed_async_generator
+    if inspect.iscoroutinefunction(fn):
+
+        @functools.wraps(fn)
+        async def timed_coroutine(*args, **kwargs):
+            start = clock()
+            try:
+                return await fn(*args, **kwargs)
+            finally:
+                histogram.observe(clock() - start)
+
+        return timed_coroutine
+    if inspect.isgeneratorfunction(fn):
+
+        @functools.wraps(fn)
+        def timed_generator(*args, **kwargs):
+            events = fn(*args, **kwargs)
+            elapsed = 0.0
+            try:
+                while True:
+                    start = clock()
+                    try:
+                        event = next(events)
+                    except StopIteration as stop:
+                        elapsed += clock() - start
+                        return stop.value
+                    elapsed += clock() - start
+                    yield event
+            finally:
+                histogram.observe(elapsed)
+
+        return timed_generator
+
+    @functools.wraps(fn)
+    def timed_function(*args, **kwargs):
+        start = clock()
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            histogram.observe(clock() - start)
+
+    return timed_function
+
+
+def instrument_state(state_cls: type) -> None:
+    for name, handler in state_cls.event_handlers.items():
+        if getattr(handler.fn, "__wrapped__", None) is not None:
+            continue
+        object.__setattr__(
+            handler,
+            "fn",
+            timed(
+                handler.fn, registry.histogram(EVENT_METRIC, name)
+            ),
+        )
+    for name, computed_var in state_cls.computed_vars.items():
+        fget = computed_var._fget
+        if getattr(fget, "__wrapped__", None) is not None:
+            continue
+        deps = computed_var._deps(objclass=state_cls)
+        timed_fget = timed(fget, registry.histogram(VAR_METRIC, name))
+        for descriptor in {
+            id(var): var
+            for var in (computed_var, vars(state_cls).get(name))
+            if var is not None and getattr(var, "_fget", None) is fget
+        }.values():
+            object.__setattr__(descriptor, "_static_deps", deps)
+            object.__setattr__(descriptor, "_auto_deps", False)
+            object.__setattr__(descriptor, "_fget", timed_fget)
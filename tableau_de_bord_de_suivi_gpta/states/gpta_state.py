@@ -1,131 +1,326 @@
 import reflex as rx
-from typing import TypedDict, List, Optional, Dict
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    List,
+    Optional,
+    Dict,
+    Tuple,
+)
+import asyncio
+import contextlib
 import math
 import datetime
-import pandas as pd
+import json
+import os
+import shutil
+import tempfile
+import threading
+import urllib.parse
+from tableau_de_bord_de_suivi_gpta.analytics.types import (
+    AvailabilitySimulation,
+    CurveSeries,
+    Organ,
+    OrganStatus,
+    FailureHistoryPage,
+    FailureLogEntry,
+    HierarchyNode,
+    HierarchyNodeSummary,
+    MaintenanceCosts,
+    MaintenanceSlot,
+    NodeRollup,
+    OrganAggregate,
+    OrganPlacement,
+    ParetoEntry,
+    ReplacementPlan,
+    SystemReliability,
+    WeibullFit,
+    WeibullMetrics,
+)
+from tableau_de_bord_de_suivi_gpta.analytics.aggregates import (
+    add_log_to_index,
+    metrics_from_aggregate,
+)
+from tableau_de_bord_de_suivi_gpta.analytics.constants import (
+    DEFAULT_CORRECTIVE_COST,
+    DEFAULT_OPERATING_HOURS_PER_DAY,
+    DEFAULT_PREVENTIVE_COST,
+    HOURS_PER_YEAR,
+)
+from tableau_de_bord_de_suivi_gpta.analytics.hierarchy import (
+    FLEET_KEY,
+    LEVEL_COMPRESSOR,
+    LEVEL_FLEET,
+    LEVEL_LOCOMOTIVE,
+    LEVEL_ORGAN,
+    node_key,
+)
+from tableau_de_bord_de_suivi_gpta.analytics.pareto import (
+    pareto_rows,
+)
+from tableau_de_bord_de_suivi_gpta.analytics.time_index import (
+    DateWindow,
+    month_window,
+    year_window,
+)
+from tableau_de_bord_de_suivi_gpta.cache.metrics_cache import (
+    get_metrics_cache,
+)
+from tableau_de_bord_de_suivi_gpta.ingestion.validation import (
+    FailureRecordError,
+    parse_failure_record,
+)
+from tableau_de_bord_de_suivi_gpta.ingestion.bulk_import import (
+    ImportFormatError,
+    ImportReport,
+    import_failure_logs,
+    new_import_report,
+)
+from tableau_de_bord_de_suivi_gpta.db.fleet_store import FleetStore
+from tableau_de_bord_de_suivi_gpta.db.repository import (
+    insert_compressor,
+    insert_failure_log,
+    insert_failure_log_batch,
+    insert_locomotive,
+    insert_organ,
+    load_failure_history_page,
+    load_last_failure_dates,
+    load_organ_names,
+    load_uptime_samples,
+    update_maintenance_costs,
+)
+from tableau_de_bord_de_suivi_gpta.tasks.runner import (
+    TASK_POLL_INTERVAL,
+    TaskCancelled,
+    TaskProgress,
+    cancel_task,
+    submit_task,
+)
+
+if TYPE_CHECKING:
+    from tableau_de_bord_de_suivi_gpta.analytics.rbd import (
+        ReliabilityDiagram,
+    )
+    from tableau_de_bord_de_suivi_gpta.analytics.weibull import (
+        WeibullFitCache,
+    )
+
+metrics_cache = get_metrics_cache()
+fleet_store = FleetStore(metrics_cache)
+reliability_diagrams: Dict[str, "ReliabilityDiagram"] = {}
+_reliability_diagrams_lock = threading.Lock()
+_weibull_fits: Optional["WeibullFitCache"] = None
+_weibull_fits_lock = threading.Lock()
+
+ALL_YEARS = 0
+WHOLE_YEAR = 0
+MAX_COMPARED_ORGANS = 5
+WEIBULL_WARM_BATCH = 500
+DEFAULT_SIMULATION_MISSIONS = 100_000
+MAX_SIMULATION_MISSIONS = 5_000_000
+HIERARCHY_CHILD_LABELS = {
+    LEVEL_FLEET: "Nouvelle locomotive",
+    LEVEL_LOCOMOTIVE: "Nouveau compresseur",
+    LEVEL_COMPRESSOR: "Nouvel organe",
+}
+CURVE_COLORS = [
+    "#F68B1E",
+    "#4F46E5",
+    "#10B981",
+    "#EF4444",
+    "#8B5CF6",
+    "#0EA5E9",
+    "#EAB308",
+]
+
+
+def _load_weibull_samples(
+    organ_names: List[str], window: Optional[DateWindow]
+) -> Tuple[List[str], List[float]]:
+    if window is None:
+        return load_uptime_samples(organ_names)
+    return load_uptime_samples(organ_names, *window)
+
+
+def get_weibull_fits() -> "WeibullFitCache":
+    global _weibull_fits
+    with _weibull_fits_lock:
+        if _weibull_fits is None:
+            from tableau_de_bord_de_suivi_gpta.analytics.weibull import (
+                WeibullFitCache,
+            )
+
+            _weibull_fits = WeibullFitCache()
+        return _weibull_fits
+
+
+def _weibull_fits_for(
+    organ_names: List[str], window: Optional[DateWindow]
+) -> Dict[str, Optional[WeibullFit]]:
+    fleet_store.ensure_loaded()
+    return get_weibull_fits().fits(
+        organ_names,
+        fleet_store.aggregates,
+        window,
+        _load_weibull_samples,
+    )
+
+
+def _compute_fleet_rates(
+    organ_names: List[str], window: Optional[DateWindow]
+):
+    from tableau_de_bord_de_suivi_gpta.analytics.fleet_engine import (
+        aggregate_columns,
+        fleet_failure_rates,
+    )
+
+    counts, total_uptime, _ = aggregate_columns(
+        fleet_store.window_aggregates(window), organ_names
+    )
+    return fleet_failure_rates(counts, total_uptime)
+
+
+def _fleet_recompute_work(
+    window: Optional[DateWindow],
+) -> Callable[[TaskProgress], Tuple[str, List[str], Any]]:
+    def work(progress: TaskProgress):
+        progress.report(0.0, "Chargement des données de la flotte")
+        version = fleet_store.refresh()
+        organ_names = fleet_store.organ_names
+        progress.report(0.3, "Calcul des taux de défaillance")
+        lambda_val = metrics_cache.get_or_compute(
+            ("fleet_rates", version, window),
+            lambda: _compute_fleet_rates(organ_names, window),
+        )
+        snapshot = (version, organ_names, lambda_val)
+        progress.report(
+            0.5, "Ajustement des modèles de Weibull", snapshot
+        )
+        for start in range(
+            0, len(organ_names), WEIBULL_WARM_BATCH
+        ):
+            end = min(len(organ_names), start + WEIBULL_WARM_BATCH)
+            _weibull_fits_for(organ_names[start:end], window)
+            progress.report(
+                0.5 + 0.5 * end / len(organ_names),
+                f"Modèles de Weibull: {end}/{len(organ_names)} organes",
+            )
+        return snapshot
+
+    return work
+
+
+def compressor_reliability_diagram(
+    key: str,
+) -> Optional["ReliabilityDiagram"]:
+    from tableau_de_bord_de_suivi_gpta.analytics.rbd import (
+        ReliabilityDiagram,
+        compressor_diagram,
+    )
+
+    root = compressor_diagram(
+        fleet_store.hierarchy.nodes[key]["name"],
+        fleet_store.hierarchy.organ_labels(key),
+    )
+    if root is None:
+        return None
+    with _reliability_diagrams_lock:
+        diagram = reliability_diagrams.get(key)
+        if diagram is None or diagram.root != root:
+            diagram = ReliabilityDiagram(root)
+            reliability_diagrams[key] = diagram
+        return diagram
 
 
-class Organ(TypedDict):
-    name: str
-    mtbf: Optional[float]
-    mttr: Optional[float]
-    lambda_val: Optional[float]
-    reliability_at_t: Optional[float]
-    availability: Optional[float]
-    preventive_maintenance_period: Optional[float]
+def _availability_simulation_work(
+    key: str,
+    window: Optional[DateWindow],
+    missions: int,
+    horizon: float,
+) -> Callable[[TaskProgress], AvailabilitySimulation]:
+    def work(progress: TaskProgress):
+        from tableau_de_bord_de_suivi_gpta.analytics.simulation import (
+            organ_failure_models,
+            simulate_availability,
+        )
 
+        progress.report(0.0, "Préparation des modèles de défaillance")
+        fleet_store.ensure_loaded()
+        organ_names = fleet_store.hierarchy.organ_names(key)
+        models = organ_failure_models(
+            organ_names,
+            _weibull_fits_for(organ_names, window),
+            fleet_store.window_aggregates(window),
+        )
+        diagram = compressor_reliability_diagram(key)
+        return simulate_availability(
+            models,
+            missions,
+            horizon,
+            progress=lambda fraction: progress.report(
+                fraction,
+                f"{round(fraction * missions)}/{missions} missions simulées",
+            ),
+            diagram=diagram.root if diagram is not None else None,
+        )
 
-class FailureLogEntry(TypedDict):
-    organ_name: str
-    failure_date: str
-    uptime_since_last_failure: float
-    repair_duration: float
-    description: str
+    return work
+
+
+def _store_failure_log(log: FailureLogEntry) -> str:
+    insert_failure_log(log)
+    version = fleet_store.record_failure_log(log)
+    get_weibull_fits().invalidate([log["organ_name"]])
+    return version
+
+
+def _failure_log_import_work(
+    path: str, filename: str
+) -> Callable[
+    [TaskProgress],
+    Tuple[ImportReport, Dict[str, OrganAggregate], str],
+]:
+    def work(progress: TaskProgress):
+        size = max(1, os.path.getsize(path))
+        report = new_import_report(filename)
+        delta: Dict[str, OrganAggregate] = {}
+        interruption = ""
+        with open(path, "rb") as stream:
+
+            def store_batch(batch: List[FailureLogEntry]):
+                insert_failure_log_batch(batch)
+                for entry in batch:
+                    add_log_to_index(delta, entry)
+                progress.report(
+                    stream.tell() / size,
+                    f"{report['accepted']} relevé(s) lu(s), {report['rejected']} rejeté(s)",
+                    {
+                        **report,
+                        "rejections": list(report["rejections"]),
+                    },
+                )
+
+            try:
+                import_failure_logs(
+                    stream,
+                    filename,
+                    set(load_organ_names()),
+                    store_batch,
+                    report=report,
+                )
+            except TaskCancelled:
+                interruption = "Import annulé."
+            except ImportFormatError as e:
+                interruption = str(e)
+        return report, delta, interruption
+
+    return work
 
 
 class GptaState(rx.State):
-    organs: List[Organ] = [
-        {
-            "name": "Groupe à vis",
-            "mtbf": None,
-            "mttr": None,
-            "lambda_val": None,
-            "reliability_at_t": None,
-            "availability": None,
-            "preventive_maintenance_period": None,
-        },
-        {
-            "name": "Moteur",
-            "mtbf": None,
-            "mttr": None,
-            "lambda_val": None,
-            "reliability_at_t": None,
-            "availability": None,
-            "preventive_maintenance_period": None,
-        },
-        {
-            "name": "Sécheur d'air",
-            "mtbf": None,
-            "mttr": None,
-            "lambda_val": None,
-            "reliability_at_t": None,
-            "availability": None,
-            "preventive_maintenance_period": None,
-        },
-        {
-            "name": "Électrovanne de régénération",
-            "mtbf": None,
-            "mttr": None,
-            "lambda_val": None,
-            "reliability_at_t": None,
-            "availability": None,
-            "preventive_maintenance_period": None,
-        },
-        {
-            "name": "ADCU (unité de commande)",
-            "mtbf": None,
-            "mttr": None,
-            "lambda_val": None,
-            "reliability_at_t": None,
-            "availability": None,
-            "preventive_maintenance_period": None,
-        },
-        {
-            "name": "Capteur de point de rosée",
-            "mtbf": None,
-            "mttr": None,
-            "lambda_val": None,
-            "reliability_at_t": None,
-            "availability": None,
-            "preventive_maintenance_period": None,
-        },
-        {
-            "name": "Soupape by-pass",
-            "mtbf": None,
-            "mttr": None,
-            "lambda_val": None,
-            "reliability_at_t": None,
-            "availability": None,
-            "preventive_maintenance_period": None,
-        },
-    ]
-    failure_logs: List[FailureLogEntry] = [
-        {
-            "organ_name": "Groupe à vis",
-            "failure_date": "2023-01-15",
-            "uptime_since_last_failure": 2000,
-            "repair_duration": 10,
-            "description": "Défaillance roulement",
-        },
-        {
-            "organ_name": "Groupe à vis",
-            "failure_date": "2023-05-20",
-            "uptime_since_last_failure": 2800,
-            "repair_duration": 12,
-            "description": "Fuite joint",
-        },
-        {
-            "organ_name": "Moteur",
-            "failure_date": "2023-03-10",
-            "uptime_since_last_failure": 3500,
-            "repair_duration": 24,
-            "description": "Surchauffe",
-        },
-        {
-            "organ_name": "Sécheur d'air",
-            "failure_date": "2023-06-01",
-            "uptime_since_last_failure": 4000,
-            "repair_duration": 8,
-            "description": "Colmatage filtre",
-        },
-        {
-            "organ_name": "Groupe à vis",
-            "failure_date": "2023-09-10",
-            "uptime_since_last_failure": 2500,
-            "repair_duration": 15,
-            "description": "Vibration excessive",
-        },
-    ]
+    organs: List[OrganStatus] = []
+    organ_status_patch: Dict[str, str] = {}
     selected_organ_name: Optional[str] = None
     target_uptime_t: float = 1000.0
     min_reliability_threshold: float = 0.95
@@ -139,134 +334,507 @@ class GptaState(rx.State):
     new_failure_uptime: str = ""
     new_failure_repair_duration: str = ""
     new_failure_description: str = ""
-    selected_year: int = datetime.date.today().year
+    selected_year: int = ALL_YEARS
+    selected_month: int = WHOLE_YEAR
+    compared_organ_names: List[str] = []
+    failure_history_page: List[FailureLogEntry] = []
+    history_page_size: int = 20
+    history_sort_by: str = "date"
+    history_sort_descending: bool = False
+    history_page_number: int = 1
+    history_has_next_page: bool = False
+    _history_first_cursor: Optional[Tuple[Any, int]] = None
+    _history_last_cursor: Optional[Tuple[Any, int]] = None
+    show_import_modal: bool = False
+    import_report: Optional[ImportReport] = None
+    selected_node_key: str = FLEET_KEY
+    new_hierarchy_child_name: str = ""
+    task_running: bool = False
+    task_label: str = ""
+    task_progress: int = 0
+    task_detail: str = ""
+    _task_id: str = ""
+    _recompute_pending: bool = False
+    _pending_import: Optional[Tuple[str, str]] = None
+    simulation_missions: int = DEFAULT_SIMULATION_MISSIONS
+    simulation_years: float = 1.0
+    availability_simulation: Optional[AvailabilitySimulation] = None
+    operating_hours_per_day: float = DEFAULT_OPERATING_HOURS_PER_DAY
+    _maintenance_costs_digest: str = ""
+    _failure_log_version: str = "initial"
+    _changed_organ_count: int = 0
+    _recompute_scheduled: bool = False
+
+    def _sync_fleet_version(self, version: str):
+        if version != self._failure_log_version:
+            self._failure_log_version = version
+
+    def _load_fleet_if_needed(self) -> List[str]:
+        self._sync_fleet_version(fleet_store.refresh())
+        return fleet_store.organ_names
+
+    def _date_window(self) -> Optional[DateWindow]:
+        if self.selected_year == ALL_YEARS:
+            return None
+        if self.selected_month == WHOLE_YEAR:
+            return year_window(self.selected_year)
+        return month_window(
+            self.selected_year, self.selected_month
+        )
+
+    def _window_aggregates(self) -> Dict[str, OrganAggregate]:
+        return fleet_store.window_aggregates(self._date_window())
+
+    def _hierarchy_rollups(self) -> Dict[str, NodeRollup]:
+        window = self._date_window()
+        if window is None:
+            return fleet_store.window_rollups()
+        return metrics_cache.get_or_compute(
+            ("rollups", fleet_store.ensure_loaded(), window),
+            lambda: fleet_store.window_rollups(window),
+        )
+
+    def _organ_aggregate(
+        self, organ_name: str
+    ) -> Optional[OrganAggregate]:
+        return fleet_store.aggregate(
+            organ_name, self._date_window()
+        )
 
     def _calculate_metrics_for_organ(
         self, organ_name: str
     ) -> Organ:
-        relevant_logs = [
-            log
-            for log in self.failure_logs
-            if log["organ_name"] == organ_name
-        ]
-        mtbf: Optional[float] = None
-        mttr: Optional[float] = None
-        lambda_val: Optional[float] = None
-        reliability_at_t: Optional[float] = None
-        availability: Optional[float] = None
-        preventive_maintenance_period: Optional[float] = (
-            None
-        )
-        if relevant_logs:
-            total_uptime = sum(
-                (
-                    log["uptime_since_last_failure"]
-                    for log in relevant_logs
-                )
+        return metrics_cache.get_or_compute(
+            (
+                "organ_metrics",
+                organ_name,
+                fleet_store.ensure_loaded(),
+                self.target_uptime_t,
+                self.min_reliability_threshold,
+                self._date_window(),
+            ),
+            lambda: metrics_from_aggregate(
+                organ_name,
+                self._organ_aggregate(organ_name),
+                self.target_uptime_t,
+                self.min_reliability_threshold,
+            ),
+        )
+
+    def _weibull_fits(
+        self, organ_names: List[str]
+    ) -> Dict[str, Optional[WeibullFit]]:
+        return _weibull_fits_for(organ_names, self._date_window())
+
+    def _fleet_rates_key(self) -> Tuple[Any, ...]:
+        return (
+            "fleet_rates",
+            fleet_store.ensure_loaded(),
+            self._date_window(),
+        )
+
+    def _apply_fleet_statuses(
+        self, organ_names: List[str], lambda_val: Any
+    ):
+        from tableau_de_bord_de_suivi_gpta.analytics.fleet_engine import (
+            reliability_from_rates,
+        )
+        from tableau_de_bord_de_suivi_gpta.analytics.organ_status import (
+            changed_organ_names,
+            patched_statuses,
+            status_patch,
+            statuses_from_reliability,
+        )
+
+        statuses = statuses_from_reliability(
+            organ_names,
+            reliability_from_rates(
+                lambda_val, self.target_uptime_t
+            ),
+            self.min_reliability_threshold,
+        )
+        base = self.get_value("organs")
+        previous_patch = self.get_value("organ_status_patch")
+        self._changed_organ_count = len(
+            changed_organ_names(
+                patched_statuses(base, previous_patch), statuses
             )
-            total_repair_duration = sum(
-                (
-                    log["repair_duration"]
-                    for log in relevant_logs
-                )
+        )
+        if not self._changed_organ_count:
+            return
+        patch = status_patch(base, statuses)
+        if patch is None:
+            self.organs = statuses
+            patch = {}
+        if patch != previous_patch:
+            self.organ_status_patch = patch
+
+    @rx.event
+    def update_all_organ_metrics(self):
+        organ_names = self._load_fleet_if_needed()
+        lambda_val = metrics_cache.get_or_compute(
+            self._fleet_rates_key(),
+            lambda: _compute_fleet_rates(
+                organ_names, self._date_window()
+            ),
+        )
+        self._apply_fleet_statuses(organ_names, lambda_val)
+        self._weibull_fits(organ_names)
+
+    def _apply_fleet_snapshot(
+        self, snapshot: Tuple[str, List[str], Any]
+    ):
+        version, organ_names, lambda_val = snapshot
+        self._sync_fleet_version(version)
+        self._apply_fleet_statuses(organ_names, lambda_val)
+
+    def _start_task(self, label: str) -> bool:
+        if self.task_running:
+            return False
+        self.task_running = True
+        self.task_label = label
+        self.task_progress = 0
+        self.task_detail = ""
+        return True
+
+    def _finish_task(self) -> List[Any]:
+        self.task_running = False
+        self.task_label = ""
+        self.task_progress = 0
+        self.task_detail = ""
+        self._task_id = ""
+        if self._recompute_pending:
+            self._recompute_pending = False
+            return [GptaState.recompute_fleet_metrics]
+        return []
+
+    async def _await_task(
+        self,
+        work: Callable[[TaskProgress], Any],
+        on_partial: Optional[Callable[[Any], None]] = None,
+    ) -> Any:
+        progress, future = submit_task(work)
+        async with self:
+            self._task_id = progress.task_id
+        waiter = asyncio.wrap_future(future)
+        applied = 0
+        while True:
+            done, _ = await asyncio.wait(
+                {waiter}, timeout=TASK_POLL_INTERVAL
             )
-            num_failures = len(relevant_logs)
-            if num_failures > 0:
-                mtbf = (
-                    total_uptime / num_failures
-                    if num_failures > 0
-                    else None
-                )
-                mttr = (
-                    total_repair_duration / num_failures
-                    if num_failures > 0
-                    else None
-                )
-            if mtbf is not None and mtbf > 0:
-                lambda_val = 1 / mtbf
-                reliability_at_t = math.exp(
-                    -lambda_val * self.target_uptime_t
-                )
+            async with self:
+                self.task_progress = progress.percent
+                self.task_detail = progress.detail
                 if (
-                    self.min_reliability_threshold > 0
-                    and lambda_val > 0
+                    on_partial is not None
+                    and progress.partial_count != applied
                 ):
-                    clamped_r = max(
-                        1e-06,
-                        min(
-                            0.999999,
-                            self.min_reliability_threshold,
-                        ),
-                    )
-                    preventive_maintenance_period = (
-                        -math.log(clamped_r) / lambda_val
-                    )
-            if (
-                mtbf is not None
-                and mttr is not None
-                and (mtbf + mttr > 0)
+                    applied = progress.partial_count
+                    on_partial(progress.partial)
+            if done:
+                return await waiter
+
+    @rx.event(background=True)
+    async def recompute_fleet_metrics(self):
+        async with self:
+            if not self._start_task(
+                "Recalcul des indicateurs de la flotte"
             ):
-                availability = mtbf / (mtbf + mttr)
-        updated_organ_data: Organ = {
-            "name": organ_name,
-            "mtbf": mtbf,
-            "mttr": mttr,
-            "lambda_val": lambda_val,
-            "reliability_at_t": reliability_at_t,
-            "availability": availability,
-            "preventive_maintenance_period": preventive_maintenance_period,
-        }
-        found = False
-        for i, organ in enumerate(self.organs):
-            if organ["name"] == organ_name:
-                self.organs[i] = updated_organ_data
-                found = True
-                break
-        if not found:
-            self.organs.append(updated_organ_data)
-        return updated_organ_data
+                self._recompute_pending = True
+                return
+            work = _fleet_recompute_work(self._date_window())
+        message = ""
+        try:
+            snapshot = await self._await_task(
+                work, self._apply_fleet_snapshot
+            )
+        except TaskCancelled:
+            message = "Recalcul annulé."
+        except Exception as e:
+            message = f"Erreur inattendue: {str(e)}"
+        async with self:
+            if message:
+                return [
+                    *self._finish_task(),
+                    rx.toast(message, duration=4000),
+                ]
+            self._apply_fleet_snapshot(snapshot)
+            return self._finish_task()
 
     @rx.event
-    def update_all_organ_metrics(self):
-        for i in range(len(self.organs)):
-            self._calculate_metrics_for_organ(
-                self.organs[i]["name"]
-            )
-        self.organs = list(self.organs)
+    def cancel_background_task(self):
+        if self.task_running and cancel_task(self._task_id):
+            self.task_detail = "Annulation en cours..."
 
-    @rx.var
+    def _schedule_parameter_recompute(self):
+        if self._recompute_scheduled:
+            return None
+        self._recompute_scheduled = True
+        return GptaState.flush_parameter_recompute
+
+    @rx.event
+    def flush_parameter_recompute(self):
+        self._recompute_scheduled = False
+        lambda_val = metrics_cache.get(self._fleet_rates_key())
+        if lambda_val is None or len(lambda_val) != len(
+            fleet_store.organ_names
+        ):
+            return GptaState.update_all_organ_metrics
+        self._apply_fleet_statuses(
+            fleet_store.organ_names, lambda_val
+        )
+
+    @rx.var(deps=["organs", "_failure_log_version"])
     def selected_organ_details(self) -> Optional[Organ]:
-        if self.selected_organ_name:
-            for organ in self.organs:
-                if (
-                    organ["name"]
-                    == self.selected_organ_name
-                ):
-                    return (
-                        self._calculate_metrics_for_organ(
-                            self.selected_organ_name
-                        )
-                    )
+        if (
+            self.selected_organ_name
+            and self.selected_organ_name in fleet_store.organ_names
+        ):
+            return self._calculate_metrics_for_organ(
+                self.selected_organ_name
+            )
         return None
 
+    @rx.var(deps=["_failure_log_version"])
+    def selected_organ_weibull(self) -> Optional[WeibullMetrics]:
+        from tableau_de_bord_de_suivi_gpta.analytics.weibull import (
+            weibull_metrics,
+        )
+
+        if not self.selected_organ_name:
+            return None
+        return weibull_metrics(
+            self._weibull_fits([self.selected_organ_name])[
+                self.selected_organ_name
+            ],
+            self.target_uptime_t,
+            self.min_reliability_threshold,
+        )
+
+    @rx.var(deps=["_failure_log_version"])
+    def selected_organ_failure_count(self) -> int:
+        if self.selected_organ_name:
+            aggregate = self._organ_aggregate(
+                self.selected_organ_name
+            )
+            if aggregate is not None:
+                return aggregate["failure_count"]
+        return 0
+
     @rx.var
-    def selected_organ_failure_history(
+    def history_page_count(self) -> int:
+        return max(
+            1,
+            math.ceil(
+                self.selected_organ_failure_count
+                / self.history_page_size
+            ),
+        )
+
+    def _load_history_page(
         self,
-    ) -> List[FailureLogEntry]:
-        if self.selected_organ_name:
-            return [
-                log
-                for log in self.failure_logs
-                if log["organ_name"]
-                == self.selected_organ_name
-            ]
-        return []
+        after: Optional[Tuple[Any, int]] = None,
+        before: Optional[Tuple[Any, int]] = None,
+    ) -> FailureHistoryPage:
+        window = self._date_window()
+        return load_failure_history_page(
+            self.selected_organ_name,
+            sort_by=self.history_sort_by,
+            start=window[0] if window else None,
+            end=window[1] if window else None,
+            descending=self.history_sort_descending,
+            page_size=self.history_page_size,
+            after=after,
+            before=before,
+        )
+
+    def _apply_history_page(self, page: FailureHistoryPage):
+        self.failure_history_page = page["entries"]
+        self._history_first_cursor = page["first_cursor"]
+        self._history_last_cursor = page["last_cursor"]
+
+    def _reset_failure_history(self):
+        self.history_page_number = 1
+        if not self.selected_organ_name:
+            self.failure_history_page = []
+            self.history_has_next_page = False
+            self._history_first_cursor = None
+            self._history_last_cursor = None
+            return
+        page = self._load_history_page()
+        self._apply_history_page(page)
+        self.history_has_next_page = page["has_more"]
 
     @rx.event
-    def set_selected_organ(self, organ_name: str):
+    def next_history_page(self):
+        if (
+            not self.history_has_next_page
+            or self._history_last_cursor is None
+        ):
+            return
+        page = self._load_history_page(
+            after=self._history_last_cursor
+        )
+        if not page["entries"]:
+            self.history_has_next_page = False
+            return
+        self._apply_history_page(page)
+        self.history_page_number += 1
+        self.history_has_next_page = page["has_more"]
+
+    @rx.event
+    def previous_history_page(self):
+        if (
+            self.history_page_number <= 1
+            or self._history_first_cursor is None
+        ):
+            return
+        page = self._load_history_page(
+            before=self._history_first_cursor
+        )
+        if not page["entries"]:
+            self._reset_failure_history()
+            return
+        self._apply_history_page(page)
+        self.history_page_number = (
+            self.history_page_number - 1
+            if page["has_more"]
+            else 1
+        )
+        self.history_has_next_page = True
+
+    @rx.event
+    def set_history_sort_by(self, value: str):
+        if value in ("date", "duration"):
+            self.history_sort_by = value
+        self._reset_failure_history()
+
+    @rx.event
+    def toggle_history_sort_direction(self):
+        self.history_sort_descending = (
+            not self.history_sort_descending
+        )
+        self._reset_failure_history()
+
+    @rx.event
+    def set_history_page_size(self, value: str):
+        try:
+            self.history_page_size = max(
+                5, min(200, int(value))
+            )
+        except ValueError:
+            pass
+        self._reset_failure_history()
+
+    def _select_organ(self, organ_name: str):
         self.selected_organ_name = organ_name
-        self._calculate_metrics_for_organ(organ_name)
-        self.organs = list(self.organs)
+        self.selected_node_key = node_key(LEVEL_ORGAN, organ_name)
+        self.availability_simulation = None
+        self._reset_failure_history()
+
+    @rx.event
+    def set_selected_organ(self, organ_name: str):
+        self._select_organ(organ_name)
+
+    @rx.var(deps=["_failure_log_version"])
+    def hierarchy_breadcrumb(self) -> List[HierarchyNode]:
+        fleet_store.ensure_loaded()
+        return fleet_store.hierarchy.path(self.selected_node_key)
+
+    @rx.var(deps=["_failure_log_version"])
+    def selected_node_summary(
+        self,
+    ) -> Optional[HierarchyNodeSummary]:
+        fleet_store.ensure_loaded()
+        if self.selected_node_key not in fleet_store.hierarchy.nodes:
+            return None
+        return fleet_store.hierarchy.summary(
+            self.selected_node_key,
+            self._hierarchy_rollups(),
+            self._window_aggregates(),
+        )
+
+    @rx.var(deps=["_failure_log_version"])
+    def hierarchy_children(self) -> List[HierarchyNodeSummary]:
+        fleet_store.ensure_loaded()
+        rollups = self._hierarchy_rollups()
+        aggregates = self._window_aggregates()
+        return [
+            fleet_store.hierarchy.summary(key, rollups, aggregates)
+            for key in fleet_store.hierarchy.children.get(
+                self.selected_node_key, []
+            )
+        ]
+
+    @rx.var
+    def hierarchy_child_label(self) -> str:
+        level, _, name = self.selected_node_key.partition(":")
+        if self.selected_node_key != FLEET_KEY and not name:
+            return ""
+        return HIERARCHY_CHILD_LABELS.get(level, "")
+
+    @rx.event
+    def select_hierarchy_node(self, key: str):
+        node = fleet_store.hierarchy.nodes.get(key)
+        if node is None:
+            return
+        self.new_hierarchy_child_name = ""
+        if node["organ_name"] is not None:
+            self._select_organ(node["organ_name"])
+            return
+        if key != self.selected_node_key:
+            self.availability_simulation = None
+        self.selected_node_key = key
+        self.selected_organ_name = None
+        self._reset_failure_history()
+
+    @rx.event
+    def add_hierarchy_child(self):
+        name = self.new_hierarchy_child_name.strip()
+        if not name:
+            yield rx.toast(
+                "Le nom ne peut pas être vide.", duration=3000
+            )
+            return
+        path = fleet_store.hierarchy.path(self.selected_node_key)
+        if not path or not self.hierarchy_child_label:
+            return
+        level = path[-1]["level"]
+        placement: OrganPlacement = {
+            "locomotive_name": None,
+            "compressor_name": None,
+            "organ_name": None,
+            "organ_label": None,
+        }
+        if level == LEVEL_FLEET:
+            placement["locomotive_name"] = name
+            created = insert_locomotive(name)
+        elif level == LEVEL_LOCOMOTIVE:
+            placement["locomotive_name"] = path[1]["name"]
+            placement["compressor_name"] = name
+            created = insert_compressor(name, path[1]["name"])
+        elif level == LEVEL_COMPRESSOR:
+            placement["locomotive_name"] = path[1]["name"]
+            placement["compressor_name"] = path[2]["name"]
+            placement["organ_name"] = insert_organ(
+                name, path[2]["name"]
+            )
+            placement["organ_label"] = name
+            created = placement["organ_name"] is not None
+        else:
+            return
+        if not created:
+            yield rx.toast(
+                f"Un élément nommé '{name}' existe déjà.",
+                duration=3000,
+            )
+            return
+        self._failure_log_version = fleet_store.record_placement(
+            placement
+        )
+        self.new_hierarchy_child_name = ""
+        if level == LEVEL_COMPRESSOR:
+            yield GptaState.update_all_organ_metrics
 
     @rx.event
     def set_target_uptime_t(self, value: str):
@@ -277,7 +845,7 @@ class GptaState(rx.State):
             )
         except ValueError:
             pass
-        yield GptaState.update_all_organ_metrics
+        return self._schedule_parameter_recompute()
 
     @rx.event
     def set_min_reliability_threshold(self, value: str):
@@ -293,7 +861,7 @@ class GptaState(rx.State):
                 self.min_reliability_threshold = 1e-06
         except ValueError:
             pass
-        yield GptaState.update_all_organ_metrics
+        return self._schedule_parameter_recompute()
 
     @rx.event
     def toggle_add_organ_modal(self):
@@ -314,23 +882,30 @@ class GptaState(rx.State):
             return
         if any(
             (o["name"] == trimmed_name for o in self.organs)
-        ):
+        ) or not insert_organ(trimmed_name):
             yield rx.toast(
                 f"Un organe nommé '{trimmed_name}' existe déjà.",
                 duration=3000,
             )
             return
-        new_organ_entry: Organ = {
-            "name": trimmed_name,
-            "mtbf": None,
-            "mttr": None,
-            "lambda_val": None,
-            "reliability_at_t": None,
-            "availability": None,
-            "preventive_maintenance_period": None,
-        }
-        self.organs.append(new_organ_entry)
-        self._calculate_metrics_for_organ(trimmed_name)
+        from tableau_de_bord_de_suivi_gpta.analytics.organ_status import (
+            organ_status,
+        )
+
+        self.organs.append(
+            organ_status(
+                self._calculate_metrics_for_organ(trimmed_name),
+                self.min_reliability_threshold,
+            )
+        )
+        self._failure_log_version = fleet_store.record_placement(
+            {
+                "locomotive_name": None,
+                "compressor_name": None,
+                "organ_name": trimmed_name,
+                "organ_label": trimmed_name,
+            }
+        )
         self.new_organ_name_input = ""
         self.show_add_organ_modal = False
         yield GptaState.update_all_organ_metrics
@@ -364,54 +939,18 @@ class GptaState(rx.State):
             self.new_failure_description = ""
 
     @rx.event
-    def handle_failure_log_submit(
+    async def handle_failure_log_submit(
         self, form_data: Dict[str, str]
     ):
         try:
-            organ_name = form_data.get("organ_name", "")
-            failure_date_str = form_data.get(
-                "failure_date", ""
-            )
-            uptime_str = form_data.get(
-                "uptime_since_last_failure", ""
-            )
-            repair_duration_str = form_data.get(
-                "repair_duration", ""
-            )
-            description = form_data.get(
-                "description", ""
-            ).strip()
-            if not all(
-                [
-                    organ_name,
-                    failure_date_str,
-                    uptime_str,
-                    repair_duration_str,
-                    description,
-                ]
-            ):
-                yield rx.toast(
-                    "Tous les champs sont obligatoires.",
-                    duration=3000,
-                )
-                return
-            uptime = float(uptime_str)
-            repair_duration = float(repair_duration_str)
-            if uptime <= 0 or repair_duration <= 0:
-                yield rx.toast(
-                    "Temps de fonctionnement et durée de réparation doivent être positifs.",
-                    duration=3000,
-                )
-                return
-            datetime.date.fromisoformat(failure_date_str)
-            new_log: FailureLogEntry = {
-                "organ_name": organ_name,
-                "failure_date": failure_date_str,
-                "uptime_since_last_failure": uptime,
-                "repair_duration": repair_duration,
-                "description": description,
-            }
-            self.failure_logs.append(new_log)
+            new_log = parse_failure_record(
+                form_data,
+                set(fleet_store.organ_names),
+            )
+            organ_name = new_log["organ_name"]
+            self._failure_log_version = await asyncio.to_thread(
+                _store_failure_log, new_log
+            )
             self.new_failure_organ_name = ""
             self.new_failure_date = (
                 datetime.date.today().isoformat()
@@ -429,109 +968,455 @@ class GptaState(rx.State):
                 "Relevé de panne ajouté avec succès.",
                 duration=3000,
             )
-        except ValueError:
-            yield rx.toast(
-                "Veuillez entrer des nombres valides pour les durées et une date valide.",
-                duration=3000,
-            )
+        except FailureRecordError as e:
+            yield rx.toast(str(e), duration=3000)
         except Exception as e:
             yield rx.toast(
                 f"Erreur inattendue: {str(e)}",
                 duration=4000,
             )
 
-    @rx.var
-    def pareto_chart_data(
-        self,
-    ) -> List[Dict[str, str | int | float]]:
-        failure_counts: Dict[str, int] = {}
-        for log in self.failure_logs:
-            failure_counts[log["organ_name"]] = (
-                failure_counts.get(log["organ_name"], 0) + 1
-            )
-        all_organ_names = [
-            organ["name"] for organ in self.organs
-        ]
-        for name in all_organ_names:
-            if name not in failure_counts:
-                failure_counts[name] = 0
-        sorted_failures = sorted(
-            failure_counts.items(),
-            key=lambda item: item[1],
-            reverse=True,
-        )
-        chart_data: List[Dict[str, str | int | float]] = []
-        cumulative_percentage = 0.0
-        total_failures = sum(failure_counts.values())
-        if total_failures == 0:
+    @rx.event
+    def toggle_import_modal(self):
+        self.show_import_modal = not self.show_import_modal
+        if self.show_import_modal:
+            self.import_report = None
+
+    @rx.event
+    async def handle_failure_log_upload(
+        self, files: List[rx.UploadFile]
+    ):
+        if not files:
+            yield rx.toast(
+                "Aucun fichier sélectionné.",
+                duration=3000,
+            )
+            return
+        if self.task_running:
+            yield rx.toast(
+                "Une tâche est déjà en cours.", duration=3000
+            )
+            return
+        upload = files[0]
+        filename = upload.name or ""
+        with tempfile.NamedTemporaryFile(
+            delete=False, suffix=os.path.splitext(filename)[1]
+        ) as copy:
+            shutil.copyfileobj(upload.file, copy)
+        self._pending_import = (copy.name, filename)
+        self.import_report = None
+        yield GptaState.import_pending_failure_logs
+
+    def _show_import_report(self, report: ImportReport):
+        self.import_report = report
+
+    @rx.event(background=True)
+    async def import_pending_failure_logs(self):
+        async with self:
+            if self._pending_import is None or not self._start_task(
+                "Import des relevés de pannes"
+            ):
+                return
+            path, filename = self._pending_import
+            self._pending_import = None
+        message = ""
+        try:
+            report, delta, interruption = await self._await_task(
+                _failure_log_import_work(path, filename),
+                self._show_import_report,
+            )
+        except Exception as e:
+            message = f"Erreur inattendue: {str(e)}"
+        finally:
+            with contextlib.suppress(OSError):
+                os.remove(path)
+        async with self:
+            if message:
+                self.import_report = None
+                fleet_store.refresh()
+                self._recompute_pending = True
+                return [
+                    *self._finish_task(),
+                    rx.toast(message, duration=4000),
+                ]
+            stored = sum(
+                aggregate["failure_count"]
+                for aggregate in delta.values()
+            )
+            if stored:
+                self._failure_log_version = fleet_store.record_import(
+                    delta
+                )
+                get_weibull_fits().invalidate(delta)
+                if self.selected_organ_name:
+                    self._reset_failure_history()
+                self._recompute_pending = True
+            if interruption:
+                self.import_report = None
+                return [
+                    *self._finish_task(),
+                    rx.toast(
+                        f"{interruption} {stored} relevé(s) déjà enregistré(s).",
+                        duration=4000,
+                    ),
+                ]
+            self.import_report = report
             return [
-                {
-                    "name": name,
-                    "pannes": 0,
-                    "cumulatif": 0.0,
-                }
-                for name in all_organ_names
+                *self._finish_task(),
+                rx.toast(
+                    f"{report['accepted']} relevé(s) importé(s), {report['rejected']} rejeté(s).",
+                    duration=4000,
+                ),
             ]
-        for organ_name, count in sorted_failures:
-            percentage = (
-                count / total_failures * 100
-                if total_failures > 0
-                else 0.0
-            )
-            cumulative_percentage += percentage
-            chart_data.append(
-                {
-                    "name": organ_name,
-                    "pannes": count,
-                    "cumulatif": round(
-                        cumulative_percentage, 2
-                    ),
-                }
+
+    @rx.event
+    def set_simulation_missions(self, value: str):
+        try:
+            self.simulation_missions = max(
+                1000, min(MAX_SIMULATION_MISSIONS, int(value))
+            )
+        except ValueError:
+            pass
+
+    @rx.event
+    def set_simulation_years(self, value: str):
+        try:
+            years = float(value)
+        except ValueError:
+            return
+        if 0 < years <= 50:
+            self.simulation_years = years
+
+    @rx.event(background=True)
+    async def run_availability_simulation(self):
+        from tableau_de_bord_de_suivi_gpta.analytics.simulation import (
+            SimulationInputError,
+        )
+
+        async with self:
+            key = self.selected_node_key
+            node = fleet_store.hierarchy.nodes.get(key)
+            if node is None or node["level"] != LEVEL_COMPRESSOR:
+                return
+            if not self._start_task(
+                "Simulation Monte Carlo de disponibilité"
+            ):
+                return rx.toast(
+                    "Une autre tâche est déjà en cours.",
+                    duration=3000,
+                )
+            work = _availability_simulation_work(
+                key,
+                self._date_window(),
+                self.simulation_missions,
+                self.simulation_years * HOURS_PER_YEAR,
             )
-        return chart_data
+        message = ""
+        try:
+            result = await self._await_task(work)
+        except TaskCancelled:
+            message = "Simulation annulée."
+        except SimulationInputError as e:
+            message = str(e)
+        except Exception as e:
+            message = f"Erreur inattendue: {str(e)}"
+        async with self:
+            if message:
+                return [
+                    *self._finish_task(),
+                    rx.toast(message, duration=4000),
+                ]
+            if self.selected_node_key == key:
+                self.availability_simulation = result
+            return self._finish_task()
+
+    @rx.var(deps=["_failure_log_version"])
+    def pareto_chart_data(self) -> List[ParetoEntry]:
+        window = self._date_window()
+        return metrics_cache.get_or_compute(
+            ("pareto", fleet_store.ensure_loaded(), window),
+            lambda: pareto_rows(
+                fleet_store.window_aggregates(window),
+                fleet_store.organ_names,
+            ),
+        )
+
+    def _replacement_plans(self) -> Dict[str, ReplacementPlan]:
+        from tableau_de_bord_de_suivi_gpta.analytics.maintenance import (
+            replacement_plans,
+        )
+
+        version, aggregates = fleet_store.versioned_aggregates()
+        organ_names = fleet_store.organ_names
+        costs = fleet_store.maintenance_costs
+        return metrics_cache.get_or_compute(
+            ("replacement_plans", version, fleet_store.costs_digest),
+            lambda: replacement_plans(
+                organ_names,
+                get_weibull_fits().fits(
+                    organ_names,
+                    aggregates,
+                    None,
+                    _load_weibull_samples,
+                ),
+                costs,
+            ),
+        )
+
+    @rx.var(
+        deps=[
+            "selected_organ_name",
+            "_failure_log_version",
+            "_maintenance_costs_digest",
+        ]
+    )
+    def selected_organ_maintenance_costs(self) -> MaintenanceCosts:
+        fleet_store.ensure_loaded()
+        return fleet_store.maintenance_costs.get(
+            self.selected_organ_name or "",
+            {
+                "preventive_cost": DEFAULT_PREVENTIVE_COST,
+                "corrective_cost": DEFAULT_CORRECTIVE_COST,
+            },
+        )
+
+    @rx.var(
+        deps=[
+            "selected_organ_name",
+            "_failure_log_version",
+            "_maintenance_costs_digest",
+        ]
+    )
+    def selected_organ_replacement_plan(
+        self,
+    ) -> Optional[ReplacementPlan]:
+        if not self.selected_organ_name:
+            return None
+        return self._replacement_plans().get(
+            self.selected_organ_name
+        )
+
+    def _calendar_year(self) -> int:
+        if self.selected_year == ALL_YEARS:
+            return datetime.date.today().year
+        return self.selected_year
 
     @rx.var
-    def reliability_curve_data_selected_organ(
+    def maintenance_calendar_year(self) -> int:
+        return self._calendar_year()
+
+    @rx.var(
+        deps=[
+            "_failure_log_version",
+            "_maintenance_costs_digest",
+            "selected_year",
+            "operating_hours_per_day",
+        ]
+    )
+    def maintenance_calendar(self) -> List[MaintenanceSlot]:
+        from tableau_de_bord_de_suivi_gpta.analytics.maintenance import (
+            maintenance_calendar,
+        )
+
+        version = fleet_store.ensure_loaded()
+        year = self._calendar_year()
+        return metrics_cache.get_or_compute(
+            (
+                "maintenance_calendar",
+                version,
+                fleet_store.costs_digest,
+                year,
+                self.operating_hours_per_day,
+            ),
+            lambda: maintenance_calendar(
+                self._replacement_plans(),
+                metrics_cache.get_or_compute(
+                    ("last_failure_dates", version),
+                    load_last_failure_dates,
+                ),
+                year,
+                self.operating_hours_per_day,
+            ),
+        )
+
+    def _update_maintenance_cost(self, field: str, value: str):
+        if not self.selected_organ_name:
+            return None
+        try:
+            cost = float(value)
+        except ValueError:
+            cost = 0.0
+        if not cost > 0:
+            return rx.toast(
+                "Le coût doit être un nombre positif.", duration=3000
+            )
+        costs: MaintenanceCosts = {
+            **self.selected_organ_maintenance_costs,
+            field: cost,
+        }
+        if not update_maintenance_costs(
+            self.selected_organ_name, costs
+        ):
+            return rx.toast(
+                f"L'organe '{self.selected_organ_name}' n'existe pas.",
+                duration=3000,
+            )
+        self._maintenance_costs_digest = (
+            fleet_store.record_maintenance_costs(
+                self.selected_organ_name, costs
+            )
+        )
+        self._sync_fleet_version(fleet_store.version)
+
+    @rx.event
+    def set_preventive_cost(self, value: str):
+        return self._update_maintenance_cost("preventive_cost", value)
+
+    @rx.event
+    def set_corrective_cost(self, value: str):
+        return self._update_maintenance_cost("corrective_cost", value)
+
+    @rx.event
+    def set_operating_hours_per_day(self, value: str):
+        try:
+            hours = float(value)
+        except ValueError:
+            return
+        if 0 < hours <= 24:
+            self.operating_hours_per_day = hours
+
+    @rx.var(
+        deps=[
+            "organs",
+            "_failure_log_version",
+            "target_uptime_t",
+            "selected_year",
+            "selected_month",
+            "selected_node_key",
+        ]
+    )
+    def system_reliability(self) -> Optional[SystemReliability]:
+        from tableau_de_bord_de_suivi_gpta.analytics.rbd import (
+            failure_rates,
+        )
+
+        fleet_store.ensure_loaded()
+        key = fleet_store.hierarchy.first_compressor(
+            self.selected_node_key
+        )
+        if key is None:
+            return None
+        diagram = compressor_reliability_diagram(key)
+        if diagram is None:
+            return None
+        window = self._date_window()
+        return metrics_cache.get_or_compute(
+            (
+                "system_reliability",
+                fleet_store.ensure_loaded(),
+                key,
+                window,
+                self.target_uptime_t,
+            ),
+            lambda: diagram.evaluate(
+                failure_rates(
+                    diagram.organ_names(),
+                    fleet_store.window_aggregates(window),
+                ),
+                self.target_uptime_t,
+            ),
+        )
+
+    def _curve_horizon(self, mtbf: Optional[float]) -> float:
+        max_t = mtbf * 2 if mtbf else self.target_uptime_t * 2
+        if max_t == 0:
+            max_t = 1000
+        if max_t <= 0:
+            max_t = (
+                self.target_uptime_t
+                if self.target_uptime_t > 0
+                else 1000
+            )
+        return float(max_t)
+
+    def _curve_models(
         self,
-    ) -> List[Dict[str, float]]:
-        data: List[Dict[str, float]] = []
+    ) -> List[Tuple[CurveSeries, float, float, Optional[float]]]:
+        models: List[
+            Tuple[CurveSeries, float, float, Optional[float]]
+        ] = []
         selected = self.selected_organ_details
         if (
             selected
             and selected.get("lambda_val") is not None
             and (selected["lambda_val"] > 0)
         ):
-            lambda_v = selected["lambda_val"]
-            mtbf = selected.get("mtbf")
-            max_t = (
-                mtbf * 2
-                if mtbf
-                else self.target_uptime_t * 2
-            )
-            if max_t == 0:
-                max_t = 1000
-            if max_t <= 0:
-                max_t = (
-                    self.target_uptime_t
-                    if self.target_uptime_t > 0
-                    else 1000
+            models.append(
+                (
+                    {
+                        "key": "fiabilite",
+                        "name": "Fiabilité",
+                        "color": CURVE_COLORS[0],
+                    },
+                    1.0,
+                    1 / selected["lambda_val"],
+                    selected.get("mtbf"),
                 )
-            step_size = int(max_t / 20) if max_t > 20 else 1
-            if step_size <= 0:
-                step_size = 1
-            for t_step in range(
-                0, int(max_t) + 1, step_size
-            ):
-                reliability = math.exp(-lambda_v * t_step)
-                data.append(
+            )
+            weibull = self.selected_organ_weibull
+            if weibull and weibull["shape"] is not None:
+                models.append(
+                    (
+                        {
+                            "key": "fiabilite_weibull",
+                            "name": "Fiabilité (Weibull)",
+                            "color": CURVE_COLORS[1],
+                        },
+                        weibull["shape"],
+                        weibull["scale"],
+                        selected.get("mtbf"),
+                    )
+                )
+        for i, organ_name in enumerate(self.compared_organ_names):
+            if organ_name == self.selected_organ_name:
+                continue
+            compared = self._calculate_metrics_for_organ(
+                organ_name
+            )
+            if not compared["lambda_val"]:
+                continue
+            models.append(
+                (
                     {
-                        "temps": float(t_step),
-                        "fiabilite": round(reliability, 4),
-                    }
+                        "key": f"comparaison_{i}",
+                        "name": organ_name,
+                        "color": CURVE_COLORS[
+                            (i + 2) % len(CURVE_COLORS)
+                        ],
+                    },
+                    1.0,
+                    1 / compared["lambda_val"],
+                    compared["mtbf"],
                 )
-        if not data:
-            data.append({"temps": 0.0, "fiabilite": 1.0})
-            data.append(
+            )
+        return models
+
+    @rx.var(deps=["_failure_log_version"])
+    def reliability_curve_series(self) -> List[CurveSeries]:
+        return [series for series, *_ in self._curve_models()]
+
+    @rx.var(deps=["_failure_log_version"])
+    def reliability_curve_data_selected_organ(
+        self,
+    ) -> List[Dict[str, float]]:
+        from tableau_de_bord_de_suivi_gpta.analytics.curves import (
+            reliability_curve_rows,
+        )
+
+        models = self._curve_models()
+        if not models:
+            return [
+                {"temps": 0.0, "fiabilite": 1.0},
                 {
                     "temps": (
                         self.target_uptime_t
@@ -539,9 +1424,34 @@ class GptaState(rx.State):
                         else 1000.0
                     ),
                     "fiabilite": 1.0,
-                }
+                },
+            ]
+        return reliability_curve_rows(
+            [series["key"] for series, *_ in models],
+            [shape for _, shape, _, _ in models],
+            [scale for _, _, scale, _ in models],
+            max(
+                self._curve_horizon(mtbf)
+                for *_, mtbf in models
+            ),
+        )
+
+    @rx.event
+    def toggle_compared_organ(self, organ_name: str):
+        if organ_name in self.compared_organ_names:
+            self.compared_organ_names = [
+                name
+                for name in self.compared_organ_names
+                if name != organ_name
+            ]
+        elif (
+            organ_name
+            and len(self.compared_organ_names)
+            < MAX_COMPARED_ORGANS
+        ):
+            self.compared_organ_names = (
+                self.compared_organ_names + [organ_name]
             )
-        return data
 
     @rx.var
     def mtbf_mttr_chart_data_selected_organ(
@@ -582,46 +1492,41 @@ class GptaState(rx.State):
                 "Aucun organe sélectionné pour l'exportation.",
                 duration=3000,
             )
-        details = self.selected_organ_details
-        history = self.selected_organ_failure_history
-        if not details:
-            return rx.toast(
-                "Détails de l'organe non trouvés.",
-                duration=3000,
-            )
-        details_df = pd.DataFrame([details])
-        history_df = (
-            pd.DataFrame(history)
-            if history
-            else pd.DataFrame(
-                columns=[
-                    "organ_name",
-                    "failure_date",
-                    "uptime_since_last_failure",
-                    "repair_duration",
-                    "description",
-                ]
-            )
+        return self._download_export(
+            "organ.csv",
+            name=self.selected_organ_name,
+            filename=f"{self.selected_organ_name_safe}_rapport.csv",
         )
-        csv_string = "Details de l'Organe:\n"
-        csv_string += details_df.to_csv(
-            index=False, lineterminator="\n"
-        )
-        csv_string += "\n\nHistorique des Pannes:\n"
-        if not history_df.empty:
-            csv_string += history_df.to_csv(
-                index=False, lineterminator="\n"
-            )
-        else:
-            csv_string += "Aucune panne enregistrée."
-        filename = (
-            f"{self.selected_organ_name_safe}_rapport.csv"
+
+    def _download_export(self, path: str, **params: str):
+        query = urllib.parse.urlencode(
+            {
+                **params,
+                "t": self.target_uptime_t,
+                "r": self.min_reliability_threshold,
+            }
         )
-        return rx.download(
-            data=csv_string.encode("utf-8"),
-            filename=filename,
+        return rx.call_script(
+            "(() => {"
+            "const exportUrl = getBackendURL(env.UPLOAD);"
+            f"exportUrl.pathname = {json.dumps('/export/' + path)};"
+            f"exportUrl.search = {json.dumps(query)};"
+            "window.location.assign(exportUrl.toString());"
+            "})()"
         )
 
+    @rx.event
+    def export_fleet_csv(self):
+        return self._download_export("fleet.csv")
+
+    @rx.event
+    def export_fleet_parquet(self, dataset: str):
+        if dataset == "metrics":
+            return self._download_export(
+                "fleet_metrics.parquet"
+            )
+        return self._download_export("failure_logs.parquet")
+
     @rx.var
     def selected_organ_name_safe(self) -> str:
         name = (
@@ -633,10 +1538,30 @@ class GptaState(rx.State):
             (c if c.isalnum() else "_" for c in name)
         )
 
+    @rx.var(deps=["_failure_log_version"])
+    def available_years(self) -> List[int]:
+        return list(
+            reversed(fleet_store.years())
+        )
+
     @rx.event
     def set_selected_year(self, year: str):
         try:
             self.selected_year = int(year)
         except ValueError:
             pass
-        yield GptaState.update_all_organ_metrics
\ No newline at end of file
+        if self.selected_year == ALL_YEARS:
+            self.selected_month = WHOLE_YEAR
+        self._reset_failure_history()
+        yield GptaState.recompute_fleet_metrics
+
+    @rx.event
+    def set_selected_month(self, month: str):
+        try:
+            new_month = int(month)
+            if 0 <= new_month <= 12:
+                self.selected_month = new_month
+        except ValueError:
+            pass
+        self._reset_failure_history()
+        yield GptaState.recompute_fleet_metrics
\ No newline at end of file
@@ -1,10 +1,27 @@
 import reflex as rx
 from tableau_de_bord_de_suivi_gpta.states.gpta_state import GptaState
+from tableau_de_bord_de_suivi_gpta.api.exports import (
+    router as export_router,
+)
+from tableau_de_bord_de_suivi_gpta.api.ingestion import (
+    router as ingestion_router,
+)
+from tableau_de_bord_de_suivi_gpta.api.metrics import (
+    router as metrics_router,
+)
 from tableau_de_bord_de_suivi_gpta.components.sidebar import sidebar_component
 from tableau_de_bord_de_suivi_gpta.components.main_content import main_content_area
 from tableau_de_bord_de_suivi_gpta.components.modals import (
     add_organ_modal,
     add_failure_log_modal,
+    import_failure_logs_modal,
+)
+from tableau_de_bord_de_suivi_gpta.components.task_progress import (
+    background_task_panel,
+)
+from tableau_de_bord_de_suivi_gpta.monitoring.metrics import (
+    instrument_state,
+    metrics_enabled,
 )
 
 
@@ -40,8 +57,10 @@ def index() -> rx.Component:
         main_content_area(),
         add_organ_modal(),
         add_failure_log_modal(),
+        import_failure_logs_modal(),
+        background_task_panel(),
         rx.toast.provider(),
-        on_mount=GptaState.update_all_organ_metrics,
+        on_mount=GptaState.recompute_fleet_metrics,
         class_name="flex h-screen bg-gray-100",
     )
 
@@ -50,4 +69,9 @@ app = rx.App(
     theme=rx.theme(appearance="light"),
     stylesheets=["/custom_styles.css"],
 )
-app.add_page(index, title="GPTA Dashboard")
\ No newline at end of file
+app.add_page(index, title="GPTA Dashboard")
+app.api.include_router(export_router)
+app.api.include_router(ingestion_router)
+if metrics_enabled():
+    instrument_state(GptaState)
+    app.api.include_router(metrics_router)
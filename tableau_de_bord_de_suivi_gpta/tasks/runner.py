@@ -0,0 +1,75 @@
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional, Tuple
+import threading
+import uuid
+
+TASK_WORKERS = 4
+TASK_POLL_INTERVAL = 0.25
+
+
+class TaskCancelled(Exception):
+    pass
+
+
+class TaskProgress:
+    def __init__(self):
+        self.task_id = uuid.uuid4().hex
+        self.percent = 0
+        self.detail = ""
+        self.partial: Any = None
+        self.partial_count = 0
+        self._cancelled = threading.Event()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancelled.is_set()
+
+    def cancel(self) -> None:
+        self._cancelled.set()
+
+    def report(
+        self,
+        fraction: float,
+        detail: Optional[str] = None,
+        partial: Any = None,
+    ) -> None:
+        if self.cancelled:
+            raise TaskCancelled()
+        self.percent = max(0, min(100, int(fraction * 100)))
+        if detail is not None:
+            self.detail = detail
+        if partial is not None:
+            self.partial = partial
+            self.partial_count += 1
+
+
+_executor: Optional[ThreadPoolExecutor] = None
+_running: Dict[str, TaskProgress] = {}
+_lock = threading.Lock()
+
+
+def submit_task(
+    work: Callable[[TaskProgress], Any],
+) -> Tuple[TaskProgress, Future]:
+    global _executor
+    progress = TaskProgress()
+    with _lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=TASK_WORKERS,
+                thread_name_prefix="gpta-task",
+            )
+        _running[progress.task_id] = progress
+    future = _executor.submit(work, progress)
+    future.add_done_callback(
+        lambda _: _running.pop(progress.task_id, None)
+    )
+    return progress, future
+
+
+def cancel_task(task_id: str) -> bool:
+    progress = _running.get(task_id)
+    if progress is None:
+        return False
+    progress.cancel()
+    return True
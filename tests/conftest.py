@@ -0,0 +1,10 @@
+import os
+import tempfile
+
+_directory = tempfile.mkdtemp()
+os.environ["DB_URL"] = "sqlite:///" + os.path.join(
+    _directory, "tests.db"
+)
+os.environ["GPTA_JOURNAL_PATH"] = os.path.join(
+    _directory, "tests.journal"
+)
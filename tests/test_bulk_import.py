@@ -0,0 +1,85 @@
+import threading
+
+from tableau_de_bord_de_suivi_gpta.db.repository import (
+    insert_failure_log,
+    insert_organ,
+    load_organ_aggregates,
+)
+from tableau_de_bord_de_suivi_gpta.ingestion.bulk_import import (
+    IMPORT_BATCH_SIZE,
+)
+from tableau_de_bord_de_suivi_gpta.ingestion.validation import (
+    FAILURE_RECORD_FIELDS,
+)
+from tableau_de_bord_de_suivi_gpta.states.gpta_state import (
+    _failure_log_import_work,
+)
+from tableau_de_bord_de_suivi_gpta.tasks.runner import TaskProgress
+
+BATCHES = 3
+
+
+def write_csv(path, organ_name, rows):
+    with open(path, "w", encoding="utf-8") as stream:
+        stream.write(",".join(FAILURE_RECORD_FIELDS) + "\n")
+        for index in range(rows):
+            stream.write(
+                f"{organ_name},2024-02-01,{index + 1},1.0,import\n"
+            )
+
+
+def entry(organ_name):
+    return {
+        "organ_name": organ_name,
+        "failure_date": "2024-02-02",
+        "uptime_since_last_failure": 10.0,
+        "repair_duration": 1.0,
+        "description": "formulaire",
+    }
+
+
+class WritingProgress(TaskProgress):
+    def __init__(self, organ_name):
+        super().__init__()
+        self.organ_name = organ_name
+        self.concurrent_writes = 0
+
+    def report(self, fraction, detail=None, partial=None):
+        writer = threading.Thread(
+            target=insert_failure_log, args=(entry(self.organ_name),)
+        )
+        writer.start()
+        writer.join(timeout=2)
+        if not writer.is_alive():
+            self.concurrent_writes += 1
+        super().report(fraction, detail, partial)
+
+
+def test_other_writers_get_in_between_import_batches(tmp_path):
+    organ_name = insert_organ("Organe import concurrent")
+    path = tmp_path / "logs.csv"
+    write_csv(path, organ_name, BATCHES * IMPORT_BATCH_SIZE)
+    progress = WritingProgress(organ_name)
+    report, delta, interruption = _failure_log_import_work(
+        str(path), "logs.csv"
+    )(progress)
+    assert interruption == ""
+    assert progress.concurrent_writes == BATCHES
+    assert delta[organ_name]["failure_count"] == report["accepted"]
+    stored = load_organ_aggregates(organ_name)[organ_name]
+    assert stored["failure_count"] == report["accepted"] + BATCHES
+
+
+def test_cancelled_import_reports_committed_batches(tmp_path):
+    organ_name = insert_organ("Organe import annulé")
+    path = tmp_path / "logs.csv"
+    write_csv(path, organ_name, BATCHES * IMPORT_BATCH_SIZE)
+    progress = TaskProgress()
+    progress.cancel()
+    report, delta, interruption = _failure_log_import_work(
+        str(path), "logs.csv"
+    )(progress)
+    assert interruption
+    assert delta[organ_name]["failure_count"] == IMPORT_BATCH_SIZE
+    stored = load_organ_aggregates(organ_name)[organ_name]
+    assert stored["failure_count"] == IMPORT_BATCH_SIZE
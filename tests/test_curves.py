@@ -0,0 +1,43 @@
+import numpy as np
+
+from tableau_de_bord_de_suivi_gpta.analytics.curves import (
+    lttb_indices,
+    reliability_curve_rows,
+)
+
+
+def test_lttb_keeps_endpoints_and_threshold_points():
+    x = np.linspace(0.0, 10.0, 500)
+    y = np.sin(x) + np.random.default_rng(0).normal(0, 0.1, 500)
+    indices = lttb_indices(x, y, 40)
+    assert len(indices) == 40
+    assert indices[0] == 0
+    assert indices[-1] == 499
+    assert np.all(np.diff(indices) > 0)
+
+
+def test_lttb_returns_every_point_below_threshold():
+    x = np.arange(10.0)
+    assert lttb_indices(x, x, 10).tolist() == list(range(10))
+    assert lttb_indices(x, x, 2).tolist() == list(range(10))
+
+
+def test_lttb_keeps_isolated_spike():
+    x = np.arange(1000.0)
+    y = np.zeros(1000)
+    y[613] = 1.0
+    assert 613 in lttb_indices(x, y, 20)
+
+
+def test_reliability_curves_start_at_one_and_decrease():
+    rows = reliability_curve_rows(
+        ["Moteur", "Groupe à vis"], [1.5, 0.9], [800.0, 3000.0], 5000.0
+    )
+    assert rows[0]["temps"] == 0.0
+    for key in ("Moteur", "Groupe à vis"):
+        values = [row[key] for row in rows]
+        assert values[0] == 1.0
+        assert all(a >= b for a, b in zip(values, values[1:]))
+    times = [row["temps"] for row in rows]
+    assert times == sorted(times)
+    assert times[-1] == 5000.0
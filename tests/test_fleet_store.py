@@ -0,0 +1,22 @@
+from tableau_de_bord_de_suivi_gpta.cache.metrics_cache import (
+    InProcessMetricsCache,
+)
+from tableau_de_bord_de_suivi_gpta.db.fleet_store import FleetStore
+from tableau_de_bord_de_suivi_gpta.db.repository import (
+    update_maintenance_costs,
+)
+
+
+def test_cost_change_reaches_other_workers():
+    editor = FleetStore(InProcessMetricsCache())
+    reader = FleetStore(InProcessMetricsCache())
+    editor.ensure_loaded()
+    version = reader.ensure_loaded()
+    costs = {"preventive_cost": 1234.0, "corrective_cost": 9876.0}
+    assert update_maintenance_costs("Moteur", costs)
+    digest = editor.record_maintenance_costs("Moteur", costs)
+    assert editor.maintenance_costs["Moteur"] == costs
+    assert reader.refresh() != version
+    assert reader.maintenance_costs["Moteur"] == costs
+    assert reader.costs_digest == digest
+    assert reader.version == editor.version
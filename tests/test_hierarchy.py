@@ -0,0 +1,114 @@
+import math
+
+import pytest
+
+from tableau_de_bord_de_suivi_gpta.analytics.hierarchy import (
+    FLEET_KEY,
+    LEVEL_COMPRESSOR,
+    LEVEL_LOCOMOTIVE,
+    FleetHierarchy,
+    node_key,
+)
+
+PLACEMENTS = [
+    ("L1", "C1", "C1 Moteur"),
+    ("L1", "C1", "C1 Groupe à vis"),
+    ("L1", "C2", "C2 Moteur"),
+    ("L2", "C3", "C3 Moteur"),
+]
+
+
+def aggregate(count, uptime, repair):
+    return {
+        "failure_count": count,
+        "total_uptime": uptime,
+        "total_repair_duration": repair,
+    }
+
+
+@pytest.fixture
+def hierarchy():
+    return FleetHierarchy.from_placements(
+        {
+            "locomotive_name": locomotive,
+            "compressor_name": compressor,
+            "organ_name": organ,
+            "organ_label": organ,
+        }
+        for locomotive, compressor, organ in PLACEMENTS
+    )
+
+
+def test_summary_combines_descendants_in_series(hierarchy):
+    aggregates = {
+        "C1 Moteur": aggregate(2, 1000.0, 10.0),
+        "C1 Groupe à vis": aggregate(4, 1000.0, 40.0),
+        "C2 Moteur": aggregate(1, 2000.0, 5.0),
+    }
+    summary = hierarchy.summary(
+        node_key(LEVEL_LOCOMOTIVE, "L1"),
+        hierarchy.rollup(aggregates),
+        aggregates,
+    )
+    rates = [2 / 1000.0, 4 / 1000.0, 1 / 2000.0]
+    repairs = [5.0, 10.0, 5.0]
+    assert summary["failure_count"] == 7
+    assert summary["mtbf"] == pytest.approx(1 / sum(rates))
+    assert summary["mttr"] == pytest.approx(
+        sum(rate * mttr for rate, mttr in zip(rates, repairs))
+        / sum(rates)
+    )
+    assert summary["availability"] == pytest.approx(
+        math.prod(
+            (1 / rate) / (1 / rate + mttr)
+            for rate, mttr in zip(rates, repairs)
+        )
+    )
+
+
+def test_incremental_updates_match_full_rollup(hierarchy):
+    aggregates = {"C1 Moteur": aggregate(2, 1000.0, 10.0)}
+    rollups = hierarchy.rollup(aggregates)
+    untouched = rollups[node_key(LEVEL_LOCOMOTIVE, "L1")]
+    delta = {
+        "C3 Moteur": aggregate(3, 900.0, 12.0),
+        "C1 Moteur": aggregate(1, 500.0, 2.0),
+    }
+    hierarchy.apply(rollups, aggregates, delta)
+    merged = {
+        "C1 Moteur": aggregate(3, 1500.0, 12.0),
+        "C3 Moteur": aggregate(3, 900.0, 12.0),
+    }
+    expected = hierarchy.rollup(merged)
+    assert rollups.keys() == expected.keys()
+    for key, rollup in expected.items():
+        assert rollups[key] == pytest.approx(rollup)
+    assert untouched == hierarchy.rollup(aggregates)[
+        node_key(LEVEL_LOCOMOTIVE, "L1")
+    ]
+
+
+def test_update_touches_only_the_ancestor_chain(hierarchy):
+    aggregates = {
+        "C1 Moteur": aggregate(2, 1000.0, 10.0),
+        "C3 Moteur": aggregate(1, 800.0, 4.0),
+    }
+    rollups = hierarchy.rollup(aggregates)
+    before = dict(rollups)
+    hierarchy.apply(
+        rollups, aggregates, {"C3 Moteur": aggregate(1, 200.0, 1.0)}
+    )
+    changed = {key for key in rollups if rollups[key] is not before[key]}
+    assert changed == {
+        FLEET_KEY,
+        node_key(LEVEL_LOCOMOTIVE, "L2"),
+        node_key(LEVEL_COMPRESSOR, "C3"),
+    }
+
+
+def test_ancestor_keys_does_not_modify_hierarchy(hierarchy):
+    nodes = dict(hierarchy.nodes)
+    assert hierarchy.ancestor_keys("Organe inconnu") == []
+    assert hierarchy.nodes == nodes
+    rollups = hierarchy.rollup({"Organe inconnu": aggregate(1, 10.0, 1.0)})
+    assert rollups == {}
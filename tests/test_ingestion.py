@@ -0,0 +1,54 @@
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from tableau_de_bord_de_suivi_gpta.api.ingestion import (
+    fleet_store,
+    router,
+)
+from tableau_de_bord_de_suivi_gpta.db.repository import insert_organ
+
+
+@pytest.fixture(scope="module")
+def client():
+    app = FastAPI()
+    app.include_router(router)
+    return TestClient(app)
+
+
+def record(organ_name):
+    return {
+        "organ_name": organ_name,
+        "failure_date": "2024-03-01",
+        "uptime_since_last_failure": 120.0,
+        "repair_duration": 2.0,
+        "description": "GMAO",
+    }
+
+
+def test_organ_added_by_another_worker_is_accepted(client):
+    fleet_store.ensure_loaded()
+    organ_name = insert_organ("Organe d'un autre worker")
+    assert organ_name not in fleet_store.organ_names
+    response = client.post(
+        "/ingest/failure_logs",
+        json=[record(organ_name), record("Organe inexistant")],
+    )
+    assert response.status_code == 200
+    body = response.json()
+    assert body["accepted"] == 1
+    assert body["rejected"] == 1
+    assert organ_name in fleet_store.organ_names
+
+
+def test_known_organs_do_not_trigger_refresh(monkeypatch):
+    lookup = fleet_store.organ_name_lookup()
+    refreshes = []
+    monkeypatch.setattr(
+        fleet_store, "refresh", lambda: refreshes.append(1)
+    )
+    assert "Moteur" in lookup
+    assert refreshes == []
+    assert "Organe inexistant" not in lookup
+    assert "Autre organe inexistant" not in lookup
+    assert refreshes == [1]
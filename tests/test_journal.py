@@ -0,0 +1,142 @@
+import os
+
+import pytest
+
+from tableau_de_bord_de_suivi_gpta.db.journal import (
+    FailureLogJournal,
+)
+
+
+def entry(organ_name, uptime):
+    return {
+        "organ_name": organ_name,
+        "failure_date": "2024-01-01",
+        "uptime_since_last_failure": uptime,
+        "repair_duration": 1.0,
+        "description": "",
+    }
+
+
+@pytest.fixture
+def path(tmp_path):
+    return str(tmp_path / "failure_logs.journal")
+
+
+def test_replay_merges_committed_records(path):
+    journal = FailureLogJournal(path)
+    journal.append_failure_logs([entry("Moteur", 100.0)])
+    txn = journal.begin()
+    journal.append_failure_logs([entry("Moteur", 300.0)], txn)
+    journal.commit(txn)
+    aggregates, count = FailureLogJournal(path).state()
+    assert count == 2
+    assert aggregates["Moteur"]["failure_count"] == 2
+    assert aggregates["Moteur"]["total_uptime"] == 400.0
+
+
+def test_torn_tail_is_truncated(path):
+    journal = FailureLogJournal(path)
+    journal.append_failure_logs([entry("Moteur", 100.0)])
+    intact_size = os.path.getsize(path)
+    journal.append_failure_logs([entry("Moteur", 200.0)])
+    os.truncate(path, os.path.getsize(path) - 3)
+    aggregates, count = FailureLogJournal(path).state()
+    assert count == 1
+    assert aggregates["Moteur"]["total_uptime"] == 100.0
+    assert os.path.getsize(path) == intact_size
+
+
+def test_corrupted_tail_is_truncated(path):
+    journal = FailureLogJournal(path)
+    journal.append_failure_logs([entry("Moteur", 100.0)])
+    intact_size = os.path.getsize(path)
+    journal.append_failure_logs([entry("Moteur", 200.0)])
+    with open(path, "r+b") as corrupted:
+        corrupted.seek(-2, os.SEEK_END)
+        corrupted.write(b"##")
+    _, count = FailureLogJournal(path).state()
+    assert count == 1
+    assert os.path.getsize(path) == intact_size
+    journal = FailureLogJournal(path)
+    journal.append_failure_logs([entry("Moteur", 50.0)])
+    assert FailureLogJournal(path).state()[1] == 2
+
+
+def test_uncommitted_and_aborted_transactions_are_ignored(path):
+    journal = FailureLogJournal(path)
+    aborted = journal.begin()
+    journal.append_failure_logs([entry("Moteur", 100.0)], aborted)
+    journal.abort(aborted)
+    journal.append_failure_logs(
+        [entry("Moteur", 200.0)], journal.begin()
+    )
+    aggregates, count = FailureLogJournal(path).state()
+    assert count == 0
+    assert aggregates == {}
+
+
+def test_snapshot_then_tail_matches_full_replay(path):
+    journal = FailureLogJournal(path)
+    for uptime in (100.0, 200.0, 300.0):
+        journal.append_failure_logs([entry("Moteur", uptime)])
+    journal.snapshot()
+    journal.append_failure_logs([entry("Groupe à vis", 50.0)])
+    from_snapshot = FailureLogJournal(path).state()
+    os.remove(journal.snapshot_path)
+    assert FailureLogJournal(path).state() == from_snapshot
+    assert from_snapshot[1] == 4
+
+
+def test_correction_appends_without_truncating(path):
+    journal = FailureLogJournal(path)
+    journal.append_failure_logs([entry("Moteur", 100.0)])
+    journal.append_failure_logs([entry("Moteur", 200.0)])
+    size = os.path.getsize(path)
+    corrected = {
+        "Moteur": {
+            "failure_count": 1,
+            "total_uptime": 100.0,
+            "total_repair_duration": 1.0,
+        }
+    }
+    journal.correct(corrected, 1)
+    assert os.path.getsize(path) > size
+    assert journal.state() == (corrected, 1)
+    assert FailureLogJournal(path).state() == (corrected, 1)
+    journal.append_failure_logs([entry("Moteur", 50.0)])
+    aggregates, count = FailureLogJournal(path).state()
+    assert count == 2
+    assert aggregates["Moteur"]["total_uptime"] == 150.0
+
+
+def test_orphaned_transaction_does_not_stop_snapshots(path):
+    journal = FailureLogJournal(path, snapshot_interval=10)
+    orphan = journal.begin()
+    journal.append_failure_logs([entry("Moteur", 999.0)], orphan)
+    for index in range(50):
+        journal.append_failure_logs([entry("Moteur", 1.0)])
+    assert os.path.exists(journal.snapshot_path)
+    aggregates, count = FailureLogJournal(path).state()
+    assert count == 50
+    assert aggregates["Moteur"]["total_uptime"] == 50.0
+
+
+def test_snapshot_keeps_open_transactions(path):
+    journal = FailureLogJournal(path, snapshot_interval=10)
+    txn = journal.begin()
+    journal.append_failure_logs([entry("Moteur", 100.0)], txn)
+    journal.snapshot()
+    journal.commit(txn)
+    assert FailureLogJournal(path).state()[1] == 1
+
+
+def test_orphaned_transactions_expire(path):
+    journal = FailureLogJournal(
+        path, snapshot_interval=10, orphaned_transaction_records=20
+    )
+    orphan = journal.begin()
+    journal.append_failure_logs([entry("Moteur", 999.0)], orphan)
+    for index in range(50):
+        journal.append_failure_logs([entry("Moteur", 1.0)])
+    journal.commit(orphan)
+    assert FailureLogJournal(path).state()[1] == 50
@@ -0,0 +1,111 @@
+import datetime
+
+import pytest
+
+from tableau_de_bord_de_suivi_gpta.db.repository import (
+    insert_failure_log_batch,
+    insert_organ,
+    load_failure_history_page,
+)
+
+ORGAN = "Organe de pagination"
+PAGE_SIZE = 4
+LOG_COUNT = 23
+
+
+@pytest.fixture(scope="module")
+def logs():
+    insert_organ(ORGAN)
+    logs = [
+        {
+            "organ_name": ORGAN,
+            "failure_date": (
+                datetime.date(2024, 1, 1)
+                + datetime.timedelta(days=index % 7)
+            ).isoformat(),
+            "uptime_since_last_failure": 100.0 + index,
+            "repair_duration": float(index % 5),
+            "description": str(index),
+        }
+        for index in range(LOG_COUNT)
+    ]
+    insert_failure_log_batch(logs)
+    return logs
+
+
+def expected_order(logs, sort_by, descending):
+    field = "failure_date" if sort_by == "date" else "repair_duration"
+    return [
+        log["description"]
+        for log in sorted(
+            logs,
+            key=lambda log: (log[field], int(log["description"])),
+            reverse=descending,
+        )
+    ]
+
+
+def descriptions(page):
+    return [entry["description"] for entry in page["entries"]]
+
+
+@pytest.mark.parametrize("sort_by", ["date", "duration"])
+@pytest.mark.parametrize("descending", [False, True])
+def test_keyset_pages_walk_forward_and_back(logs, sort_by, descending):
+    pages = [
+        load_failure_history_page(
+            ORGAN, sort_by, descending, PAGE_SIZE
+        )
+    ]
+    while pages[-1]["has_more"]:
+        pages.append(
+            load_failure_history_page(
+                ORGAN,
+                sort_by,
+                descending,
+                PAGE_SIZE,
+                after=pages[-1]["last_cursor"],
+            )
+        )
+    walked = [name for page in pages for name in descriptions(page)]
+    assert walked == expected_order(logs, sort_by, descending)
+    assert len(pages) == -(-LOG_COUNT // PAGE_SIZE)
+    for previous, page in zip(pages, pages[1:]):
+        back = load_failure_history_page(
+            ORGAN,
+            sort_by,
+            descending,
+            PAGE_SIZE,
+            before=page["first_cursor"],
+        )
+        assert descriptions(back) == descriptions(previous)
+        assert back["last_cursor"] == previous["last_cursor"]
+    first_back = load_failure_history_page(
+        ORGAN,
+        sort_by,
+        descending,
+        PAGE_SIZE,
+        before=pages[0]["first_cursor"],
+    )
+    assert first_back["entries"] == []
+    assert not first_back["has_more"]
+
+
+def test_keyset_pages_respect_date_window(logs):
+    start = datetime.date(2024, 1, 3)
+    end = datetime.date(2024, 1, 5)
+    page = load_failure_history_page(
+        ORGAN, page_size=LOG_COUNT, start=start, end=end
+    )
+    assert descriptions(page) == [
+        log["description"]
+        for log in sorted(
+            logs,
+            key=lambda log: (
+                log["failure_date"],
+                int(log["description"]),
+            ),
+        )
+        if start.isoformat() <= log["failure_date"] <= end.isoformat()
+    ]
+    assert not page["has_more"]
@@ -0,0 +1,172 @@
+import math
+
+import numpy as np
+import pytest
+
+from tableau_de_bord_de_suivi_gpta.analytics.constants import (
+    BLOCK_SERIES,
+)
+from tableau_de_bord_de_suivi_gpta.analytics.rbd import (
+    DiagramError,
+    ReliabilityDiagram,
+    block_organ_names,
+    block_up,
+    compressor_diagram,
+    k_out_of_n_block,
+    organ_block,
+    parallel_block,
+    series_block,
+)
+
+RATES = {"A": 1e-3, "B": 2e-3, "C": 5e-4}
+T = 300.0
+
+
+def reliability(name):
+    return math.exp(-RATES[name] * T)
+
+
+def importance(result):
+    return {row["name"]: row["birnbaum"] for row in result["importance"]}
+
+
+def test_series_reliability_mtbf_and_importance():
+    diagram = ReliabilityDiagram(
+        series_block("S", *(organ_block(name) for name in RATES))
+    )
+    result = diagram.evaluate(RATES, T)
+    assert result["reliability_at_t"] == pytest.approx(
+        math.prod(reliability(name) for name in RATES)
+    )
+    assert result["mtbf"] == pytest.approx(1 / sum(RATES.values()))
+    for name, birnbaum in importance(result).items():
+        assert birnbaum == pytest.approx(
+            math.prod(
+                reliability(other) for other in RATES if other != name
+            )
+        )
+
+
+def test_parallel_reliability_mtbf_and_importance():
+    diagram = ReliabilityDiagram(
+        parallel_block("P", organ_block("A"), organ_block("B"))
+    )
+    result = diagram.evaluate(RATES, T)
+    r_a, r_b = reliability("A"), reliability("B")
+    assert result["reliability_at_t"] == pytest.approx(
+        1 - (1 - r_a) * (1 - r_b)
+    )
+    assert result["mtbf"] == pytest.approx(
+        1 / 1e-3 + 1 / 2e-3 - 1 / 3e-3
+    )
+    assert importance(result) == pytest.approx(
+        {"A": 1 - r_b, "B": 1 - r_a}
+    )
+
+
+def test_two_out_of_three_reliability_and_importance():
+    diagram = ReliabilityDiagram(
+        k_out_of_n_block("K", 2, *(organ_block(name) for name in RATES))
+    )
+    result = diagram.evaluate(RATES, T)
+    r = {name: reliability(name) for name in RATES}
+    expected = (
+        r["A"] * r["B"] * r["C"]
+        + (1 - r["A"]) * r["B"] * r["C"]
+        + r["A"] * (1 - r["B"]) * r["C"]
+        + r["A"] * r["B"] * (1 - r["C"])
+    )
+    assert result["reliability_at_t"] == pytest.approx(expected)
+    for name, birnbaum in importance(result).items():
+        first, second = (r[other] for other in r if other != name)
+        assert birnbaum == pytest.approx(
+            first + second - 2 * first * second
+        )
+
+
+def test_birnbaum_matches_finite_difference():
+    root = series_block(
+        "S",
+        organ_block("A"),
+        parallel_block("P", organ_block("B"), organ_block("C")),
+    )
+    diagram = ReliabilityDiagram(root)
+    result = diagram.evaluate(RATES, T)
+    step = 1e-6
+    for name, birnbaum in importance(result).items():
+        r = {other: reliability(other) for other in RATES}
+
+        def system(value):
+            r[name] = value
+            return r["A"] * (1 - (1 - r["B"]) * (1 - r["C"]))
+
+        derivative = (
+            system(reliability(name) + step)
+            - system(reliability(name) - step)
+        ) / (2 * step)
+        assert birnbaum == pytest.approx(derivative, rel=1e-6)
+
+
+def test_unknown_organs_leave_dependent_figures_undefined():
+    root = series_block(
+        "S",
+        organ_block("A"),
+        parallel_block("P", organ_block("B"), organ_block("C")),
+    )
+    result = ReliabilityDiagram(root).evaluate(
+        {"A": RATES["A"], "B": RATES["B"]}, T
+    )
+    assert result["unknown_organs"] == ["C"]
+    assert result["reliability_at_t"] is None
+    assert result["mtbf"] is None
+    assert importance(result) == {
+        "A": None,
+        "B": None,
+        "C": pytest.approx(reliability("A") * (1 - reliability("B"))),
+    }
+    assert result["importance"][0]["name"] == "C"
+
+
+def test_organ_cannot_appear_twice():
+    with pytest.raises(DiagramError):
+        ReliabilityDiagram(
+            parallel_block("P", organ_block("A"), organ_block("A"))
+        )
+
+
+def test_compressor_diagram_follows_available_organs():
+    diagram = compressor_diagram(
+        "CP1",
+        {
+            "Moteur": "CP1 Moteur",
+            "Sécheur d'air": "CP1 Sécheur",
+            "Soupape by-pass": "CP1 Soupape",
+            "Filtre": "CP1 Filtre",
+        },
+    )
+    assert diagram["name"] == "CP1"
+    assert diagram["kind"] == BLOCK_SERIES
+    assert block_organ_names(diagram) == [
+        "CP1 Moteur",
+        "CP1 Sécheur",
+        "CP1 Soupape",
+        "CP1 Filtre",
+    ]
+    assert compressor_diagram("CP2", {}) is None
+
+
+def test_block_up_evaluates_structure_function():
+    root = series_block(
+        "S",
+        organ_block("A"),
+        k_out_of_n_block(
+            "K", 2, organ_block("B"), organ_block("C"), organ_block("D")
+        ),
+    )
+    states = np.array(
+        [[(row >> bit) & 1 for row in range(16)] for bit in range(4)],
+        dtype=bool,
+    )
+    up = dict(zip("ABCD", states))
+    expected = states[0] & (states[1:].sum(axis=0) >= 2)
+    assert block_up(root, up).tolist() == expected.tolist()
@@ -0,0 +1,96 @@
+import json
+import math
+
+import pytest
+
+from benchmarks.state_deltas import delta_size, run_event
+from tableau_de_bord_de_suivi_gpta.analytics.constants import (
+    STATUS_ALERT,
+    STATUS_OK,
+)
+from tableau_de_bord_de_suivi_gpta.states.gpta_state import (
+    GptaState,
+    fleet_store,
+)
+
+EMPTY_DELTA_SIZE = len(b"{}")
+ONE_ORGAN_PATCH_BYTES = 64
+ONE_ORGAN_DELTA_BYTES = 640
+
+
+@pytest.fixture
+def state():
+    state = GptaState(_reflex_internal_init=True)
+    run_event(state, "update_all_organ_metrics")
+    state.get_delta()
+    state._clean()
+    return state
+
+
+def state_delta(state):
+    delta = state.get_delta()
+    state._clean()
+    (values,) = delta.values()
+    return values, len(json.dumps(delta, default=str).encode("utf-8"))
+
+
+def most_reliable_organs(state):
+    reliabilities = sorted(
+        (
+            math.exp(
+                -aggregate["failure_count"]
+                / aggregate["total_uptime"]
+                * state.target_uptime_t
+            ),
+            name,
+        )
+        for name, aggregate in fleet_store.aggregates.items()
+        if aggregate["failure_count"] and aggregate["total_uptime"]
+    )
+    return reliabilities[-1], reliabilities[-2]
+
+
+def test_initial_load_sends_organ_list():
+    state = GptaState(_reflex_internal_init=True)
+    run_event(state, "update_all_organ_metrics")
+    values, _ = state_delta(state)
+    assert "organs" in values
+    assert state._changed_organ_count == len(state.organs)
+
+
+def test_recompute_without_change_sends_nothing(state):
+    run_event(state, "update_all_organ_metrics")
+    assert state._changed_organ_count == 0
+    assert delta_size(state) == EMPTY_DELTA_SIZE
+
+
+def test_selecting_organ_does_not_resend_statuses(state):
+    run_event(state, "set_selected_organ", "Moteur")
+    values, _ = state_delta(state)
+    assert "organs" not in values
+    assert "organ_status_patch" not in values
+
+
+def test_one_status_change_sends_one_entry(state):
+    (best, organ_name), (runner_up, _) = most_reliable_organs(state)
+    threshold = str((best + runner_up) / 2)
+    sizes = {}
+    run_event(state, "set_min_reliability_threshold", "1")
+    values, sizes["R min = 1"] = state_delta(state)
+    run_event(state, "set_min_reliability_threshold", threshold)
+    values, sizes[f"R min = {threshold}"] = state_delta(state)
+    assert state._changed_organ_count == 1
+    assert "organs" not in values
+    assert values["organ_status_patch"] == {organ_name: STATUS_OK}
+    assert (
+        len(json.dumps(values["organ_status_patch"]).encode("utf-8"))
+        <= ONE_ORGAN_PATCH_BYTES
+    )
+    run_event(state, "set_min_reliability_threshold", "1")
+    values, sizes["R min = 1 (retour)"] = state_delta(state)
+    assert state._changed_organ_count == 1
+    assert "organs" not in values
+    assert values["organ_status_patch"] == {}
+    statuses = {row["name"]: row["status"] for row in state.organs}
+    assert statuses[organ_name] == STATUS_ALERT
+    assert all(size <= ONE_ORGAN_DELTA_BYTES for size in sizes.values())
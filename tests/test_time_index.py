@@ -0,0 +1,67 @@
+import datetime
+
+from tableau_de_bord_de_suivi_gpta.analytics.aggregates import (
+    build_aggregate_index,
+)
+from tableau_de_bord_de_suivi_gpta.analytics.time_index import (
+    TimelineIndex,
+)
+from tableau_de_bord_de_suivi_gpta.db.repository import (
+    insert_failure_log_batch,
+    insert_organ,
+)
+from tableau_de_bord_de_suivi_gpta.states.gpta_state import (
+    fleet_store,
+)
+
+WINDOW = (datetime.date(2024, 1, 1), datetime.date(2024, 1, 31))
+
+
+def entry(organ_name, day, uptime):
+    return {
+        "organ_name": organ_name,
+        "failure_date": datetime.date(2024, 1, day).isoformat(),
+        "uptime_since_last_failure": uptime,
+        "repair_duration": 1.0,
+        "description": "",
+    }
+
+
+def test_extend_matches_full_load():
+    first = [entry("Moteur", day, 10.0 * day) for day in (3, 9, 20)]
+    later = [
+        entry("Moteur", 25, 7.0),
+        entry("Moteur", 1, 5.0),
+        entry("Moteur", 9, 2.0),
+        entry("Groupe à vis", 4, 8.0),
+    ]
+    incremental = TimelineIndex()
+    incremental.load([first])
+    incremental.extend(later)
+    full = TimelineIndex()
+    full.load([first + later])
+    for start in range(1, 28, 4):
+        for end in range(start, 31, 5):
+            assert incremental.window_index(
+                datetime.date(2024, 1, start),
+                datetime.date(2024, 1, end),
+            ) == full.window_index(
+                datetime.date(2024, 1, start),
+                datetime.date(2024, 1, end),
+            )
+
+
+def test_imported_batch_extends_loaded_timelines():
+    organ_name = insert_organ("Organe d'ingestion")
+    fleet_store.refresh()
+    before = fleet_store.window_aggregates(WINDOW)
+    timelines = fleet_store.timelines.timelines
+    batch = [entry(organ_name, day, 100.0) for day in (2, 15, 30)]
+    insert_failure_log_batch(batch)
+    fleet_store.record_import(build_aggregate_index(batch), batch)
+    assert fleet_store.timelines.loaded
+    assert fleet_store.timelines.timelines is timelines
+    after = fleet_store.window_aggregates(WINDOW)
+    assert organ_name not in before
+    assert after[organ_name]["failure_count"] == 3
+    assert after[organ_name]["total_uptime"] == 300.0
@@ -0,0 +1,46 @@
+import pytest
+
+from tableau_de_bord_de_suivi_gpta.ingestion.validation import (
+    FailureRecordError,
+    parse_failure_record,
+)
+
+KNOWN_ORGANS = {"Moteur"}
+
+
+def record(**fields):
+    return {
+        "organ_name": "Moteur",
+        "failure_date": "2023-01-15",
+        "uptime_since_last_failure": "120,5",
+        "repair_duration": "2",
+        "description": "Surchauffe",
+        **fields,
+    }
+
+
+@pytest.mark.parametrize(
+    "failure_date", ["2023-01-15", "20230115", "2023-W02-7"]
+)
+def test_failure_dates_are_stored_in_iso_format(failure_date):
+    entry = parse_failure_record(
+        record(failure_date=failure_date), KNOWN_ORGANS
+    )
+    assert entry["failure_date"] == "2023-01-15"
+    assert entry["uptime_since_last_failure"] == 120.5
+
+
+@pytest.mark.parametrize(
+    "fields",
+    [
+        {"failure_date": "15/01/2023"},
+        {"uptime_since_last_failure": "nan"},
+        {"repair_duration": "inf"},
+        {"repair_duration": "-1"},
+        {"organ_name": "Organe inconnu"},
+        {"description": " "},
+    ],
+)
+def test_invalid_records_are_rejected(fields):
+    with pytest.raises(FailureRecordError):
+        parse_failure_record(record(**fields), KNOWN_ORGANS)
@@ -0,0 +1,97 @@
+import numpy as np
+import pytest
+
+from tableau_de_bord_de_suivi_gpta.analytics.constants import (
+    MIN_WEIBULL_SAMPLES,
+)
+from tableau_de_bord_de_suivi_gpta.analytics.weibull import (
+    WeibullFitCache,
+    fit_weibull,
+    fit_weibull_groups,
+)
+
+
+def weibull_samples(shape, scale, size, seed):
+    return scale * np.random.default_rng(seed).weibull(shape, size)
+
+
+def test_mle_recovers_parameters_of_large_sample():
+    fit = fit_weibull(weibull_samples(1.8, 1000.0, 20_000, 7))
+    assert fit["shape"] == pytest.approx(1.8, rel=0.03)
+    assert fit["scale"] == pytest.approx(1000.0, rel=0.03)
+    assert fit["sample_count"] == 20_000
+
+
+def test_mle_solves_likelihood_equations():
+    samples = np.array([120.0, 340.0, 410.0, 780.0, 905.0, 1500.0])
+    fit = fit_weibull(samples)
+    shape, scale = fit["shape"], fit["scale"]
+    log_x = np.log(samples)
+    weights = samples**shape
+    assert np.sum(weights * log_x) / np.sum(
+        weights
+    ) - 1 / shape - log_x.mean() == pytest.approx(0.0, abs=1e-8)
+    assert scale == pytest.approx(np.mean(weights) ** (1 / shape))
+
+
+def test_grouped_fits_match_individual_fits():
+    groups = [
+        weibull_samples(0.8, 300.0, 40, 1),
+        weibull_samples(2.5, 2000.0, 15, 2),
+        weibull_samples(1.2, 50.0, 200, 3),
+    ]
+    codes = np.concatenate(
+        [np.full(len(group), code) for code, group in enumerate(groups)]
+    )
+    order = np.random.default_rng(0).permutation(len(codes))
+    shape, scale, counts = fit_weibull_groups(
+        codes[order], np.concatenate(groups)[order], len(groups)
+    )
+    for code, group in enumerate(groups):
+        fit = fit_weibull(group)
+        assert shape[code] == pytest.approx(fit["shape"], rel=1e-8)
+        assert scale[code] == pytest.approx(fit["scale"], rel=1e-8)
+        assert counts[code] == len(group)
+
+
+def test_too_few_or_identical_samples_are_not_fitted():
+    samples = weibull_samples(1.5, 100.0, MIN_WEIBULL_SAMPLES, 4)
+    assert fit_weibull(samples[:-1]) is None
+    assert fit_weibull(samples) is not None
+    assert fit_weibull([250.0] * 20) is None
+
+
+def test_fit_cache_refits_only_changed_organs():
+    samples = {
+        "Moteur": weibull_samples(1.5, 800.0, 10, 5).tolist(),
+        "Groupe à vis": weibull_samples(2.0, 400.0, 10, 6).tolist(),
+    }
+    requested = []
+
+    def load_samples(names, window):
+        requested.append(sorted(names))
+        rows = [
+            (name, value) for name in names for value in samples[name]
+        ]
+        return [name for name, _ in rows], [value for _, value in rows]
+
+    def aggregates():
+        return {
+            name: {
+                "failure_count": len(values),
+                "total_uptime": sum(values),
+                "total_repair_duration": 0.0,
+            }
+            for name, values in samples.items()
+        }
+
+    cache = WeibullFitCache()
+    names = sorted(samples)
+    first = cache.fits(names, aggregates(), None, load_samples)
+    assert cache.fits(names, aggregates(), None, load_samples) == first
+    assert requested == [names]
+    samples["Moteur"].append(5000.0)
+    second = cache.fits(names, aggregates(), None, load_samples)
+    assert requested[-1] == ["Moteur"]
+    assert second["Groupe à vis"] == first["Groupe à vis"]
+    assert second["Moteur"]["sample_count"] == 11